@@ -1,13 +1,241 @@
 """Automaton implementation."""
+from bisect import bisect_right
+from collections import deque
 from typing import (
+    Deque,
+    FrozenSet,
+    Iterable,
     Optional,
     Set,
     List,
     Dict,
     Tuple,
+    Union,
 )
 
 
+class SymbolRanges():
+    """
+    Set of symbols given as sorted, disjoint ranges of code points. It's
+    used as the symbol of a transition that consumes any of them.
+
+    Args:
+        ranges: Pairs ``(first, last)`` of code points, both included.
+            Overlapping and adjacent ranges are merged.
+
+    """
+
+    ranges: Tuple[Tuple[int, int], ...]
+
+    # Caracteres que hay que escapar dentro de los corchetes
+    _SPECIAL = "[]\\-"
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]]) -> None:
+        merged: List[List[int]] = list()
+
+        for first, last in sorted(ranges):
+            if first > last:
+                raise ValueError(f"Invalid range of symbols: {first}-{last}")
+
+            if merged and first <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], last)
+            else:
+                merged.append([first, last])
+
+        self.ranges = tuple((first, last) for first, last in merged)
+        self._firsts = [first for first, _ in self.ranges]
+
+    @classmethod
+    def parse(cls, text: str) -> 'SymbolRanges':
+        """
+        Read the ranges from a symbol class between brackets, like ``[a-zA-Z_]``.
+
+        Inside the brackets ``\\`` escapes the next character, and
+        ``\\uXXXX`` or ``\\UXXXXXXXX`` give a code point in hexadecimal.
+
+        Args:
+            text: Symbol class, brackets included.
+
+        Returns:
+            The ranges of the class.
+
+        """
+        if len(text) < 3 or text[0] != "[" or text[-1] != "]":
+            raise ValueError(f"Invalid symbol class: {text}")
+
+        # Primero leemos los caracteres, marcando los guiones sin escapar
+        codes: List[Optional[int]] = list()
+        i = 1
+        while i < len(text) - 1:
+            c = text[i]
+            if c == "\\" and i + 1 < len(text) - 1:
+                c = text[i + 1]
+                digits = {"u": 4, "U": 8}.get(c, 0)
+                if digits:
+                    codes.append(int(text[i + 2:i + 2 + digits], 16))
+                else:
+                    codes.append(ord(c))
+                i += 2 + digits
+            else:
+                codes.append(None if c == "-" else ord(c))
+                i += 1
+
+        ranges: List[Tuple[int, int]] = list()
+        i = 0
+        while i < len(codes):
+            first = codes[i]
+            # Un guion al principio o al final es un símbolo más
+            if first is None:
+                first = ord("-")
+            if i + 2 < len(codes) and codes[i + 1] is None and codes[i + 2] is not None:
+                ranges.append((first, codes[i + 2]))
+                i += 3
+            else:
+                ranges.append((first, first))
+                i += 1
+
+        return cls(ranges)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+
+        return self.ranges == other.ranges
+
+    def __lt__(self, other: 'SymbolRanges') -> bool:
+        return self.ranges < other.ranges
+
+    def __hash__(self) -> int:
+        return hash(self.ranges)
+
+    def __len__(self) -> int:
+        return sum(last - first + 1 for first, last in self.ranges)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.ranges!r})"
+
+    def __str__(self) -> str:
+        def escape(code: int) -> str:
+            c = chr(code)
+            if c in self._SPECIAL:
+                return "\\" + c
+            if c.isspace() or not c.isprintable():
+                return "\\u%04x" % code if code <= 0xFFFF else "\\U%08x" % code
+            return c
+
+        parts: List[str] = list()
+        for first, last in self.ranges:
+            parts.append(escape(first))
+            if last == first + 1:
+                parts.append(escape(last))
+            elif last > first:
+                parts.append("-" + escape(last))
+
+        return "[" + "".join(parts) + "]"
+
+    def contains_code(self, code: int) -> bool:
+        """Check (with a binary search) if a code point is in the ranges."""
+        i = bisect_right(self._firsts, code) - 1
+        return i >= 0 and code <= self.ranges[i][1]
+
+    def __contains__(self, symbol: object) -> bool:
+        return (
+            isinstance(symbol, str)
+            and len(symbol) == 1
+            and self.contains_code(ord(symbol))
+        )
+
+
+# Un símbolo es un carácter o un conjunto de rangos de caracteres
+Symbol = Union[str, SymbolRanges]
+
+
+def _symbol_ranges(symbol: Symbol) -> Tuple[Tuple[int, int], ...]:
+    if isinstance(symbol, SymbolRanges):
+        return symbol.ranges
+    return ((ord(symbol), ord(symbol)),)
+
+
+def symbol_matches(label: Optional[Symbol], symbol: Symbol) -> bool:
+    """
+    Check if the symbol of a transition accepts a symbol. The symbol can be
+    a character or one of the elementary ranges of the automaton alphabet
+    (which are inside or outside every label).
+    """
+    if label == symbol:
+        return True
+    if label is None or (label.__class__ is str and symbol.__class__ is str):
+        return False
+
+    code = ord(symbol) if isinstance(symbol, str) else symbol.ranges[0][0]
+    if isinstance(label, str):
+        return len(label) == 1 and ord(label) == code
+    return label.contains_code(code)
+
+
+def symbol_atoms(labels: Iterable[Symbol]) -> List[SymbolRanges]:
+    """
+    Split the symbols of some labels in elementary ranges: every label
+    contains each range completely or not at all.
+
+    Returns:
+        Sorted list of the elementary ranges, each one a single range.
+    """
+    # Barrido de los extremos: +1 al empezar un rango y -1 al acabar
+    events: Dict[int, int] = dict()
+    for label in labels:
+        for first, last in _symbol_ranges(label):
+            events[first] = events.get(first, 0) + 1
+            events[last + 1] = events.get(last + 1, 0) - 1
+
+    atoms: List[SymbolRanges] = list()
+    points = sorted(events)
+    depth = 0
+    for point, next_point in zip(points, points[1:]):
+        depth += events[point]
+        if depth > 0:
+            atoms.append(SymbolRanges([(point, next_point - 1)]))
+
+    return atoms
+
+
+def _joint_alphabet(automata: Iterable['FiniteAutomaton']) -> List[str]:
+    """
+    Returns one character for each symbol of the joint alphabet of some
+    automata: the symbols themselves, or the first character of every
+    elementary range if there are ranges (the rest behave the same).
+    """
+    labels: Set[Symbol] = {
+        t.symbol
+        for automaton in automata
+        for state in automaton.states
+        for t in state.transitions
+        if t.symbol is not None
+    }
+
+    if any(isinstance(label, SymbolRanges) for label in labels):
+        return [chr(atom.ranges[0][0]) for atom in symbol_atoms(labels)]
+    return sorted(labels)
+
+
+def _merge_range_transitions(transitions: List['Transition']) -> List['Transition']:
+    """
+    Join the transitions labelled with ranges that go to the same state in
+    a single transition. Other transitions are returned unchanged.
+    """
+    merged: Dict[str, List[Tuple[int, int]]] = dict()
+    result: List[Transition] = list()
+
+    for t in transitions:
+        if isinstance(t.symbol, SymbolRanges):
+            merged.setdefault(t.state, []).extend(t.symbol.ranges)
+        else:
+            result.append(t)
+
+    result.extend(Transition(SymbolRanges(ranges), state) for state, ranges in merged.items())
+    return result
+
+
 class State():
     """
     Definition of an automaton state. 
@@ -76,12 +304,12 @@ class State():
         selected = list()
 
         for t in self.transitions:
-            if t.symbol == symbol:
+            if symbol_matches(t.symbol, symbol):
                 selected.append(t)
 
         return selected
 
-    def _could_be_deterministic(self, dictionary: Set[str]) -> bool:
+    def _could_be_deterministic(self, dictionary: Set[Symbol]) -> bool:
         """
         Determines if the current state is deterministic according to the following criteria
 
@@ -89,6 +317,12 @@ class State():
             2. There are transitions for all symbols
             3. There is only one transition for each symbol.
         """
+        if any(isinstance(symbol, SymbolRanges) for symbol in dictionary):
+            # Con rangos el diccionario son los rangos elementales
+            if any(t.is_lambda() for t in self.transitions):
+                return False
+            return all(len(self.search_transitions(symbol)) == 1 for symbol in dictionary)
+
         symbol_subset: Set[str] = set()
 
         for t in self.transitions:
@@ -114,18 +348,18 @@ class Transition():
     'belong' to a given state, the initial state is not specified. 
 
     Args:
-        symbol: Symbol consumed in the transition.
-            ``None`` for a lambda transition.
+        symbol: Symbol consumed in the transition, or ranges of symbols
+            (any of them is consumed). ``None`` for a lambda transition.
         state: Name of the final state of the transition.
 
     """
 
-    symbol: Optional[str]
+    symbol: Optional[Symbol]
     state: str
 
     def __init__(
         self,
-        symbol: Optional[str],
+        symbol: Optional[Symbol],
         state: str,
     ) -> None:
         self.symbol = symbol
@@ -134,6 +368,10 @@ class Transition():
     def is_lambda(self) -> bool:
         return self.symbol == None
 
+    def matches(self, symbol: Symbol) -> bool:
+        """Check if the transition consumes the symbol."""
+        return symbol_matches(self.symbol, symbol)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             return NotImplemented
@@ -165,14 +403,24 @@ class FiniteAutomaton():
 
     states: List[State]
     name2state: Dict[str, State]
-    # New variable for storing the dictionary of the automaton
-    _dictionary = Set[str]
+    # New variable for storing the dictionary of the automaton. If there are
+    # transitions with ranges, it has the elementary ranges instead of symbols
+    _dictionary = Set[Symbol]
+    # New variable for the sorted elementary ranges (empty without ranges)
+    _atoms: List[SymbolRanges]
     # New variable for keeping the count of generated deterministic states
     _deterministic_count: int
     # New variable for caching the result of index processed transitions
-    _cached_class_indexes: Dict[str, int]
+    _cached_class_indexes: Dict[Tuple[int, Symbol], int]
+    # New variable for mapping state names to their index in states
+    _state_indexes: Dict[str, int]
     # New variable for indicating if current automaton is deterministic
     _is_deterministic: bool
+    # New variable for caching the lambda closure of every state (by name).
+    # It's computed on demand, so states shouldn't change after evaluating
+    _lambda_closures: Optional[Dict[str, FrozenSet[State]]]
+    # New variable for caching the symbol equivalence classes (computed on demand)
+    _symbol_classes: Optional[List[List[Symbol]]]
 
     def __init__(
         self,
@@ -196,7 +444,10 @@ class FiniteAutomaton():
         self.states = states
         self._get_dictionary()
         self._cached_class_indexes = dict()
+        self._state_indexes = {s.name: i for i, s in enumerate(states)}
         self.name2state = {s.name: s for s in self.states}
+        self._lambda_closures = None
+        self._symbol_classes = None
 
         # Por defecto
         self._is_deterministic = False
@@ -225,6 +476,161 @@ class FiniteAutomaton():
                 if t.symbol != None:
                     self._dictionary.add(t.symbol)
 
+        # Con rangos, los símbolos pasan a ser los rangos elementales
+        if any(isinstance(symbol, SymbolRanges) for symbol in self._dictionary):
+            self._atoms = symbol_atoms(self._dictionary)
+            self._dictionary = set(self._atoms)
+        else:
+            self._atoms = list()
+        self._atom_firsts = [atom.ranges[0][0] for atom in self._atoms]
+
+    def get_symbol_atom(self, symbol: str) -> Optional[Symbol]:
+        """
+        Returns the symbol of the dictionary that contains a character:
+        the character itself, or its elementary range if there are
+        transitions with ranges (found with a binary search).
+
+        Returns:
+            The symbol, or ``None`` if the character isn't in the alphabet.
+        """
+        if not self._atoms:
+            return symbol if symbol in self._dictionary else None
+
+        if len(symbol) != 1:
+            return None
+
+        code = ord(symbol)
+        i = bisect_right(self._atom_firsts, code) - 1
+        if i >= 0 and code <= self._atoms[i].ranges[0][1]:
+            return self._atoms[i]
+        return None
+
+    def _atoms_of(self, label: Symbol) -> List[Symbol]:
+        """Returns the symbols of the dictionary consumed by a transition label."""
+        if not self._atoms:
+            return [label]
+
+        atoms: List[Symbol] = list()
+        for first, last in _symbol_ranges(label):
+            i = max(bisect_right(self._atom_firsts, first) - 1, 0)
+            while i < len(self._atoms) and self._atom_firsts[i] <= last:
+                atoms.append(self._atoms[i])
+                i += 1
+
+        return atoms
+
+    def get_lambda_closures(self) -> Dict[str, FrozenSet[State]]:
+        """
+        Returns the lambda closure of every state, indexed by state name.
+        It's computed only once and stored in the automaton.
+
+        Returns:
+            Dictionary with the set of states reachable from each state
+            using only lambda transitions (the state included).
+        """
+        if self._lambda_closures is None:
+            self._lambda_closures = self._compute_lambda_closures()
+
+        return self._lambda_closures
+
+    def _compute_lambda_closures(self) -> Dict[str, FrozenSet[State]]:
+        """
+        Computes the lambda closures condensing the strongly connected
+        components of the lambda transitions (iterative Tarjan). All the states
+        of a component share the same closure, and the components are found
+        after the ones they reach, so each closure is the union of the component
+        and the already computed closures of its successors.
+        """
+        successors: Dict[str, List[State]] = {
+            s.name: [self.name2state[t.state] for t in s.transitions if t.symbol is None]
+            for s in self.states
+        }
+        index: Dict[str, int] = dict()
+        lowlink: Dict[str, int] = dict()
+        stack: List[State] = list()
+        on_stack: Set[str] = set()
+        closures: Dict[str, FrozenSet[State]] = dict()
+
+        def visit(state: State) -> None:
+            index[state.name] = lowlink[state.name] = len(index)
+            stack.append(state)
+            on_stack.add(state.name)
+
+        for root in self.states:
+            if root.name in index:
+                continue
+
+            visit(root)
+            calls = [(root, iter(successors[root.name]))]
+
+            while calls:
+                state, children = calls[-1]
+
+                for child in children:
+                    if child.name not in index:
+                        # Bajamos un nivel (equivalente a la llamada recursiva)
+                        visit(child)
+                        calls.append((child, iter(successors[child.name])))
+                        break
+                    elif child.name in on_stack:
+                        lowlink[state.name] = min(lowlink[state.name], index[child.name])
+                else:
+                    calls.pop()
+                    if calls:
+                        parent = calls[-1][0]
+                        lowlink[parent.name] = min(lowlink[parent.name], lowlink[state.name])
+
+                    if lowlink[state.name] == index[state.name]:
+                        # El estado es la raíz de una componente: la sacamos de la pila
+                        component: List[State] = list()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member.name)
+                            component.append(member)
+                            if member.name == state.name:
+                                break
+
+                        closure: Set[State] = set(component)
+                        for member in component:
+                            for child in successors[member.name]:
+                                if child not in closure:
+                                    closure.update(closures[child.name])
+
+                        frozen_closure = frozenset(closure)
+                        for member in component:
+                            closures[member.name] = frozen_closure
+
+        return closures
+
+    def get_symbol_classes(self) -> List[List[Symbol]]:
+        """
+        Returns the symbols of the dictionary grouped in equivalence classes:
+        symbols that lead to the same states from every state, so algorithms
+        only need to process one symbol (the first one) of each class.
+        It's computed only once and stored in the automaton.
+
+        Returns:
+            List of classes, each one a sorted list of symbols.
+        """
+        if self._symbol_classes is None:
+            # La firma de un símbolo son todas sus transiciones (origen, destino)
+            signatures: Dict[Symbol, Set[Tuple[str, str]]] = {
+                symbol: set() for symbol in self._dictionary
+            }
+            for state in self.states:
+                for t in state.transitions:
+                    if t.symbol is not None:
+                        for symbol in self._atoms_of(t.symbol):
+                            signatures[symbol].add((state.name, t.state))
+
+            classes: Dict[FrozenSet[Tuple[str, str]], List[Symbol]] = dict()
+            for symbol in sorted(self._dictionary):
+                classes.setdefault(frozenset(signatures[symbol]), []).append(symbol)
+
+            self._symbol_classes = list(classes.values())
+
+        return self._symbol_classes
+
     def _check_deterministic(self) -> bool:
         """
         Checks if the current automaton is deterministic
@@ -238,53 +644,83 @@ class FiniteAutomaton():
         
         return True
 
-    def _get_deterministic_state(self, det_states: List[Tuple], evaluator) -> str:
+    def _get_deterministic_state(
+        self,
+        det_states: Dict[FrozenSet[State], State],
+        pending: List[FrozenSet[State]],
+        subset: FrozenSet[State],
+        evaluator,
+    ) -> str:
         """
-        This method searches for deterministic state in the provided table
-        that matches the current set of states in the evaluator (it's an instance of FiniteAutomatonEvaluator)
+        This method searches for the deterministic state that matches the
+        provided set of states. The table is a dictionary keyed by the set,
+        so the search doesn't depend on the number of deterministic states.
+        New states are also appended to the list of pending subsets.
 
-        Note: The evaluator isn't typed because of the circular import problem
+        Note: The evaluator (an instance of FiniteAutomatonEvaluator) isn't typed
+        because of the circular import problem
         """
-        # Buscamos si ya existe primero el estado
-        found = False
-        i = 0
+        state = det_states.get(subset)
 
-        while i < len(det_states) and found == False:
-            if det_states[i][0] == evaluator.current_states:
-                found = True
-            else:
-                i += 1
-
-        if found == False:
+        if state is None:
 
-            if len(evaluator.current_states) == 0:
+            if len(subset) == 0:
                 state = State("empty", False)
-                det_states.append((set(), state))
-                return "empty"
-
-            # En este caso nos toca crear al nuevo estado
-            self._deterministic_count += 1
-            state = State("q" + str(self._deterministic_count),
-                          evaluator.is_accepting())
+            else:
+                # En este caso nos toca crear al nuevo estado
+                self._deterministic_count += 1
+                evaluator.current_states = subset
+                state = State("q" + str(self._deterministic_count),
+                              evaluator.is_accepting())
 
             # Añade el conjunto y al estado correspondiente al conjunto
-            det_states.append((evaluator.current_states.copy(), state))
-
-            # Devolvemos el nombre para las transiciones
-            return state.name
+            det_states[subset] = state
+            pending.append(subset)
 
         # Devolvemos el nombre para las transiciones
-        return det_states[i][1].name
+        return state.name
 
-    def to_deterministic(self) -> 'FiniteAutomaton':
-        from automata.automaton_evaluator import FiniteAutomatonEvaluator
+    def _move_state(
+        self,
+        moves: Dict[Tuple[State, Symbol], FrozenSet[State]],
+        state: State,
+        symbol: Symbol,
+        evaluator,
+    ) -> FrozenSet[State]:
+        """
+        Returns the states reached from one state consuming a symbol
+        (lambdas included), memoized by (state, symbol) since the same
+        state appears in many subsets.
+        """
+        reached = moves.get((state, symbol))
+
+        if reached is None:
+            evaluator.current_states = {state}
+            evaluator.process_symbol(symbol)
+            reached = frozenset(evaluator.current_states)
+            moves[(state, symbol)] = reached
+
+        return reached
+
+    def to_deterministic(self, reduce: bool = False) -> 'FiniteAutomaton':
         """
         Return a equivalent deterministic automaton.
 
+        Args:
+            reduce: Whether to reduce the automaton first: the lambdas are
+                removed (see ``remove_lambdas``) and then backward bisimilar
+                states are merged (see ``reduce_bisimulation``). Those states
+                are reached by the same strings, so they are always in the
+                same subsets, and merging them makes every subset smaller.
+
         Returns:
             Equivalent deterministic automaton.
 
         """
+        from automata.automaton_evaluator import FiniteAutomatonEvaluator
+
+        if reduce:
+            return self.remove_lambdas().reduce_bisimulation("backward").to_deterministic()
         # ---------------------------------------------------------------------
         """
         El evaluador nos ayudará a ver las transiciones que se generan.
@@ -294,34 +730,41 @@ class FiniteAutomaton():
         self._deterministic_count = 0
         evaluator = FiniteAutomatonEvaluator(self)
 
-        # Esta tabla contiene : [conjunto de estados, estado determinista correspondiente]
-        det_states: List[Tuple] = list()
+        # Esta tabla contiene : conjunto de estados -> estado determinista correspondiente
+        det_states: Dict[FrozenSet[State], State] = dict()
+        # Conjuntos por orden de creación (los que quedan por procesar empiezan en i)
+        pending: List[FrozenSet[State]] = list()
+        # Caché de (estado, símbolo) -> conjunto alcanzado
+        moves: Dict[Tuple[State, Symbol], FrozenSet[State]] = dict()
 
         # Lanzamos el procesado del conjunto inicial de estados
-        self._get_deterministic_state(det_states, evaluator)
+        self._get_deterministic_state(
+            det_states, pending, frozenset(evaluator.current_states), evaluator)
 
         # Ahora debemos ver a donde vamos con cada conjunto y símbolo posible
         i = 0
-        while i < len(det_states):
+        while i < len(pending):
+            current_set = pending[i]
+            transitions: List[Transition] = list()
 
-            for symbol in self._dictionary:
-                current_set = det_states[i][0].copy()
+            # Basta con procesar un símbolo de cada clase de equivalencia
+            for symbol_class in self.get_symbol_classes():
+                reached: Set[State] = set()
+                for state in current_set:
+                    reached.update(self._move_state(moves, state, symbol_class[0], evaluator))
 
-                evaluator.current_states = current_set
-                evaluator.process_symbol(symbol)
+                target = self._get_deterministic_state(
+                    det_states, pending, frozenset(reached), evaluator)
+                transitions.extend(Transition(symbol, target) for symbol in symbol_class)
 
-                # Añadimos la transición al estado en cuestión
-                det_states[i][1].add_transitions(
-                    [Transition(symbol, self._get_deterministic_state(det_states, evaluator))])
+            # Añadimos las transiciones al estado en cuestión de una vez
+            det_states[current_set].add_transitions(_merge_range_transitions(transitions))
 
             # Vamos a por el siguiente estado
             i = i+1
 
-        final_states = []
-
-        # Agrupamos el resultado del cálculo
-        for d in det_states:
-            final_states.append(d[1])
+        # Agrupamos el resultado del cálculo (en orden de creación)
+        final_states = list(det_states.values())
 
         # Creamos el estado y anotamos el hecho que ya es determinista
         result = FiniteAutomaton(final_states)
@@ -335,39 +778,46 @@ class FiniteAutomaton():
         Eliminates all the inaccesible states from the automaton
         via BFS with graph search (elimination of repeated states)
         """
-        to_visit: List[State] = list()
+        to_visit: Deque[State] = deque()
         to_visit.append(self.states[0])
         visited: List[State] = list()
+        # Conjunto auxiliar para comprobar la pertenencia en O(1)
+        seen: Set[str] = set()
 
         while len(to_visit) != 0:
-            state = to_visit.pop(0)
+            state = to_visit.popleft()
 
-            if state not in visited:
+            if state.name not in seen:
                 for t in state.transitions:
                     next_state = self.name2state[t.state]
                     to_visit.append(next_state)
 
+                seen.add(state.name)
                 visited.append(state)
 
         self.states = visited
 
-    def _get_index_of_det_transition(self, symbol: str, pos: int) -> int:
+        # Los índices de los estados han podido cambiar
+        self._state_indexes = {s.name: i for i, s in enumerate(self.states)}
+        self._cached_class_indexes = dict()
+
+    def _get_index_of_det_transition(self, symbol: Symbol, pos: int) -> int:
         # Comprobamos si el resultado lo tenemos ya en la caché
-        destination = self._cached_class_indexes.get("%d%s" % (pos, symbol))
+        destination = self._cached_class_indexes.get((pos, symbol))
 
         if destination is None:
             state: State = self.states[pos]
             selected: Transition = None
 
             for t in state.transitions:
-                if t.symbol == symbol:
+                if t.matches(symbol):
                     selected = t
 
             # Obtenemos el índice
-            destination = self.states.index(self.name2state[selected.state])
+            destination = self._state_indexes[selected.state]
 
             # Lo metemos en la caché para futuras consultas
-            self._cached_class_indexes["%d%s" % (pos, symbol)] = destination
+            self._cached_class_indexes[(pos, symbol)] = destination
 
         return destination
 
@@ -380,9 +830,9 @@ class FiniteAutomaton():
         if classes[pos2] != classes[pos1]:
             return False
 
-        for symbol in self._dictionary:
-            final1 = classes[self._get_index_of_det_transition(symbol, pos1)]
-            final2 = classes[self._get_index_of_det_transition(symbol, pos2)]
+        for symbol_class in self.get_symbol_classes():
+            final1 = classes[self._get_index_of_det_transition(symbol_class[0], pos1)]
+            final2 = classes[self._get_index_of_det_transition(symbol_class[0], pos2)]
 
             # Si las clases no coinciden al transitar -> No son equivalentes
             if final1 != final2:
@@ -393,26 +843,31 @@ class FiniteAutomaton():
     def _get_transitions_from_index(self, class_list: List[int], pos: int) -> List[Transition]:
         transitions: List[Transition] = list()
 
-        for symbol in self._dictionary:
-            transitions.append(Transition(symbol, "q{}".format(
-                class_list[self._get_index_of_det_transition(symbol, pos)])))
+        for symbol_class in self.get_symbol_classes():
+            target = "q{}".format(
+                class_list[self._get_index_of_det_transition(symbol_class[0], pos)])
+            transitions.extend(Transition(symbol, target) for symbol in symbol_class)
 
-        return transitions
+        return _merge_range_transitions(transitions)
 
     def _get_deterministic_from_classes(self, class_list: List[int]) -> list[State]:
 
         new_states = list()
-        classes = list(set(class_list))
+
+        # Primer estado (representante) de cada clase
+        representatives: Dict[int, int] = dict()
+        for pos, c in enumerate(class_list):
+            representatives.setdefault(c, pos)
 
         # A partir de la tabla de clases obtenemos los nuevos estados
-        for c in classes:
+        for c in sorted(representatives):
+            base_state = representatives[c]
+
             # Creamos el estado
-            state = State("q{}".format(c),
-                          self.states[class_list.index(c)].is_final)
+            state = State("q{}".format(c), self.states[base_state].is_final)
             new_states.append(state)
 
             # Buscamos las transiciones a las otras clases a partir de una base
-            base_state = class_list.index(c)
             state.add_transitions(
                 self._get_transitions_from_index(class_list, base_state))
 
@@ -434,30 +889,11 @@ class FiniteAutomaton():
     conllevan el triple de información.
     """
 
-    def to_minimized(self) -> 'FiniteAutomaton':
+    def _moore_classes(self, classes: List[int]) -> List[int]:
         """
-        Return a equivalent minimal automaton.
-
-        Returns:
-            Equivalent minimal automaton.
-
+        Refines the equivalence classes comparing every pair of states
+        until the classes don't change (Moore's algorithm).
         """
-        # Antes de empezar comprobamos si el autómata es determinista
-        if not self._is_deterministic:
-
-            # Debemos comprobar el hecho puesto que asumimos por defecto que no lo es
-            if not self._check_deterministic():
-                det = self.to_deterministic()
-                return det.to_minimized()
-
-        classes: List[int] = list()
-        # Eliminamos los estados inaccesibles
-        self._eliminate_inaccesible_states()
-
-        # Primera iteración: Finales = 1 y No Finales = 0
-        for state in self.states:
-            classes.append(1 if state.is_final else 0)
-
         # N-ésimas iteraciones: Solo paramos si las clases no han cambiado
         changed = True
         while changed:
@@ -491,6 +927,536 @@ class FiniteAutomaton():
             # Actualizamos las clases de equivalencia
             classes = new_classes
 
+        return classes
+
+    def _hopcroft_classes(self, classes: List[int]) -> List[int]:
+        """
+        Refines the equivalence classes with Hopcroft's partition
+        refinement in O(n log n), using the inverse transitions of
+        every state to find the blocks to split.
+
+        The resulting classes are numbered by order of appearance,
+        exactly as in ``_moore_classes``.
+        """
+        n = len(self.states)
+        # Un símbolo representante por cada clase de símbolos
+        symbols = [symbol_class[0] for symbol_class in self.get_symbol_classes()]
+
+        # Índice inverso: inverse[a][j] -> estados que llegan a j con a
+        inverse: List[List[List[int]]] = list()
+        for symbol in symbols:
+            inverse_symbol: List[List[int]] = [[] for _ in range(n)]
+            for pos in range(n):
+                inverse_symbol[self._get_index_of_det_transition(symbol, pos)].append(pos)
+            inverse.append(inverse_symbol)
+
+        # Bloques iniciales a partir de las clases recibidas
+        block_ids: Dict[int, int] = dict()
+        block_of: List[int] = list()
+        blocks: List[Set[int]] = list()
+        for pos, c in enumerate(classes):
+            b = block_ids.get(c)
+            if b is None:
+                b = block_ids[c] = len(blocks)
+                blocks.append(set())
+            blocks[b].add(pos)
+            block_of.append(b)
+
+        # Basta con usar como separadores todos los bloques menos el mayor
+        largest = max(range(len(blocks)), key=lambda b: len(blocks[b]), default=0)
+        pending: Deque[Tuple[int, int]] = deque(
+            (b, a) for b in range(len(blocks)) if b != largest
+            for a in range(len(symbols))
+        )
+        in_pending: Set[Tuple[int, int]] = set(pending)
+
+        while pending:
+            splitter = pending.popleft()
+            in_pending.discard(splitter)
+            b, a = splitter
+
+            # Estados que transitan al bloque separador con el símbolo a
+            touched: Dict[int, List[int]] = dict()
+            for target in blocks[b]:
+                for source in inverse[a][target]:
+                    touched.setdefault(block_of[source], []).append(source)
+
+            for y, sources in touched.items():
+                if len(sources) == len(blocks[y]):
+                    continue
+
+                # Separamos el bloque y en dos, el nuevo es el intersecado
+                new_block = set(sources)
+                blocks[y] -= new_block
+                z = len(blocks)
+                blocks.append(new_block)
+                for pos in new_block:
+                    block_of[pos] = z
+
+                smaller = z if len(new_block) <= len(blocks[y]) else y
+                for a2 in range(len(symbols)):
+                    if (y, a2) in in_pending:
+                        pending.append((z, a2))
+                        in_pending.add((z, a2))
+                    else:
+                        pending.append((smaller, a2))
+                        in_pending.add((smaller, a2))
+
+        # Renumeramos las clases por orden de aparición
+        numbering: Dict[int, int] = dict()
+        return [numbering.setdefault(b, len(numbering)) for b in block_of]
+
+    _MINIMIZATION_ENGINES: Tuple[str, ...] = ("hopcroft", "moore")
+
+    def to_minimized(self, engine: str = "hopcroft") -> 'FiniteAutomaton':
+        """
+        Return a equivalent minimal automaton.
+
+        Args:
+            engine: Refinement algorithm, ``"hopcroft"`` (default) or
+                ``"moore"``. Both return the same automaton.
+
+        Returns:
+            Equivalent minimal automaton.
+
+        """
+        if engine not in self._MINIMIZATION_ENGINES:
+            raise ValueError(f"Unknown minimization engine: {engine}")
+
+        # Antes de empezar comprobamos si el autómata es determinista
+        if not self._is_deterministic:
+
+            # Debemos comprobar el hecho puesto que asumimos por defecto que no lo es
+            if not self._check_deterministic():
+                det = self.to_deterministic()
+                return det.to_minimized(engine)
+
+        classes: List[int] = list()
+        # Eliminamos los estados inaccesibles
+        self._eliminate_inaccesible_states()
+
+        # Primera iteración: Finales = 1 y No Finales = 0
+        for state in self.states:
+            classes.append(1 if state.is_final else 0)
+
+        classes = self._refine_classes(classes, engine)
+
         # Creamos el automata
         return FiniteAutomaton(self._get_deterministic_from_classes(classes))
         # ---------------------------------------------------------------------
+
+    def _refine_classes(self, classes: List[int], engine: str) -> List[int]:
+        """
+        Refines an initial partition of the states (aligned with ``self.states``,
+        which must be deterministic, complete and accessible) with the
+        given minimization engine. Callers that must keep more than the
+        finality (like tags) start from a finer partition.
+        """
+        if engine == "hopcroft":
+            return self._hopcroft_classes(classes)
+        return self._moore_classes(classes)
+
+    def _bisimulation_classes(self, forward: bool) -> List[int]:
+        """
+        Computes the classes of the coarsest forward (or backward) bisimulation
+        by partition refinement. Lambdas are treated as one more symbol.
+
+            - Forward: same finality and, for every symbol, transitions to the
+              same classes.
+            - Backward: same initiality and, for every symbol, transitions from
+              the same classes.
+
+        Only the states with a neighbour that changed of class are checked
+        again (the other ones keep the common signature of their class), and
+        when a class is split the biggest part keeps its number, so every
+        state is moved a logarithmic number of times.
+        """
+        index = {s.name: i for i, s in enumerate(self.states)}
+
+        # Aristas (símbolo, vecino) de cada estado: sucesores o predecesores,
+        # y estados cuya firma depende de cada estado
+        edges: List[List[Tuple[Optional[Symbol], int]]] = [[] for _ in self.states]
+        dependents: List[List[int]] = [[] for _ in self.states]
+        for i, state in enumerate(self.states):
+            for t in state.transitions:
+                j = index[t.state]
+                if forward:
+                    edges[i].append((t.symbol, j))
+                    dependents[j].append(i)
+                else:
+                    edges[j].append((t.symbol, i))
+                    dependents[i].append(j)
+
+        if forward:
+            classes = [1 if s.is_final else 0 for s in self.states]
+        else:
+            classes = [1 if i == 0 else 0 for i in range(len(self.states))]
+
+        members: List[Set[int]] = [set(), set()]
+        for i, c in enumerate(classes):
+            members[c].add(i)
+        # Firma común de los estados de cada clase que no están pendientes
+        signatures: List[Optional[FrozenSet]] = [None, None]
+        pending: Set[int] = set(range(len(self.states)))
+
+        while pending:
+            # Primero las firmas de los pendientes, todas con las clases actuales
+            groups: Dict[int, Dict[FrozenSet, List[int]]] = dict()
+            for i in pending:
+                signature = frozenset((symbol, classes[j]) for symbol, j in edges[i])
+                groups.setdefault(classes[i], dict()).setdefault(signature, []).append(i)
+            pending = set()
+
+            for c, class_groups in groups.items():
+                rest = members[c]
+                n_pending = sum(len(states) for states in class_groups.values())
+                if len(class_groups) == 1 and (
+                    n_pending == len(rest) or signatures[c] in class_groups
+                ):
+                    signatures[c] = next(iter(class_groups))
+                    continue
+
+                # Partes de la clase: los pendientes con firma nueva y el
+                # resto (con la firma común)
+                for states in class_groups.values():
+                    rest.difference_update(states)
+                parts: List[Tuple[Optional[FrozenSet], Set[int]]] = list()
+                for signature, states in class_groups.items():
+                    if rest and signature == signatures[c]:
+                        rest.update(states)
+                    else:
+                        parts.append((signature, set(states)))
+                if rest:
+                    parts.append((signatures[c], rest))
+
+                # La parte más grande se queda con el número de la clase
+                parts.sort(key=lambda part: len(part[1]), reverse=True)
+                signatures[c], members[c] = parts[0]
+                for signature, part in parts[1:]:
+                    new_class = len(members)
+                    members.append(part)
+                    signatures.append(signature)
+                    for i in part:
+                        classes[i] = new_class
+                        pending.update(dependents[i])
+
+        return classes
+
+    def _quotient(self, classes: List[int]) -> 'FiniteAutomaton':
+        """
+        Builds the automaton whose states are the classes. Each class is named
+        after its first state and is final if any of its states is final.
+        """
+        representatives: Dict[int, State] = dict()
+        for state, c in zip(self.states, classes):
+            if c not in representatives:
+                representatives[c] = State(state.name, False)
+            representatives[c].is_final |= state.is_final
+
+        index = {s.name: i for i, s in enumerate(self.states)}
+        transitions: Dict[int, Set[Transition]] = {c: set() for c in representatives}
+        for state, c in zip(self.states, classes):
+            for t in state.transitions:
+                target = representatives[classes[index[t.state]]]
+                transitions[c].add(Transition(t.symbol, target.name))
+
+        for c, state in representatives.items():
+            state.add_transitions(list(transitions[c]))
+
+        return FiniteAutomaton(list(representatives.values()))
+
+    _BISIMULATION_DIRECTIONS: Tuple[str, ...] = ("forward", "backward", "both")
+
+    def reduce_bisimulation(self, direction: str = "both") -> 'FiniteAutomaton':
+        """
+        Return an equivalent automaton merging bisimilar states.
+
+        Args:
+            direction: ``"forward"`` merges states with the same future
+                (finality and successors), ``"backward"`` states with the
+                same past (initiality and predecessors), and ``"both"``
+                (default) applies one forward and then one backward reduction.
+
+        Returns:
+            Equivalent automaton, not larger than the original one.
+
+        """
+        if direction not in self._BISIMULATION_DIRECTIONS:
+            raise ValueError(f"Unknown bisimulation direction: {direction}")
+
+        if direction != "both":
+            return self._quotient(self._bisimulation_classes(direction == "forward"))
+
+        # Una sola pasada en cada sentido: repetirlas apenas reduce más
+        reduced = self._quotient(self._bisimulation_classes(True))
+        return reduced._quotient(reduced._bisimulation_classes(False))
+
+    def remove_lambdas(self) -> 'FiniteAutomaton':
+        """
+        Return an equivalent automaton without lambda transitions.
+
+        Every state gets the transitions with symbol of all the states of its
+        lambda closure, and it's final if any of them is final. The states
+        that become unreachable (typically most of the ones only reached by
+        lambdas) are removed.
+
+        Returns:
+            Equivalent lambda free automaton.
+
+        """
+        closures = self.get_lambda_closures()
+
+        new_states: Dict[str, State] = dict()
+        to_visit: Deque[str] = deque([self.states[0].name])
+        seen: Set[str] = {self.states[0].name}
+
+        # Solo construimos los estados alcanzables desde el inicial
+        while len(to_visit) != 0:
+            name = to_visit.popleft()
+            closure = closures[name]
+
+            state = State(name, any(s.is_final for s in closure))
+            state.add_transitions([
+                t for s in closure for t in s.transitions if t.symbol is not None
+            ])
+            new_states[name] = state
+
+            for t in state.transitions:
+                if t.state not in seen:
+                    seen.add(t.state)
+                    to_visit.append(t.state)
+
+        return FiniteAutomaton(list(new_states.values()))
+
+    def to_reversed(self) -> 'FiniteAutomaton':
+        """
+        Return an automaton that accepts the reversed strings.
+
+        A new initial state goes with lambdas to the old final states, every
+        transition is reversed and the old initial state is the only final one.
+
+        Returns:
+            Automaton of the reversed language (not deterministic in general).
+
+        """
+        initial_name = "reversed_initial"
+        while initial_name in self.name2state:
+            initial_name = "_" + initial_name
+
+        initial = State(initial_name, False)
+        reversed_states = {s.name: State(s.name, False) for s in self.states}
+        reversed_states[self.states[0].name].is_final = True
+
+        transitions: Dict[str, List[Transition]] = {s.name: list() for s in self.states}
+        for state in self.states:
+            if state.is_final:
+                initial.transitions.append(Transition(None, state.name))
+            for t in state.transitions:
+                transitions[t.state].append(Transition(t.symbol, state.name))
+
+        for name, state in reversed_states.items():
+            state.add_transitions(transitions[name])
+
+        return FiniteAutomaton([initial] + list(reversed_states.values()))
+
+    def compile(self) -> 'CompiledAutomaton':
+        """
+        Return an equivalent automaton compiled into an integer table.
+
+        Returns:
+            Compiled automaton (see ``automata.compiled``).
+
+        """
+        from automata.compiled import CompiledAutomaton
+
+        return CompiledAutomaton.from_automaton(self)
+
+    def _rejection_search(self, driver: Optional['FiniteAutomaton']) -> Optional[str]:
+        """
+        Searches breadth first a string accepted by ``driver`` (any string if
+        it's ``None``) and rejected by this automaton.
+
+        Every node is a state of the driver and the set of states of this
+        automaton reached with the same string. A node is discarded if there
+        is already one with the same driver state and a subset of its states,
+        because any string rejected from the bigger set is also rejected from
+        the smaller one, so only an antichain of minimal sets is kept.
+        """
+        from automata.automaton_evaluator import FiniteAutomatonEvaluator
+
+        alphabet = _joint_alphabet([self] if driver is None else [self, driver])
+        evaluator = FiniteAutomatonEvaluator(self)
+        moves: Dict[Tuple[State, Symbol], FrozenSet[State]] = dict()
+
+        if driver is None:
+            initial_nodes: List[Optional[State]] = [None]
+        else:
+            driver_evaluator = FiniteAutomatonEvaluator(driver)
+            driver_moves: Dict[Tuple[State, Symbol], FrozenSet[State]] = dict()
+            initial_nodes = list(driver_evaluator.current_states)
+
+        antichains: Dict[Optional[State], List[FrozenSet[State]]] = dict()
+        nodes: List[Tuple[Optional[State], FrozenSet[State]]] = list()
+        # Nodo anterior y símbolo de cada nodo para reconstruir la cadena
+        previous: List[Tuple[int, str]] = list()
+
+        def add_node(node: Optional[State], subset: FrozenSet[State], prev: int, symbol: str) -> None:
+            antichain = antichains.setdefault(node, [])
+            if any(kept <= subset for kept in antichain):
+                return
+
+            antichain[:] = [kept for kept in antichain if not subset <= kept]
+            antichain.append(subset)
+            nodes.append((node, subset))
+            previous.append((prev, symbol))
+
+        initial_set = frozenset(evaluator.current_states)
+        for node in initial_nodes:
+            add_node(node, initial_set, -1, "")
+
+        i = 0
+        while i < len(nodes):
+            node, subset = nodes[i]
+
+            if (node is None or node.is_final) and not any(s.is_final for s in subset):
+                symbols: List[str] = list()
+                while i >= 0:
+                    i, symbol = previous[i]
+                    symbols.append(symbol)
+                return "".join(reversed(symbols))
+
+            for symbol in alphabet:
+                reached: Set[State] = set()
+                for state in subset:
+                    reached.update(self._move_state(moves, state, symbol, evaluator))
+
+                if node is None:
+                    targets: Iterable[Optional[State]] = [None]
+                else:
+                    targets = driver._move_state(driver_moves, node, symbol, driver_evaluator)
+
+                for target in targets:
+                    add_node(target, frozenset(reached), i, symbol)
+
+            i += 1
+
+        return None
+
+    def subset_counterexample(self, other: 'FiniteAutomaton') -> Optional[str]:
+        """
+        Search a string accepted by this automaton but not by ``other``.
+
+        Neither automaton is determinized: the states of this one are
+        explored one by one, and the sets of states of ``other`` are pruned
+        with antichains (see ``_rejection_search``).
+
+        Args:
+            other: Automaton that should contain the language of this one.
+
+        Returns:
+            ``None`` if the language is included in the one of ``other``,
+            otherwise a counterexample.
+
+        """
+        return other._rejection_search(self)
+
+    def is_subset_of(self, other: 'FiniteAutomaton') -> bool:
+        """
+        Check if the language of the automaton is included in another one.
+
+        Args:
+            other: Automaton that should contain the language of this one.
+
+        Returns:
+            ``True`` if every string accepted by this automaton is accepted
+            by ``other``. Use ``subset_counterexample`` to get a string that
+            isn't.
+
+        """
+        return self.subset_counterexample(other) is None
+
+    def universality_counterexample(self) -> Optional[str]:
+        """
+        Search a string over the alphabet of the automaton that it rejects.
+
+        Only an antichain of minimal sets of states is explored (see
+        ``_rejection_search``), instead of the full determinization.
+
+        Returns:
+            ``None`` if every string is accepted, otherwise a counterexample.
+
+        """
+        return self._rejection_search(None)
+
+    def is_universal(self) -> bool:
+        """
+        Check if the automaton accepts every string over its alphabet.
+
+        Returns:
+            ``True`` if the automaton is universal. Use
+            ``universality_counterexample`` to get a rejected string.
+
+        """
+        return self.universality_counterexample() is None
+
+    def intersection(self, *others: 'FiniteAutomaton') -> 'ProductAutomaton':
+        """
+        Return the intersection with other automata.
+
+        The product is built lazily (see ``automata.product``), so checking
+        many filters at once only visits the reachable tuples of states.
+
+        Args:
+            others: Automata (or products) to intersect with.
+
+        Returns:
+            Automaton accepting the strings accepted by all of them.
+
+        """
+        from automata.product import ProductAutomaton
+
+        return ProductAutomaton("intersection", [self, *others])
+
+    def union(self, *others: 'FiniteAutomaton') -> 'ProductAutomaton':
+        """
+        Return the union with other automata, built lazily.
+
+        Args:
+            others: Automata (or products) to join with.
+
+        Returns:
+            Automaton accepting the strings accepted by any of them.
+
+        """
+        from automata.product import ProductAutomaton
+
+        return ProductAutomaton("union", [self, *others])
+
+    def difference(self, *others: 'FiniteAutomaton') -> 'ProductAutomaton':
+        """
+        Return the difference with other automata, built lazily.
+
+        Args:
+            others: Automata (or products) whose strings are removed.
+
+        Returns:
+            Automaton accepting the strings of this automaton not accepted
+            by any of the others.
+
+        """
+        from automata.product import ProductAutomaton
+
+        return ProductAutomaton("difference", [self, *others])
+
+    def complement(self) -> 'ProductAutomaton':
+        """
+        Return the complement, built lazily.
+
+        Returns:
+            Automaton accepting every string (with any symbols) not
+            accepted by this automaton.
+
+        """
+        from automata.product import ProductAutomaton
+
+        return ProductAutomaton("complement", [self])
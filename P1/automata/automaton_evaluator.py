@@ -1,9 +1,9 @@
 """Evaluation of automata."""
 from collections import defaultdict, deque
 from pstats import StatsProfile
-from typing import Set, List
+from typing import Dict, Set, List
 
-from automata.automaton import FiniteAutomaton, State
+from automata.automaton import FiniteAutomaton, State, Symbol
 
 
 class FiniteAutomatonEvaluator():
@@ -40,40 +40,32 @@ class FiniteAutomatonEvaluator():
         # ---------------------------------------------------------------------
         # TO DO: Implement this method...
         expanded_states: Set[State] = set()
+        closures = self.automaton.get_lambda_closures()
 
+        # Añadimos directamente las clausuras precalculadas de los destinos
         for state in self.current_states:
             for t in state.search_transitions(symbol):
-                expanded_states.add(self.automaton.name2state[t.state])
+                expanded_states.update(closures[t.state])
 
         self.current_states = expanded_states
-        self._complete_lambdas(self.current_states)
         # ---------------------------------------------------------------------
 
     def _complete_lambdas(self, set_to_complete: Set[State]) -> None:
         """
         Add states reachable with lambda transitions to the set.
 
+        The closures are computed once by the automaton, so this is
+        just the union of the cached closures of the states in the set.
+
         Args:
             set_to_complete: Current set of states to be completed.
         """
         # ---------------------------------------------------------------------
         # TO DO: Implement this method...
-        visited_states: List[State] = list()
-        to_visit_states = list(set_to_complete)
-
-        while True:
-            if (len(to_visit_states) == 0):
-                return
-
-            current_state = to_visit_states.pop()
-
-            if (visited_states.count(current_state) == 0):
-                for transition in current_state.get_lambdas():
-                    state = self.automaton.name2state[transition.state]
-                    to_visit_states.append(state)
-                    set_to_complete.add(state)
+        closures = self.automaton.get_lambda_closures()
 
-                visited_states.append(current_state)
+        for state in list(set_to_complete):
+            set_to_complete.update(closures[state.name])
         # ---------------------------------------------------------------------
 
     def process_string(self, string: str) -> None:
@@ -113,3 +105,123 @@ class FiniteAutomatonEvaluator():
             self.current_states = old_states
 
         return accepted
+
+
+class BitsetAutomatonEvaluator():
+    """
+    Automaton evaluator that represents the set of current states as an
+    integer bitmask, where bit ``i`` stands for ``automaton.states[i]``.
+
+    Lambda closures and successors are precomputed as masks, so processing
+    a symbol is a loop over the set bits OR-ing the successor masks, without
+    hashing any ``State``. With transitions labelled with ranges, the masks
+    are stored by elementary range, found with a binary search.
+
+    Args:
+        automaton: Automaton to evaluate.
+
+    Attributes:
+        current_states: Bitmask of current states of the automaton.
+
+    """
+
+    automaton: FiniteAutomaton
+    current_states: int
+    closure_masks: List[int]
+    successor_masks: Dict[Symbol, Dict[int, int]]
+    relevant_masks: Dict[Symbol, int]
+    final_mask: int
+
+    def __init__(self, automaton: FiniteAutomaton) -> None:
+        self.automaton = automaton
+        index = {s.name: i for i, s in enumerate(automaton.states)}
+        closures = automaton.get_lambda_closures()
+
+        # Máscara de la clausura lambda de cada estado
+        self.closure_masks = list()
+        self.final_mask = 0
+        for i, state in enumerate(automaton.states):
+            mask = 0
+            for s in closures[state.name]:
+                mask |= 1 << index[s.name]
+            self.closure_masks.append(mask)
+
+            if state.is_final:
+                self.final_mask |= 1 << i
+
+        # Para cada símbolo: estado -> máscara de sucesores (ya clausurados),
+        # y la máscara de estados que tienen alguna transición con el símbolo
+        self.successor_masks = defaultdict(dict)
+        self.relevant_masks = defaultdict(int)
+        for i, state in enumerate(automaton.states):
+            for t in state.transitions:
+                if t.symbol is not None:
+                    for symbol in automaton._atoms_of(t.symbol):
+                        masks = self.successor_masks[symbol]
+                        masks[i] = masks.get(i, 0) | self.closure_masks[index[t.state]]
+                        self.relevant_masks[symbol] |= 1 << i
+
+        self.successor_masks = dict(self.successor_masks)
+        self.relevant_masks = dict(self.relevant_masks)
+        self._has_ranges = bool(automaton._atoms)
+        self.current_states = self.closure_masks[0]
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Process one symbol.
+
+        Args:
+            symbol: Symbol to consume.
+
+        """
+        if self._has_ranges:
+            symbol = self.automaton.get_symbol_atom(symbol)
+
+        masks = self.successor_masks.get(symbol)
+        if masks is None:
+            self.current_states = 0
+            return
+
+        # Solo nos interesan los estados con transiciones con el símbolo
+        current = self.current_states & self.relevant_masks[symbol]
+        expanded = 0
+
+        while current:
+            lowest = current & -current
+            expanded |= masks[lowest.bit_length() - 1]
+            current ^= lowest
+
+        self.current_states = expanded
+
+    def process_string(self, string: str) -> None:
+        """
+        Process a full string of symbols.
+
+        Args:
+            string: String to process.
+
+        """
+        for symbol in string:
+            if not self.current_states:
+                return
+            self.process_symbol(symbol)
+
+    def is_accepting(self) -> bool:
+        """Check if the current state is an accepting one."""
+        return (self.current_states & self.final_mask) != 0
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted without changing state.
+
+        Note: This function is NOT thread-safe.
+
+        """
+        old_states = self.current_states
+        try:
+            self.process_string(string)
+            accepted = self.is_accepting()
+        finally:
+            self.current_states = old_states
+
+        return accepted
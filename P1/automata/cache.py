@@ -0,0 +1,141 @@
+"""Cache of compiled regexes, in memory and on disk."""
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from automata.compiled import CompiledAutomaton
+from automata.re_parser import REParser
+
+
+class CompileCache():
+    """
+    Cache of regexes compiled into minimal deterministic automata.
+
+    The entries are keyed by the SHA-256 of the regex, the construction and
+    the version of the binary format. The most recently used ones are kept
+    in memory (LRU), and if a directory is given every compiled automaton
+    is also stored there in binary format (see ``CompiledAutomaton.dump``),
+    so other processes, or later runs, load it with ``mmap`` instead of
+    compiling it again.
+
+    The tables of the returned automata are read only views. Evaluating
+    them only memoizes the columns of symbols found in ranges (see
+    ``CompiledAutomaton._find_column``), so they can be shared between
+    threads.
+
+    Args:
+        max_size: Maximum number of automata kept in memory.
+        directory: Directory of the disk layer (``None`` to disable it).
+
+    Attributes:
+        hits: Lookups found in memory.
+        disk_hits: Lookups found on disk.
+        misses: Lookups that had to compile the regex.
+
+    """
+
+    max_size: int
+    directory: Optional[str]
+    hits: int
+    disk_hits: int
+    misses: int
+
+    def __init__(self, max_size: int = 256, directory: Optional[str] = None) -> None:
+        if max_size < 1:
+            raise ValueError("The size of the cache must be positive")
+
+        self.max_size = max_size
+        self.directory = directory
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, CompiledAutomaton]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(re_string: str, construction: str = "thompson") -> str:
+        """Returns the key (hexadecimal SHA-256) of a regex and its options."""
+        content = "\0".join([str(CompiledAutomaton._VERSION), construction, re_string])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".autc")
+
+    def _compile(self, re_string: str, construction: str, key: str) -> CompiledAutomaton:
+        """Compiles a regex, storing it on disk if there is a disk layer."""
+        automaton = REParser().create_automaton(re_string, construction)
+        data = automaton.to_minimized().compile().to_bytes()
+
+        if self.directory is None:
+            return CompiledAutomaton.from_bytes(data)
+
+        # Escribimos en un temporal y lo renombramos, para que otros procesos
+        # nunca vean un fichero a medias
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+        return CompiledAutomaton.load(self._path(key))
+
+    def get(self, re_string: str, construction: str = "thompson") -> CompiledAutomaton:
+        """
+        Return the compiled automaton of a regex, compiling it if needed.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+            construction: Construction used by ``REParser.create_automaton``.
+
+        Returns:
+            Compiled automaton (with read only tables) of the minimal DFA of the regex.
+
+        """
+        if construction not in REParser._CONSTRUCTIONS:
+            raise ValueError(f"Unknown construction: {construction}")
+
+        key = self.key(re_string, construction)
+
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compiled
+
+        if self.directory is not None and os.path.exists(self._path(key)):
+            compiled = CompiledAutomaton.load(self._path(key))
+            hit = True
+        else:
+            compiled = self._compile(re_string, construction, key)
+            hit = False
+
+        with self._lock:
+            if hit:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return compiled
+
+    def clear(self) -> None:
+        """Empty the memory layer (the disk layer is kept)."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,170 @@
+"""Generation of Python matchers specialized for a deterministic automaton."""
+import hashlib
+import linecache
+from bisect import bisect_right
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from automata.automaton import FiniteAutomaton
+from automata.compiled import CompiledAutomaton
+
+Matcher = Callable[[str], bool]
+
+# Funciones ya compiladas, por código fuente
+_matchers: Dict[str, Matcher] = dict()
+
+
+class _ClassMap(dict):
+    """
+    Table for ``str.translate`` that maps each code point to the character
+    of its class. The table starts with the symbols of the alphabet and
+    every Latin-1 code point. Any other code point is searched in the
+    ranges, and only the ones found there are added, up to ``limit``
+    entries, so the table doesn't grow with the variety of the input.
+    """
+
+    def __init__(
+        self,
+        classes: Dict[int, str],
+        ranges: Sequence[Tuple[int, int, int]],
+        unknown: str,
+        limit: int = 1 << 12,
+    ) -> None:
+        super().__init__()
+        self._firsts = [first for first, _, _ in ranges]
+        self._ranges = ranges
+        self._unknown = unknown
+
+        for code in range(256):
+            self[code] = self._search(code)
+        self.update(classes)
+        self._limit = len(self) + limit
+
+    def _search(self, code: int) -> str:
+        i = bisect_right(self._firsts, code) - 1
+        if i >= 0 and code <= self._ranges[i][1]:
+            return chr(self._ranges[i][2])
+        return self._unknown
+
+    def __missing__(self, code: int) -> str:
+        value = self._search(code)
+
+        # Los símbolos desconocidos no se guardan, y los de los rangos solo
+        # hasta el límite
+        if value != self._unknown and len(self) < self._limit:
+            self[code] = value
+
+        return value
+
+
+def generate_source(automaton: Union[FiniteAutomaton, CompiledAutomaton]) -> str:
+    """
+    Generate the source of a function ``match(string) -> bool`` for an automaton.
+
+    The string is first translated, with ``str.translate``, into one
+    character per symbol class (the last class is for unknown symbols).
+    With fewer than 256 classes it's encoded as ``latin-1``, so the loop
+    goes over small integers without calling ``ord``. The states are
+    offsets of the rows of a flat tuple, so every symbol is a single
+    indexing (the dead state is an extra row that goes to itself). All the
+    tables are default arguments, so the loop makes no global or attribute
+    lookups.
+
+    Args:
+        automaton: Automaton to translate (it's compiled if needed).
+
+    Returns:
+        Python source of the function.
+
+    """
+    if isinstance(automaton, FiniteAutomaton):
+        automaton = automaton.compile()
+
+    width = automaton.n_symbols + 1
+    dead = automaton.n_states * width
+    unknown = automaton.n_symbols
+
+    rows: List[str] = list()
+    for state in range(automaton.n_states):
+        row = automaton.table[state * automaton.n_symbols:(state + 1) * automaton.n_symbols]
+        targets = [dead if target < 0 else target * width for target in row] + [dead]
+        rows.append("    " + ", ".join(map(str, targets)) + ",  # q%d" % state)
+    rows.append("    " + ", ".join([str(dead)] * width) + ",  # dead")
+
+    # Los rangos se buscan bajo demanda (symbol_index también tiene los
+    # símbolos ASCII de los rangos, que ya están en ranges)
+    classes = {
+        ord(symbol): chr(column)
+        for column, symbol_class in enumerate(automaton.symbol_classes)
+        for symbol in symbol_class
+        if isinstance(symbol, str)
+    }
+    ranges = list(zip(
+        automaton._range_firsts, automaton._range_lasts, automaton._range_columns,
+    ))
+    finals = sorted(
+        state * width for state in range(automaton.n_states) if automaton.is_final(state)
+    )
+
+    if width <= 256:
+        symbols = '_encode(_translate(string, _classes), "latin-1")'
+    else:
+        symbols = '_map(_ord, _translate(string, _classes))'
+
+    return "\n".join([
+        f"# Matcher of a deterministic automaton with {automaton.n_states} states"
+        f" and {automaton.n_symbols} classes of symbols",
+        f"_classes = _ClassMap({classes!r}, {ranges!r}, {chr(unknown)!r})",
+        "",
+        "_table = (",
+        *rows,
+        ")",
+        "",
+        "",
+        "def match(",
+        "    string,",
+        "    _classes=_classes,",
+        "    _table=_table,",
+        f"    _finals=frozenset({finals!r}),",
+        "    _translate=str.translate,",
+        "    _encode=str.encode,",
+        "    _map=map,",
+        "    _ord=ord,",
+        "):",
+        "    state = 0",
+        f"    for symbol in {symbols}:",
+        "        state = _table[state + symbol]",
+        "    return state in _finals",
+        "",
+    ])
+
+
+def compile_matcher(automaton: Union[FiniteAutomaton, CompiledAutomaton]) -> Matcher:
+    """
+    Generate and compile a matcher function for an automaton.
+
+    The functions are cached by their source, so equal automata share the
+    same function. The source is kept in the ``source`` attribute of the
+    function (and registered in ``linecache``, so ``inspect.getsource``
+    and tracebacks can show it).
+
+    Args:
+        automaton: Automaton to translate (it's compiled if needed).
+
+    Returns:
+        Function that returns if a string is accepted.
+
+    """
+    source = generate_source(automaton)
+    matcher = _matchers.get(source)
+
+    if matcher is None:
+        filename = "<automaton-matcher-%s>" % hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+        namespace = {"_ClassMap": _ClassMap}
+        exec(compile(source, filename, "exec"), namespace)
+
+        matcher = namespace["match"]
+        matcher.source = source
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        _matchers[source] = matcher
+
+    return matcher
@@ -0,0 +1,605 @@
+"""Compiled (table driven) representation of deterministic automata."""
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+from typing_extensions import Final
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy es opcional: sin ella accepts_many procesa las cadenas una a una
+    np = None
+
+from automata.automaton import FiniteAutomaton, Symbol, SymbolRanges
+from automata.utils import is_deterministic
+
+
+class CompiledAutomaton():
+    """
+    Dense integer transition table of a deterministic automaton.
+
+    States are numbered from ``0`` (the initial state) to ``n_states - 1``
+    and every column of the table is a class of equivalent symbols (see
+    ``FiniteAutomaton.get_symbol_classes``), so the target of a transition
+    is ``table[state * n_symbols + symbol_index[symbol]]``. Missing
+    transitions point to ``DEAD``.
+
+    Columns may also contain ranges of symbols. ASCII symbols in ranges are
+    added to ``symbol_index`` from the start, and any other symbol is found
+    in a two level table: blocks of 256 code points, each one either a
+    single column (if the whole block is in the same class, or in none) or
+    a row with the column of each code point. Only the blocks cut by the
+    bounds of a range have rows, so its size depends on the ranges, never
+    on the input (``symbol_index`` doesn't change after the construction).
+
+    Args:
+        symbol_classes: Symbols of each column of the table.
+        table: Flat ``array('i')`` with ``n_states * n_symbols`` targets
+            (or an ``int32`` ``memoryview``, see ``from_bytes``).
+        accepting: One byte per state, non zero for final states
+            (``bytes`` for an immutable automaton).
+
+    """
+
+    DEAD: Final = -1
+
+    # Formato binario: cabecera (magia, versión, reservado, estados, columnas,
+    # entradas de la tabla de símbolos) y entradas (tipo, primero, último, columna)
+    _MAGIC: Final = b"AUTC"
+    _VERSION: Final = 1
+    _HEADER: Final = struct.Struct("<4sHHIII")
+    _ENTRY: Final = struct.Struct("<IIII")
+    _SYMBOL: Final = 0
+    _RANGE: Final = 1
+
+    # Límites de accepts_many: celdas de cada matriz rellena, y longitud a
+    # partir de la cual una cadena se evalúa sola con accepts
+    _BATCH_CELLS: Final = 1 << 22
+    _LONG_STRING: Final = 1 << 14
+
+    # Bits de código que indexan cada bloque de la tabla de los rangos
+    _BLOCK_BITS: Final = 8
+
+    initial: int
+    n_states: int
+    n_symbols: int
+    symbol_classes: List[List[Symbol]]
+    symbol_index: Dict[str, int]
+    table: Union[array, memoryview]
+    accepting: Union[bytearray, bytes]
+
+    def __init__(
+        self,
+        symbol_classes: List[List[Symbol]],
+        table: Union[array, memoryview],
+        accepting: Union[bytearray, bytes],
+    ) -> None:
+        if len(table) != len(accepting) * len(symbol_classes):
+            raise ValueError(
+                "The size of the table does not match the number of states",
+            )
+
+        self.initial = 0
+        self.n_states = len(accepting)
+        self.n_symbols = len(symbol_classes)
+        self.symbol_classes = symbol_classes
+        # Tabla de búsqueda símbolo -> clase (columna)
+        self.symbol_index = dict()
+        # Rangos ordenados (primero, último, columna) para la búsqueda binaria
+        ranges = list()
+        for column, symbol_class in enumerate(symbol_classes):
+            for symbol in symbol_class:
+                if isinstance(symbol, SymbolRanges):
+                    ranges.extend((first, last, column) for first, last in symbol.ranges)
+                else:
+                    self.symbol_index[symbol] = column
+
+        ranges.sort()
+        self._range_firsts = [first for first, _, _ in ranges]
+        self._range_lasts = [last for _, last, _ in ranges]
+        self._range_columns = [column for _, _, column in ranges]
+
+        # Los símbolos ASCII de los rangos están siempre en la tabla
+        for first, last, column in ranges:
+            for code in range(first, min(last, 127) + 1):
+                self.symbol_index[chr(code)] = column
+
+        self._blocks = self._build_blocks(ranges) if ranges else None
+
+        self.table = table
+        self.accepting = accepting
+        self._np_tables = None
+        self._hopeless: Optional[FrozenSet[int]] = None
+        # Fichero del que se cargó la tabla (si se cargó con load)
+        self._path: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"n_states={self.n_states!r}, "
+            f"symbol_classes={self.symbol_classes!r})"
+        )
+
+    def __getstate__(self) -> dict:
+        # Las tablas de NumPy se reconstruyen bajo demanda, no se envían
+        state = self.__dict__.copy()
+        state["_np_tables"] = None
+
+        if self._path is not None:
+            # Cada proceso vuelve a mapear el fichero (compartido en la caché de páginas)
+            state["table"] = None
+        elif isinstance(self.table, memoryview):
+            state["table"] = array('i', self.table)
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+
+        if self._path is not None:
+            self.table = type(self).load(self._path).table
+
+    @classmethod
+    def from_automaton(cls, automaton: FiniteAutomaton) -> 'CompiledAutomaton':
+        """
+        Compile an automaton, determinizing it first if necessary.
+
+        Non deterministic automata are also minimized, which merges their
+        states and usually many symbols into the same column. Partial
+        deterministic automata are accepted: the missing transitions are
+        compiled as ``DEAD``.
+
+        Args:
+            automaton: Automaton to compile.
+
+        Returns:
+            Compiled automaton equivalent to the given one.
+
+        """
+        if not is_deterministic(automaton):
+            automaton = automaton.to_minimized()
+
+        symbol_classes = automaton.get_symbol_classes()
+        symbol_index: Dict[Symbol, int] = {
+            symbol: column
+            for column, symbol_class in enumerate(symbol_classes)
+            for symbol in symbol_class
+        }
+        state_index = {s.name: i for i, s in enumerate(automaton.states)}
+        n_symbols = len(symbol_classes)
+
+        table = array('i', [cls.DEAD]) * (len(automaton.states) * n_symbols)
+        accepting = bytearray(len(automaton.states))
+
+        for i, state in enumerate(automaton.states):
+            accepting[i] = state.is_final
+            for t in state.transitions:
+                for symbol in automaton._atoms_of(t.symbol):
+                    table[i * n_symbols + symbol_index[symbol]] = state_index[t.state]
+
+        return cls(symbol_classes, table, accepting)
+
+    def to_bytes(self) -> bytes:
+        """
+        Return the automaton in a compact binary format, made of:
+
+            - Header: ``AUTC``, version, number of states, of columns and
+              of entries of the symbol table.
+            - Symbol table: one entry (kind, first code point, last code
+              point, column) for each symbol or range of symbols.
+            - Transition table: ``n_states * n_symbols`` ``int32`` targets.
+            - Accepting bitmap: bit ``i`` (little endian) for state ``i``.
+
+        All the integers are little endian and the transition table is
+        aligned to 4 bytes, so it can be used without copying it.
+
+        Returns:
+            The binary representation.
+
+        """
+        entries: List[bytes] = list()
+        for column, symbol_class in enumerate(self.symbol_classes):
+            for symbol in symbol_class:
+                if isinstance(symbol, SymbolRanges):
+                    entries.extend(
+                        self._ENTRY.pack(self._RANGE, first, last, column)
+                        for first, last in symbol.ranges
+                    )
+                elif len(symbol) == 1:
+                    entries.append(self._ENTRY.pack(self._SYMBOL, ord(symbol), ord(symbol), column))
+                else:
+                    raise ValueError(f"Symbols must be single characters: {symbol!r}")
+
+        table = array('i', self.table)
+        if sys.byteorder != "little":
+            table.byteswap()
+
+        # Mapa de bits de los estados finales: cada byte pasa a ser un dígito binario
+        digits = bytes(self.accepting).translate(b"0" + b"1" * 255)
+        bits = int(digits[::-1], 2) if digits else 0
+
+        return b"".join([
+            self._HEADER.pack(
+                self._MAGIC, self._VERSION, 0, self.n_states, self.n_symbols, len(entries),
+            ),
+            *entries,
+            table.tobytes(),
+            bits.to_bytes((self.n_states + 7) // 8, "little"),
+        ])
+
+    @classmethod
+    def from_bytes(cls, buffer: Union[bytes, bytearray, memoryview, mmap.mmap]) -> 'CompiledAutomaton':
+        """
+        Read an automaton in the binary format of ``to_bytes``.
+
+        The transition table is a ``memoryview`` of the buffer (no copy is
+        made, except in big endian machines), so the buffer must not change
+        while the automaton is used. With a read only buffer (``bytes`` or
+        a read only ``mmap``) the automaton can't be modified.
+
+        Args:
+            buffer: Binary representation (it can be a ``mmap``).
+
+        Returns:
+            The compiled automaton.
+
+        """
+        view = memoryview(buffer)
+        if len(view) < cls._HEADER.size:
+            raise ValueError("Truncated compiled automaton")
+
+        magic, version, _, n_states, n_symbols, n_entries = cls._HEADER.unpack_from(view)
+        if magic != cls._MAGIC:
+            raise ValueError("Not a compiled automaton")
+        if version != cls._VERSION:
+            raise ValueError(f"Unsupported version of compiled automaton: {version}")
+
+        table_start = cls._HEADER.size + n_entries * cls._ENTRY.size
+        accepting_start = table_start + 4 * n_states * n_symbols
+        if len(view) != accepting_start + (n_states + 7) // 8:
+            raise ValueError("The size does not match the header")
+
+        symbol_classes: List[List[Symbol]] = [[] for _ in range(n_symbols)]
+        for kind, first, last, column in cls._ENTRY.iter_unpack(view[cls._HEADER.size:table_start]):
+            if kind == cls._RANGE:
+                symbol_classes[column].append(SymbolRanges([(first, last)]))
+            else:
+                symbol_classes[column].append(chr(first))
+
+        table: Union[array, memoryview] = view[table_start:accepting_start].cast('i')
+        if sys.byteorder != "little":
+            table = array('i', table)
+            table.byteswap()
+
+        # Desempaquetamos el mapa de bits: un byte 0/1 por estado
+        bits = int.from_bytes(view[accepting_start:], "little")
+        flags = format(bits, "0%db" % n_states)[::-1] if n_states else ""
+        accepting = flags.encode("ascii").translate(bytes.maketrans(b"01", b"\x00\x01"))
+
+        return cls(symbol_classes, table, accepting)
+
+    def dump(self, path: str) -> None:
+        """
+        Write the automaton to a file in the binary format of ``to_bytes``.
+
+        Args:
+            path: Path of the file.
+
+        """
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'CompiledAutomaton':
+        """
+        Load an automaton written with ``dump``, mapping the file in memory.
+
+        The transition table isn't read: the pages are loaded on demand and
+        shared (through the page cache) by all the processes that load the
+        same file. When the automaton is pickled (e.g. for a pool of
+        processes) only the path is sent, and the file is mapped again.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            The compiled automaton.
+
+        """
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        automaton = cls.from_bytes(buffer)
+        automaton._path = path
+        return automaton
+
+    @classmethod
+    def _build_blocks(cls, ranges: List[Tuple[int, int, int]]) -> List[Union[int, array]]:
+        """
+        Builds the two level table of the ranges (sorted and disjoint): the
+        column of each block of code points (``-1`` for none), or a row
+        with the column of each code point of the block.
+        """
+        size = 1 << cls._BLOCK_BITS
+        blocks: List[Union[int, array]] = [-1] * ((sys.maxunicode >> cls._BLOCK_BITS) + 1)
+
+        for first, last, column in ranges:
+            for block in range(first >> cls._BLOCK_BITS, (last >> cls._BLOCK_BITS) + 1):
+                low = max(first, block << cls._BLOCK_BITS) & (size - 1)
+                high = min(last, ((block + 1) << cls._BLOCK_BITS) - 1) & (size - 1)
+
+                if low == 0 and high == size - 1:
+                    blocks[block] = column
+                else:
+                    row = blocks[block]
+                    if not isinstance(row, array):
+                        row = blocks[block] = array('i', [row]) * size
+                    row[low:high + 1] = array('i', [column]) * (high - low + 1)
+
+        return blocks
+
+    def _find_column(self, symbol: str) -> Optional[int]:
+        """
+        Returns the column of a symbol not in ``symbol_index`` searching
+        the two level table of the ranges. Nothing is modified, so it's
+        safe with other threads.
+        """
+        if self._blocks is None or len(symbol) != 1:
+            return None
+
+        code = ord(symbol)
+        column = self._blocks[code >> self._BLOCK_BITS]
+        if not isinstance(column, int):
+            column = column[code & ((1 << self._BLOCK_BITS) - 1)]
+
+        return None if column < 0 else column
+
+    def step(self, state: int, symbol: str) -> int:
+        """
+        Return the state reached from ``state`` consuming one symbol.
+
+        Args:
+            state: Current state (it may be ``DEAD``).
+            symbol: Symbol to consume.
+
+        Returns:
+            Next state, ``DEAD`` if there is no transition.
+
+        """
+        column = self.symbol_index.get(symbol)
+        if column is None:
+            column = self._find_column(symbol)
+        if state < 0 or column is None:
+            return self.DEAD
+
+        return self.table[state * self.n_symbols + column]
+
+    def run(self, state: int, string: str) -> int:
+        """
+        Return the state reached from ``state`` consuming a full string.
+
+        Args:
+            state: Current state (it may be ``DEAD``).
+            string: String to consume.
+
+        Returns:
+            Reached state, ``DEAD`` as soon as there is no transition.
+
+        """
+        # Variables locales para evitar búsquedas de atributos en el bucle
+        table = self.table
+        n_symbols = self.n_symbols
+        get_column = self.symbol_index.get
+
+        for symbol in string:
+            if state < 0:
+                break
+
+            column = get_column(symbol)
+            if column is None:
+                column = self._find_column(symbol)
+                if column is None:
+                    return self.DEAD
+
+            state = table[state * n_symbols + column]
+
+        return state
+
+    def is_final(self, state: int) -> bool:
+        """Check if a state is a final one."""
+        return state >= 0 and bool(self.accepting[state])
+
+    def get_column(self, symbol: str) -> Optional[int]:
+        """
+        Return the column (class) of a symbol.
+
+        Args:
+            symbol: Symbol to look up.
+
+        Returns:
+            Column of the table, or ``None`` if the symbol isn't in the alphabet.
+
+        """
+        column = self.symbol_index.get(symbol)
+        return self._find_column(symbol) if column is None else column
+
+    def get_hopeless_states(self) -> FrozenSet[int]:
+        """
+        Return the states that can't reach a final state (like the sink of
+        a complete automaton), computed only once. From them no string is
+        accepted, so they behave like ``DEAD``.
+        """
+        if self._hopeless is None:
+            predecessors: List[Set[int]] = [set() for _ in range(self.n_states)]
+            for i, target in enumerate(self.table):
+                if target >= 0:
+                    predecessors[target].add(i // self.n_symbols)
+
+            useful = {q for q in range(self.n_states) if self.is_final(q)}
+            pending = list(useful)
+            while pending:
+                for q in predecessors[pending.pop()]:
+                    if q not in useful:
+                        useful.add(q)
+                        pending.append(q)
+
+            self._hopeless = frozenset(range(self.n_states)) - useful
+
+        return self._hopeless
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted.
+
+        Unlike ``FiniteAutomatonEvaluator`` it keeps no state, so the same
+        instance can be shared between threads.
+
+        """
+        return self.is_final(self.run(self.initial, string))
+
+    def _get_np_tables(self):
+        """
+        Returns the NumPy tables used by ``accepts_many``, built only once:
+
+            - Code point -> column lookup (unknown symbols get their own column).
+            - Transition table with an extra dead row, an identity column for
+              padding and a column for unknown symbols that goes to dead.
+            - Accepting flags (the dead row is not accepting).
+        """
+        if self._np_tables is None:
+            dead = self.n_states
+            pad = self.n_symbols
+            unknown = self.n_symbols + 1
+
+            # Símbolos sueltos de cada clase (los rangos se rellenan aparte)
+            symbols = [
+                (ord(symbol), column)
+                for column, symbol_class in enumerate(self.symbol_classes)
+                for symbol in symbol_class
+                if isinstance(symbol, str)
+            ]
+            lookup = np.full(
+                max(
+                    max((code for code, _ in symbols), default=0),
+                    max(self._range_lasts, default=0),
+                ) + 1,
+                unknown,
+                dtype=np.int32,
+            )
+            for first, last, column in zip(
+                self._range_firsts, self._range_lasts, self._range_columns,
+            ):
+                lookup[first:last + 1] = column
+            for code, column in symbols:
+                lookup[code] = column
+
+            table = np.full((self.n_states + 1, self.n_symbols + 2), dead, dtype=np.int32)
+            dense = np.frombuffer(self.table, dtype=np.int32).reshape(self.n_states, self.n_symbols)
+            table[:self.n_states, :self.n_symbols] = np.where(dense < 0, dead, dense)
+            table[:, pad] = np.arange(self.n_states + 1, dtype=np.int32)
+
+            accepting = np.zeros(self.n_states + 1, dtype=bool)
+            accepting[:self.n_states] = np.frombuffer(bytes(self.accepting), dtype=np.uint8) != 0
+
+            self._np_tables = (lookup, table, accepting)
+
+        return self._np_tables
+
+    def _accepts_padded(self, strings: List[str]):
+        """Vectorized acceptance of strings of similar length (requires NumPy)."""
+        lookup, table, accepting = self._get_np_tables()
+        pad = self.n_symbols
+        unknown = self.n_symbols + 1
+
+        lengths = np.fromiter((len(s) for s in strings), dtype=np.int64, count=len(strings))
+        width = int(lengths.max()) if len(strings) else 0
+
+        # Codificamos todas las cadenas de una vez: código -> columna (los
+        # surrogates sueltos se codifican y van a la columna de desconocidos)
+        code_points = np.frombuffer(
+            "".join(strings).encode("utf-32-le", "surrogatepass"),
+            dtype=np.uint32,
+        )
+        in_lookup = code_points < len(lookup)
+        columns = np.full(len(code_points), unknown, dtype=np.int32)
+        columns[in_lookup] = lookup[code_points[in_lookup]]
+
+        # Matriz rellena: fila = cadena, columna = posición
+        matrix = np.full((len(strings), width), pad, dtype=np.int32)
+        rows = np.repeat(np.arange(len(strings)), lengths)
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        matrix[rows, np.arange(len(code_points)) - starts] = columns
+
+        # Avanzamos todas las cadenas a la vez, una posición por iteración
+        states = np.zeros(len(strings), dtype=np.int32)
+        for position in range(width):
+            states = table[states, matrix[:, position]]
+
+        return accepting[states]
+
+    def _accepts_batch(self, strings: List[str]):
+        """
+        Vectorized acceptance of one batch of strings (requires NumPy).
+
+        The strings are sorted by length and split in groups whose padded
+        matrix has at most ``_BATCH_CELLS`` cells, so one long string
+        doesn't pad all the others. Strings longer than ``_LONG_STRING``
+        are checked with ``accepts``.
+        """
+        lengths = np.fromiter((len(s) for s in strings), dtype=np.int64, count=len(strings))
+        order = np.argsort(lengths, kind="stable")
+        sorted_lengths = lengths[order]
+        results = np.zeros(len(strings), dtype=bool)
+
+        short = int(np.searchsorted(sorted_lengths, self._LONG_STRING, side="right"))
+        for i in order[short:]:
+            results[i] = self.accepts(strings[i])
+
+        first = 0
+        while first < short:
+            # Mayor grupo [first, last) cuya matriz cabe (crece con last)
+            low, high = first + 1, short
+            while low < high:
+                middle = (low + high + 1) // 2
+                if (middle - first) * int(sorted_lengths[middle - 1]) <= self._BATCH_CELLS:
+                    low = middle
+                else:
+                    high = middle - 1
+            last = low
+
+            group = order[first:last]
+            results[group] = self._accepts_padded([strings[i] for i in group])
+            first = last
+
+        return results
+
+    def accepts_many(self, strings: Iterable[str], batch_size: int = 65536) -> List[bool]:
+        """
+        Return which strings are accepted, advancing all of them in lockstep.
+
+        With NumPy the strings are encoded into a padded matrix of column
+        ids and the current state of every string is advanced with one
+        vectorized table lookup per position (strings are grouped by length,
+        so the matrices stay small). Without NumPy each string is checked
+        with ``accepts``.
+
+        Args:
+            strings: Strings to check.
+            batch_size: Maximum number of strings encoded at once.
+
+        Returns:
+            List of booleans (with or without NumPy).
+
+        """
+        if np is None:
+            return [self.accepts(s) for s in strings]
+
+        strings = list(strings)
+        results: List[bool] = list()
+        for i in range(0, len(strings), batch_size):
+            results.extend(self._accepts_batch(strings[i:i + batch_size]).tolist())
+
+        return results
@@ -0,0 +1,217 @@
+"""Conversion from regex to deterministic automata with Brzozowski derivatives."""
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from typing_extensions import Final
+
+from automata.automaton import (
+    FiniteAutomaton,
+    State,
+    Symbol,
+    SymbolRanges,
+    Transition,
+    _merge_range_transitions,
+    symbol_atoms,
+    symbol_matches,
+)
+from automata.re_parser import _re_to_rpn, _token_symbol
+
+# Cada término es un entero que identifica a un nodo (hash-consing)
+Term = int
+
+
+class DerivativeCompiler():
+    """
+    Compiler of regexes into deterministic automata using derivatives.
+
+    Every state of the automaton is a regex term, and the transition with a
+    symbol goes to the derivative of the term with respect to the symbol.
+    Terms are built with smart constructors that normalize unions (as sets),
+    concatenations (right associated) and stars, and are hash-consed into
+    integers, so equivalent terms are usually the same state and the result
+    is close to minimal. Derivatives are memoized in the compiler, so they
+    are shared between the regexes it compiles.
+
+    """
+
+    EMPTY: Final = 0
+    LAMBDA: Final = 1
+
+    _nodes: List[Tuple]
+    _ids: Dict[Tuple, Term]
+    _nullable: List[bool]
+    _derivatives: Dict[Tuple[Term, Symbol], Term]
+
+    def __init__(self) -> None:
+        self._nodes = [("empty",), ("lambda",)]
+        self._ids = {node: i for i, node in enumerate(self._nodes)}
+        self._nullable = [False, True]
+        self._derivatives = dict()
+
+    def _intern(self, node: Tuple, nullable: bool) -> Term:
+        term = self._ids.get(node)
+
+        if term is None:
+            term = len(self._nodes)
+            self._nodes.append(node)
+            self._ids[node] = term
+            self._nullable.append(nullable)
+
+        return term
+
+    def _symbol(self, symbol: Symbol) -> Term:
+        return self._intern(("symbol", symbol), False)
+
+    def _concat(self, term1: Term, term2: Term) -> Term:
+        if term1 == self.EMPTY or term2 == self.EMPTY:
+            return self.EMPTY
+        if term1 == self.LAMBDA:
+            return term2
+        if term2 == self.LAMBDA:
+            return term1
+
+        node = self._nodes[term1]
+        if node[0] == "concat":
+            # (r.s).t -> r.(s.t)
+            return self._concat(node[1], self._concat(node[2], term2))
+
+        return self._intern(
+            ("concat", term1, term2),
+            self._nullable[term1] and self._nullable[term2],
+        )
+
+    def _union(self, terms: Iterable[Term]) -> Term:
+        members: Set[Term] = set()
+
+        for term in terms:
+            node = self._nodes[term]
+            if node[0] == "union":
+                members.update(node[1])
+            elif term != self.EMPTY:
+                members.add(term)
+
+        if not members:
+            return self.EMPTY
+        if len(members) == 1:
+            return members.pop()
+
+        frozen_members: FrozenSet[Term] = frozenset(members)
+        return self._intern(
+            ("union", frozen_members),
+            any(self._nullable[t] for t in frozen_members),
+        )
+
+    def _star(self, term: Term) -> Term:
+        if term == self.EMPTY or term == self.LAMBDA:
+            return self.LAMBDA
+        if self._nodes[term][0] == "star":
+            return term
+
+        return self._intern(("star", term), True)
+
+    def _derivative(self, term: Term, symbol: Symbol) -> Term:
+        """Returns the derivative of a term with respect to a symbol (memoized)."""
+        key = (term, symbol)
+        derivative = self._derivatives.get(key)
+
+        if derivative is None:
+            node = self._nodes[term]
+            kind = node[0]
+
+            if kind == "symbol":
+                derivative = self.LAMBDA if symbol_matches(node[1], symbol) else self.EMPTY
+            elif kind == "concat":
+                derivative = self._concat(self._derivative(node[1], symbol), node[2])
+                if self._nullable[node[1]]:
+                    derivative = self._union(
+                        [derivative, self._derivative(node[2], symbol)])
+            elif kind == "union":
+                derivative = self._union(
+                    self._derivative(t, symbol) for t in node[1])
+            elif kind == "star":
+                derivative = self._concat(self._derivative(node[1], symbol), term)
+            else:
+                # Vacío y lambda
+                derivative = self.EMPTY
+
+            self._derivatives[key] = derivative
+
+        return derivative
+
+    def _term_from_rpn(self, rpn: List[str]) -> Tuple[Term, Set[Symbol]]:
+        """Returns the term of a regex in RPN and its symbols."""
+        stack: List[Term] = []
+        symbols: Set[Symbol] = set()
+
+        for x in rpn:
+            if x == "*":
+                stack.append(self._star(stack.pop()))
+            elif x == "+":
+                term2 = stack.pop()
+                term1 = stack.pop()
+                stack.append(self._union([term1, term2]))
+            elif x == ".":
+                term2 = stack.pop()
+                term1 = stack.pop()
+                stack.append(self._concat(term1, term2))
+            elif x == "λ":
+                stack.append(self.LAMBDA)
+            else:
+                symbol = _token_symbol(x)
+                symbols.add(symbol)
+                stack.append(self._symbol(symbol))
+
+        return stack.pop(), symbols
+
+    def create_automaton(
+        self,
+        re_string: str,
+    ) -> FiniteAutomaton:
+        """
+        Create a deterministic automaton from a regex.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+
+        Returns:
+            Complete deterministic automaton equivalent to the regex.
+
+        """
+        if not re_string:
+            term, symbols = self.EMPTY, set()
+        else:
+            term, symbols = self._term_from_rpn(_re_to_rpn(re_string))
+
+        # Con rangos, basta con derivar respecto a los rangos elementales
+        if any(isinstance(symbol, SymbolRanges) for symbol in symbols):
+            alphabet: List[Symbol] = list(symbol_atoms(symbols))
+        else:
+            alphabet = sorted(symbols)
+
+        def state_name(term: Term) -> str:
+            return "empty" if term == self.EMPTY else "q" + str(len(states))
+
+        states: Dict[Term, State] = dict()
+        states[term] = State(state_name(term), self._nullable[term])
+        pending: List[Term] = [term]
+
+        # Recorremos los términos alcanzables (cada uno es un estado)
+        i = 0
+        while i < len(pending):
+            current = pending[i]
+            transitions: List[Transition] = list()
+
+            for symbol in alphabet:
+                derivative = self._derivative(current, symbol)
+                state = states.get(derivative)
+
+                if state is None:
+                    state = State(state_name(derivative), self._nullable[derivative])
+                    states[derivative] = state
+                    pending.append(derivative)
+
+                transitions.append(Transition(symbol, state.name))
+
+            states[current].add_transitions(_merge_range_transitions(transitions))
+            i += 1
+
+        return FiniteAutomaton(list(states.values()))
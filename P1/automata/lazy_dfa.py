@@ -0,0 +1,195 @@
+"""Evaluation of automata building the deterministic automaton on the fly."""
+from typing import Dict, List, Optional
+
+from typing_extensions import Final
+
+from automata.automaton import FiniteAutomaton, Symbol
+from automata.automaton_evaluator import BitsetAutomatonEvaluator
+
+
+class LazyDFAEvaluator():
+    """
+    Automaton evaluator that determinizes lazily, only the subsets visited.
+
+    Every deterministic state is a subset of states (a bitmask, as in
+    ``BitsetAutomatonEvaluator``) and its transitions are cached the first
+    time they are used, so the following times processing a symbol is a
+    dictionary lookup. When the cache exceeds its memory budget it is
+    flushed, and if flushes happen too often (the cache isn't paying off)
+    the evaluator falls back to plain NFA simulation.
+
+    Args:
+        automaton: Automaton to evaluate.
+        memory_budget: Approximate size in bytes allowed for the cache.
+        min_symbols_per_flush: If a flush happens after processing fewer
+            symbols than this since the previous one, the evaluator stops
+            caching and simulates the automaton instead.
+
+    Attributes:
+        flushes: Number of times the cache has been flushed.
+        using_fallback: Whether the evaluator is simulating the automaton.
+
+    """
+
+    # Estimación (aproximada) del coste en bytes de cada entrada de la caché
+    STATE_COST: Final = 200
+    TRANSITION_COST: Final = 70
+
+    automaton: FiniteAutomaton
+    memory_budget: int
+    min_symbols_per_flush: int
+    flushes: int
+    using_fallback: bool
+
+    def __init__(
+        self,
+        automaton: FiniteAutomaton,
+        memory_budget: int = 1 << 20,
+        min_symbols_per_flush: int = 1000,
+    ) -> None:
+        self.automaton = automaton
+        self.memory_budget = memory_budget
+        self.min_symbols_per_flush = min_symbols_per_flush
+        self.flushes = 0
+        self.using_fallback = False
+
+        self._nfa = BitsetAutomatonEvaluator(automaton)
+        self._clear_cache()
+        self._symbols_since_flush = 0
+        self._mask = self._nfa.current_states
+        self._current: Optional[int] = self._get_state(self._mask)
+
+    @property
+    def current_states(self) -> int:
+        """Bitmask of current states (see ``BitsetAutomatonEvaluator``)."""
+        return self._mask
+
+    @current_states.setter
+    def current_states(self, mask: int) -> None:
+        self._mask = mask
+        self._current = None if self.using_fallback else self._get_state(mask)
+
+    @property
+    def cache_size(self) -> int:
+        """Number of deterministic states currently cached."""
+        return len(self._masks)
+
+    def _clear_cache(self) -> None:
+        self._state_ids: Dict[int, int] = dict()
+        self._masks: List[int] = list()
+        self._transitions: List[Dict[Optional[Symbol], int]] = list()
+        self._used = 0
+
+    def _flush(self) -> None:
+        """Empties the cache, falling back to simulation if it's too frequent."""
+        self._clear_cache()
+        self.flushes += 1
+
+        if self._symbols_since_flush < self.min_symbols_per_flush:
+            self.using_fallback = True
+
+        self._symbols_since_flush = 0
+
+    def _get_state(self, mask: int) -> Optional[int]:
+        """
+        Returns the deterministic state of a subset, creating it if needed.
+        Returns ``None`` if creating it made the evaluator fall back.
+        """
+        state = self._state_ids.get(mask)
+
+        if state is None:
+            cost = self.STATE_COST + (mask.bit_length() + 7) // 8
+            if self._used + cost > self.memory_budget:
+                self._flush()
+                if self.using_fallback:
+                    return None
+
+            state = len(self._masks)
+            self._state_ids[mask] = state
+            self._masks.append(mask)
+            self._transitions.append(dict())
+            self._used += cost
+
+        return state
+
+    def _simulate(self, mask: int, symbol: str) -> int:
+        """Processes one symbol simulating the automaton."""
+        self._nfa.current_states = mask
+        self._nfa.process_symbol(symbol)
+        return self._nfa.current_states
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Process one symbol.
+
+        Args:
+            symbol: Symbol to consume.
+
+        """
+        self._symbols_since_flush += 1
+
+        if self.using_fallback:
+            self._mask = self._simulate(self._mask, symbol)
+            return
+
+        # Las transiciones se guardan por símbolo del alfabeto (o rango
+        # elemental), así que la tabla no crece con caracteres nuevos
+        atom = self.automaton.get_symbol_atom(symbol)
+        transitions = self._transitions[self._current]
+        target = transitions.get(atom)
+
+        if target is None:
+            # Transición aún no calculada: simulamos y la guardamos
+            mask = self._simulate(self._mask, symbol)
+            flushes = self.flushes
+            target = self._get_state(mask)
+
+            # Si ha habido un vaciado el estado de origen ya no existe
+            if target is not None and flushes == self.flushes:
+                if self._used + self.TRANSITION_COST > self.memory_budget:
+                    self._flush()
+                    target = None if self.using_fallback else self._get_state(mask)
+                else:
+                    transitions[atom] = target
+                    self._used += self.TRANSITION_COST
+
+            if target is None:
+                self._mask = mask
+                self._current = None
+                return
+
+        self._current = target
+        self._mask = self._masks[target]
+
+    def process_string(self, string: str) -> None:
+        """
+        Process a full string of symbols.
+
+        Args:
+            string: String to process.
+
+        """
+        for symbol in string:
+            if not self._mask:
+                return
+            self.process_symbol(symbol)
+
+    def is_accepting(self) -> bool:
+        """Check if the current state is an accepting one."""
+        return (self._mask & self._nfa.final_mask) != 0
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted without changing state.
+
+        Note: This function is NOT thread-safe.
+
+        """
+        old_states = self._mask
+        try:
+            self.process_string(string)
+            accepted = self.is_accepting()
+        finally:
+            self.current_states = old_states
+
+        return accepted
@@ -0,0 +1,242 @@
+"""Deterministic automata that match many regexes at once."""
+from collections import deque
+from typing import Deque, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from typing_extensions import Final
+
+from automata.automaton import (
+    FiniteAutomaton,
+    State,
+    SymbolRanges,
+    Transition,
+    _merge_range_transitions,
+)
+from automata.automaton_evaluator import BitsetAutomatonEvaluator
+from automata.compiled import CompiledAutomaton
+from automata.re_parser import REParser
+
+# Patrones aceptados en cada estado
+Tags = Dict[str, FrozenSet[int]]
+
+
+class MultiPatternDFA():
+    """
+    Minimal deterministic automaton of many regexes, whose states are
+    tagged with the patterns they accept.
+
+    The automata of the patterns are joined with lambdas from a new initial
+    state, and their final states are tagged with the pattern. The subset
+    construction tags every deterministic state with the patterns of its
+    states, and the minimization starts from the partition by tags (instead
+    of final / non final), so the tags are kept. The states that can't
+    reach any tag are removed, so a run stops (``DEAD``) as soon as no
+    pattern can match.
+
+    It has the interface of ``CompiledAutomaton`` (``initial``, ``step``,
+    ``run``, ``is_final``), so it can be used by ``StreamEvaluator``.
+
+    Args:
+        patterns: Regexes in Kleene notation.
+        priorities: Priority of each pattern (lower values are preferred).
+            By default, the position of the pattern.
+        construction: Construction used by ``REParser.create_automaton``.
+
+    Attributes:
+        automaton: Compiled minimal automaton.
+        tags: Patterns accepted in each state, sorted by priority.
+
+    """
+
+    DEAD: Final = CompiledAutomaton.DEAD
+
+    patterns: List[str]
+    priorities: List[int]
+    automaton: CompiledAutomaton
+    tags: List[Tuple[int, ...]]
+    initial: int
+
+    def __init__(
+        self,
+        patterns: Sequence[str],
+        priorities: Optional[Sequence[int]] = None,
+        construction: str = "thompson",
+    ) -> None:
+        if priorities is None:
+            priorities = range(len(patterns))
+        if len(priorities) != len(patterns):
+            raise ValueError("There must be a priority for each pattern")
+
+        self.patterns = list(patterns)
+        self.priorities = list(priorities)
+
+        nfa, nfa_tags = self._join(construction)
+        dfa, dfa_tags = self._determinize(nfa, nfa_tags)
+        minimal, minimal_tags = self._minimize(dfa, dfa_tags)
+
+        self.automaton = minimal.compile()
+        self.initial = self.automaton.initial
+        self.tags = [
+            tuple(sorted(minimal_tags[s.name], key=lambda p: (self.priorities[p], p)))
+            for s in minimal.states
+        ]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"patterns={self.patterns!r}, "
+            f"priorities={self.priorities!r})"
+        )
+
+    def _join(self, construction: str) -> Tuple[FiniteAutomaton, Dict[str, int]]:
+        """Joins the automata of the patterns, returning the pattern of each final state."""
+        parser = REParser()
+        initial = State("initial", False)
+        states = [initial]
+        tags: Dict[str, int] = dict()
+
+        for i, pattern in enumerate(self.patterns):
+            automaton = parser.create_automaton(pattern, construction)
+
+            # Renombramos los estados para que no choquen entre patrones
+            prefix = f"p{i}_"
+            for state in automaton.states:
+                renamed = State(prefix + state.name, state.is_final)
+                renamed.transitions = [
+                    Transition(t.symbol, prefix + t.state) for t in state.transitions
+                ]
+                if state.is_final:
+                    tags[renamed.name] = i
+                states.append(renamed)
+
+            initial.transitions.append(Transition(None, prefix + automaton.states[0].name))
+
+        return FiniteAutomaton(states), tags
+
+    @staticmethod
+    def _determinize(
+        nfa: FiniteAutomaton,
+        nfa_tags: Dict[str, int],
+    ) -> Tuple[FiniteAutomaton, Tags]:
+        """Subset construction (with bitmasks) keeping the patterns of every subset."""
+        evaluator = BitsetAutomatonEvaluator(nfa)
+        tag_bits = [
+            (1 << i, nfa_tags[s.name])
+            for i, s in enumerate(nfa.states) if s.name in nfa_tags
+        ]
+
+        subsets: Dict[int, State] = dict()
+        pending: List[int] = list()
+        tags: Tags = dict()
+
+        def get_state(subset: int) -> str:
+            state = subsets.get(subset)
+
+            if state is None:
+                patterns = frozenset(p for bit, p in tag_bits if subset & bit)
+                state = State("q" + str(len(subsets)), bool(patterns))
+                subsets[subset] = state
+                tags[state.name] = patterns
+                pending.append(subset)
+
+            return state.name
+
+        get_state(evaluator.current_states)
+
+        i = 0
+        while i < len(pending):
+            subset = pending[i]
+            transitions: List[Transition] = list()
+
+            for symbol_class in nfa.get_symbol_classes():
+                # El evaluador recibe caracteres: uno de la clase basta
+                symbol = symbol_class[0]
+                if isinstance(symbol, SymbolRanges):
+                    symbol = chr(symbol.ranges[0][0])
+
+                evaluator.current_states = subset
+                evaluator.process_symbol(symbol)
+                target = get_state(evaluator.current_states)
+                transitions.extend(Transition(s, target) for s in symbol_class)
+
+            subsets[subset].add_transitions(_merge_range_transitions(transitions))
+            i += 1
+
+        return FiniteAutomaton(list(subsets.values())), tags
+
+    @staticmethod
+    def _minimize(dfa: FiniteAutomaton, dfa_tags: Tags) -> Tuple[FiniteAutomaton, Tags]:
+        """
+        Minimizes starting from the partition by tags, and removes the
+        states from which no tagged state is reachable.
+        """
+        dfa._eliminate_inaccesible_states()
+
+        tag_classes: Dict[FrozenSet[int], int] = dict()
+        classes = [tag_classes.setdefault(dfa_tags[s.name], len(tag_classes)) for s in dfa.states]
+        classes = dfa._refine_classes(classes, "hopcroft")
+
+        states = dfa._get_deterministic_from_classes(classes)
+        tags: Tags = dict()
+        for state, c in zip(dfa.states, classes):
+            tags.setdefault("q" + str(c), dfa_tags[state.name])
+
+        # Estados vivos: los que llegan a algún estado etiquetado
+        predecessors: Dict[str, Set[str]] = {s.name: set() for s in states}
+        for state in states:
+            for t in state.transitions:
+                predecessors[t.state].add(state.name)
+
+        live: Set[str] = {s.name for s in states if tags[s.name]}
+        to_visit: Deque[str] = deque(live)
+        while to_visit:
+            for name in predecessors[to_visit.popleft()]:
+                if name not in live:
+                    live.add(name)
+                    to_visit.append(name)
+
+        # El estado inicial se mantiene aunque no reconozca ningún patrón
+        kept = [s for i, s in enumerate(states) if i == 0 or s.name in live]
+        for state in kept:
+            state.transitions = [t for t in state.transitions if t.state in live]
+
+        return FiniteAutomaton(kept), tags
+
+    def step(self, state: int, symbol: str) -> int:
+        """Return the state reached from ``state`` consuming one symbol."""
+        return self.automaton.step(state, symbol)
+
+    def run(self, state: int, string: str) -> int:
+        """Return the state reached from ``state`` consuming a full string."""
+        return self.automaton.run(state, string)
+
+    def is_final(self, state: int) -> bool:
+        """Check if any pattern is accepted in a state."""
+        return self.automaton.is_final(state)
+
+    def matches(self, string: str) -> Tuple[int, ...]:
+        """
+        Return all the patterns that match a full string, with one pass.
+
+        Args:
+            string: String to check.
+
+        Returns:
+            Indexes of the matching patterns, sorted by priority.
+
+        """
+        state = self.automaton.run(self.initial, string)
+        return self.tags[state] if state >= 0 else ()
+
+    def best_match(self, string: str) -> Optional[int]:
+        """
+        Return the preferred pattern that matches a full string.
+
+        Args:
+            string: String to check.
+
+        Returns:
+            Index of the pattern with the best priority, or ``None``.
+
+        """
+        tags = self.matches(string)
+        return tags[0] if tags else None
@@ -0,0 +1,108 @@
+"""Parallel matching of large corpora with a pool of processes."""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Optional, Union
+
+from automata.automaton import FiniteAutomaton
+from automata.compiled import CompiledAutomaton
+
+# Autómata de cada proceso trabajador (se envía una sola vez, al arrancar)
+_worker_automaton: Optional[CompiledAutomaton] = None
+
+
+def _init_worker(automaton: CompiledAutomaton) -> None:
+    global _worker_automaton
+    _worker_automaton = automaton
+
+
+def _match_chunk(chunk: List[str]) -> List[bool]:
+    return _worker_automaton.accepts_many(chunk)
+
+
+def _split_chunks(strings: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    iterator = iter(strings)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def match_parallel(
+    automaton: Union[FiniteAutomaton, CompiledAutomaton],
+    strings: Iterable[str],
+    chunk_size: int = 10000,
+    max_workers: Optional[int] = None,
+) -> Iterator[bool]:
+    """
+    Check the acceptance of many strings using a pool of processes.
+
+    The compiled automaton is sent once to every worker, and the input is
+    split in chunks that are matched with ``accepts_many``. Only a few
+    chunks per worker are in flight at the same time, so the input can be
+    an arbitrarily long iterator.
+
+    Args:
+        automaton: Automaton to match (it's compiled if needed).
+        strings: Strings to check.
+        chunk_size: Number of strings sent to a worker at once.
+        max_workers: Number of processes (by default, one per CPU).
+
+    Returns:
+        Iterator with the acceptance of each string, in input order.
+
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be positive")
+
+    if isinstance(automaton, FiniteAutomaton):
+        automaton = automaton.compile()
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(automaton,),
+    ) as executor:
+        max_pending = 2 * max_workers
+        pending: Deque[Future] = deque()
+
+        for chunk in _split_chunks(strings, chunk_size):
+            pending.append(executor.submit(_match_chunk, chunk))
+
+            # Devolvemos en orden los resultados de los primeros trozos
+            while len(pending) >= max_pending:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def match_file_parallel(
+    automaton: Union[FiniteAutomaton, CompiledAutomaton],
+    path: str,
+    encoding: str = "utf-8",
+    chunk_size: int = 10000,
+    max_workers: Optional[int] = None,
+) -> Iterator[bool]:
+    """
+    Check the acceptance of every line of a text file in parallel.
+
+    Args:
+        automaton: Automaton to match (it's compiled if needed).
+        path: Path of the file, read lazily line by line.
+        encoding: Encoding of the file.
+        chunk_size: Number of lines sent to a worker at once.
+        max_workers: Number of processes (by default, one per CPU).
+
+    Returns:
+        Iterator with the acceptance of each line (without the line
+        terminator), in file order.
+
+    """
+    with open(path, encoding=encoding, newline="") as file:
+        lines = (line.rstrip("\r\n") for line in file)
+        yield from match_parallel(automaton, lines, chunk_size, max_workers)
@@ -0,0 +1,284 @@
+"""Boolean operations on automata with lazily built products."""
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Sequence, Tuple, Union
+
+from typing_extensions import Final
+
+from automata.automaton import FiniteAutomaton
+from automata.compiled import CompiledAutomaton
+
+Operand = Union[FiniteAutomaton, 'ProductAutomaton']
+
+
+class ProductAutomaton():
+    """
+    Product of deterministic automata, built only when it's visited.
+
+    Every state is a tuple with a state of each operand, and it's numbered
+    the first time a transition reaches it, so only the reachable part of
+    the product is ever built. The states of the operands that can't reach
+    a final state are replaced by ``DEAD``, so useless tuples are pruned.
+    The transitions are cached by ASCII symbol, and any other symbol by the
+    classes it has in the operands, so the cache is bounded by the
+    alphabets and not by the text.
+
+    It has the same interface as ``CompiledAutomaton`` (``initial``,
+    ``step``, ``run``, ``is_final`` and ``DEAD``), so evaluators like
+    ``StreamEvaluator`` or ``Scanner`` can use it directly, and products can
+    be operands of other products. ``ProductEvaluator`` gives it the
+    interface of ``FiniteAutomatonEvaluator``.
+
+    The operations are:
+
+        - ``"intersection"``: strings accepted by all the operands.
+        - ``"union"``: strings accepted by any operand.
+        - ``"difference"``: strings accepted by the first operand and by
+          none of the others.
+        - ``"complement"``: strings (over any alphabet) not accepted by
+          its only operand.
+
+    Args:
+        operation: Boolean operation.
+        operands: Automata to combine (they are compiled if needed).
+
+    """
+
+    DEAD: Final = -1
+
+    initial: int
+    operation: str
+    operands: List[Operand]
+
+    _OPERATIONS: Tuple[str, ...] = ("intersection", "union", "difference", "complement")
+
+    def __init__(self, operation: str, operands: Sequence[Operand]) -> None:
+        if operation not in self._OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation}")
+
+        if operation == "complement" and len(operands) != 1:
+            raise ValueError("The complement has exactly one operand")
+
+        if not operands:
+            raise ValueError("There must be at least one operand")
+
+        self.operation = operation
+        self.operands = list(operands)
+        self._matchers = [operand.compile() for operand in self.operands]
+        self._hopeless = [m.get_hopeless_states() for m in self._matchers]
+
+        # Estados creados: tupla de estados de los operandos <-> número
+        self._ids: Dict[Tuple[int, ...], int] = dict()
+        self._components: List[Tuple[int, ...]] = list()
+        self._finals: List[bool] = list()
+        self._transitions: List[Dict[Hashable, int]] = list()
+
+        self.initial = self._get_state(self._prune(m.initial for m in self._matchers))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"{self.operation!r}, "
+            f"operands={self.operands!r})"
+        )
+
+    @property
+    def n_states(self) -> int:
+        """Number of states built so far."""
+        return len(self._components)
+
+    def _prune(self, components: Iterable[int]) -> Tuple[int, ...]:
+        """Replaces the states of the operands that can't accept by ``DEAD``."""
+        return tuple(
+            self.DEAD if c in hopeless else c
+            for c, hopeless in zip(components, self._hopeless)
+        )
+
+    def get_column(self, symbol: str) -> Hashable:
+        """Return the classes of a symbol in the operands (equal classes, equal transitions)."""
+        return tuple(m.get_column(symbol) for m in self._matchers)
+
+    def get_hopeless_states(self) -> FrozenSet[int]:
+        """The tuples that can't accept are already ``DEAD``, so there are none."""
+        return frozenset()
+
+    def _is_dead(self, components: Tuple[int, ...]) -> bool:
+        """Check if no string can be accepted from a tuple of states."""
+        dead = CompiledAutomaton.DEAD
+
+        if self.operation == "intersection":
+            return dead in components
+        if self.operation == "union":
+            return all(c == dead for c in components)
+        if self.operation == "difference":
+            return components[0] == dead
+
+        # El complementario de un estado muerto lo acepta todo
+        return False
+
+    def _is_accepting(self, components: Tuple[int, ...]) -> bool:
+        finals = [m.is_final(c) for m, c in zip(self._matchers, components)]
+
+        if self.operation == "intersection":
+            return all(finals)
+        if self.operation == "union":
+            return any(finals)
+        if self.operation == "difference":
+            return finals[0] and not any(finals[1:])
+
+        return not finals[0]
+
+    def _get_state(self, components: Tuple[int, ...]) -> int:
+        if self._is_dead(components):
+            return self.DEAD
+
+        state = self._ids.get(components)
+
+        if state is None:
+            state = len(self._components)
+            self._ids[components] = state
+            self._components.append(components)
+            self._finals.append(self._is_accepting(components))
+            self._transitions.append(dict())
+
+        return state
+
+    def step(self, state: int, symbol: str) -> int:
+        """
+        Return the state reached from ``state`` consuming one symbol.
+
+        Args:
+            state: Current state (it may be ``DEAD``).
+            symbol: Symbol to consume.
+
+        Returns:
+            Next state, ``DEAD`` if no string can be accepted any more.
+
+        """
+        if state < 0:
+            return self.DEAD
+
+        # Los símbolos ASCII se guardan tal cual y el resto por sus clases
+        key = symbol if symbol < "\x80" else self.get_column(symbol)
+        transitions = self._transitions[state]
+        target = transitions.get(key)
+
+        if target is None:
+            target = self._get_state(self._prune(
+                m.step(c, symbol)
+                for m, c in zip(self._matchers, self._components[state])
+            ))
+            transitions[key] = target
+
+        return target
+
+    def run(self, state: int, string: str) -> int:
+        """
+        Return the state reached from ``state`` consuming a full string.
+
+        Args:
+            state: Current state (it may be ``DEAD``).
+            string: String to consume.
+
+        Returns:
+            Reached state, ``DEAD`` as soon as no string can be accepted.
+
+        """
+        transitions = self._transitions
+
+        for symbol in string:
+            if state < 0:
+                break
+
+            target = transitions[state].get(symbol)
+            state = self.step(state, symbol) if target is None else target
+
+        return state
+
+    def is_final(self, state: int) -> bool:
+        """Check if a state is a final one."""
+        return state >= 0 and self._finals[state]
+
+    def accepts(self, string: str) -> bool:
+        """Return if a string is accepted."""
+        return self.is_final(self.run(self.initial, string))
+
+    def accepts_many(self, strings: Iterable[str]) -> List[bool]:
+        """Return which strings are accepted."""
+        return [self.accepts(s) for s in strings]
+
+    def compile(self) -> 'ProductAutomaton':
+        """The product is already evaluated as a table, so it's returned as is."""
+        return self
+
+    def to_reversed(self) -> 'ProductAutomaton':
+        """
+        Return the product of the reversed operands, which accepts the
+        reversed strings (the reversal commutes with boolean operations).
+        """
+        return ProductAutomaton(
+            self.operation,
+            [operand.to_reversed() for operand in self.operands],
+        )
+
+    def intersection(self, *others: Operand) -> 'ProductAutomaton':
+        """Return the lazy intersection with other automata."""
+        return ProductAutomaton("intersection", [self, *others])
+
+    def union(self, *others: Operand) -> 'ProductAutomaton':
+        """Return the lazy union with other automata."""
+        return ProductAutomaton("union", [self, *others])
+
+    def difference(self, *others: Operand) -> 'ProductAutomaton':
+        """Return the lazy difference with other automata."""
+        return ProductAutomaton("difference", [self, *others])
+
+    def complement(self) -> 'ProductAutomaton':
+        """Return the lazy complement."""
+        return ProductAutomaton("complement", [self])
+
+
+class ProductEvaluator():
+    """
+    Evaluator of a lazy product with the interface of ``FiniteAutomatonEvaluator``.
+
+    Args:
+        product: Product to evaluate.
+
+    Attributes:
+        current_state: Current state of the product (it may be ``DEAD``).
+
+    """
+
+    product: ProductAutomaton
+    current_state: int
+
+    def __init__(self, product: ProductAutomaton) -> None:
+        self.product = product
+        self.current_state = product.initial
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Process one symbol.
+
+        Args:
+            symbol: Symbol to consume.
+
+        """
+        self.current_state = self.product.step(self.current_state, symbol)
+
+    def process_string(self, string: str) -> None:
+        """
+        Process a full string of symbols.
+
+        Args:
+            string: String to process.
+
+        """
+        self.current_state = self.product.run(self.current_state, string)
+
+    def is_accepting(self) -> bool:
+        """Check if the current state is an accepting one."""
+        return self.product.is_final(self.current_state)
+
+    def accepts(self, string: str) -> bool:
+        """Return if a string is accepted without changing state."""
+        return self.product.is_final(self.product.run(self.current_state, string))
@@ -1,55 +1,70 @@
 """Conversion from regex to automata."""
-from typing import List, Tuple
+import re
+from typing import List, Optional, Set, Tuple
 
-from automata.automaton import FiniteAutomaton, State, Transition
+from typing_extensions import Final
 
+from automata.automaton import FiniteAutomaton, State, Symbol, SymbolRanges, Transition
 
-def _re_to_rpn(re_string: str) -> str:
+# Una clase de símbolos entre corchetes ([a-z]) o un único carácter
+_re_token: Final = re.compile(r"\[(?:\\.|[^\\\]])+\]|.", re.DOTALL)
+
+
+def _re_to_rpn(re_string: str) -> List[str]:
     """
     Convert re to reverse polish notation (RPN).
 
-    Does not check that the input re is syntactically correct.
+    Does not check that the input re is syntactically correct. A class of
+    symbols between brackets, like ``[a-z]``, is a single token.
 
     Args:
         re_string: Regular expression in infix notation.
 
     Returns:
-        Regular expression in reverse polish notation.
+        Tokens of the regular expression in reverse polish notation.
 
     """
     stack: List[str] = []
-    rpn_string = ""
-    for x in re_string:
+    rpn: List[str] = []
+    for x in _re_token.findall(re_string):
         if x == "+":
             while len(stack) > 0 and stack[-1] != "(":
-                rpn_string += stack.pop()
+                rpn.append(stack.pop())
             stack.append(x)
         elif x == ".":
             while len(stack) > 0 and stack[-1] == ".":
-                rpn_string += stack.pop()
+                rpn.append(stack.pop())
             stack.append(x)
         elif x == "(":
             stack.append(x)
         elif x == ")":
             while stack[-1] != "(":
-                rpn_string += stack.pop()
+                rpn.append(stack.pop())
             stack.pop()
         else:
-            rpn_string += x
+            rpn.append(x)
 
     while len(stack) > 0:
-        rpn_string += stack.pop()
+        rpn.append(stack.pop())
+
+    return rpn
+
 
-    return rpn_string
+def _token_symbol(token: str) -> Symbol:
+    """Returns the symbol of a token: a character or the ranges of a class."""
+    return SymbolRanges.parse(token) if len(token) > 1 else token
 
 
 class REParser():
     """Class for processing regular expressions in Kleene's syntax."""
 
     state_counter: int
+    # Compilador por derivadas (se crea bajo demanda y conserva su memoización)
+    _derivative_compiler: Optional['DerivativeCompiler']
 
     def __init__(self) -> None:
         self.state_counter = 0
+        self._derivative_compiler = None
 
     def _create_terminal_states(self) -> Tuple[State, State]:
         """
@@ -109,13 +124,13 @@ class REParser():
 
     def _create_automaton_symbol(
         self,
-        symbol: str,
+        symbol: Symbol,
     ) -> FiniteAutomaton:
         """
         Create an automaton that accepts one symbol.
 
         Args:
-            symbol: Symbol that the automaton should accept.
+            symbol: Symbol (or ranges of symbols) that the automaton should accept.
 
         Returns:
             Automaton that accepts a symbol.
@@ -262,28 +277,118 @@ class REParser():
         return FiniteAutomaton(states)
         # ---------------------------------------------------------------------
 
+    def _create_automaton_glushkov(
+        self,
+        rpn: List[str],
+    ) -> FiniteAutomaton:
+        """
+        Create a lambda free automaton with Glushkov's construction.
+
+        There is one state for each occurrence of a symbol in the regex
+        (its position) plus the initial state. The transitions are computed
+        from the first, last and follow positions of every subexpression.
+
+        Args:
+            rpn: Tokens of the regular expression in reverse polish notation.
+
+        Returns:
+            Position automaton equivalent to the regex.
+
+        """
+        # Para cada subexpresión: (anulable, primeras posiciones, últimas posiciones)
+        stack: List[Tuple[bool, Set[int], Set[int]]] = []
+        # Símbolo y siguientes de cada posición
+        symbols: List[Symbol] = []
+        follow: List[Set[int]] = []
+
+        for x in rpn:
+            if x == "*":
+                _, first, last = stack.pop()
+                for p in last:
+                    follow[p].update(first)
+                stack.append((True, first, last))
+            elif x == "+":
+                nullable2, first2, last2 = stack.pop()
+                nullable1, first1, last1 = stack.pop()
+                stack.append((nullable1 or nullable2, first1 | first2, last1 | last2))
+            elif x == ".":
+                nullable2, first2, last2 = stack.pop()
+                nullable1, first1, last1 = stack.pop()
+                for p in last1:
+                    follow[p].update(first2)
+                stack.append((
+                    nullable1 and nullable2,
+                    first1 | first2 if nullable1 else first1,
+                    last1 | last2 if nullable2 else last2,
+                ))
+            elif x == "λ":
+                stack.append((True, set(), set()))
+            else:
+                symbols.append(_token_symbol(x))
+                follow.append(set())
+                stack.append((False, {len(symbols) - 1}, {len(symbols) - 1}))
+
+        nullable, first, last = stack.pop()
+
+        # El estado de la posición p es 'state<p + 1>'
+        initial_state = State('state0', nullable)
+        states = [initial_state] + [
+            State('state' + str(p + 1), p in last) for p in range(len(symbols))
+        ]
+        self.state_counter = len(states)
+
+        initial_state.add_transitions(
+            [Transition(symbols[q], states[q + 1].name) for q in first])
+
+        for p in range(len(symbols)):
+            states[p + 1].add_transitions(
+                [Transition(symbols[q], states[q + 1].name) for q in follow[p]])
+
+        return FiniteAutomaton(states)
+
+    _CONSTRUCTIONS: Tuple[str, ...] = ("thompson", "glushkov", "derivatives")
+
     def create_automaton(
         self,
         re_string: str,
+        construction: str = "thompson",
     ) -> FiniteAutomaton:
         """
         Create an automaton from a regex.
 
         Args:
             re_string: String with the regular expression in Kleene notation.
+            construction: ``"thompson"`` (default) for the construction with
+                lambda transitions, ``"glushkov"`` for the lambda free
+                position automaton, with one state per symbol occurrence, or
+                ``"derivatives"`` for a deterministic automaton built directly
+                with Brzozowski derivatives (see ``automata.derivatives``).
 
         Returns:
             Automaton equivalent to the regex.
 
         """
+        if construction not in self._CONSTRUCTIONS:
+            raise ValueError(f"Unknown construction: {construction}")
+
+        if construction == "derivatives":
+            from automata.derivatives import DerivativeCompiler
+
+            if self._derivative_compiler is None:
+                self._derivative_compiler = DerivativeCompiler()
+            return self._derivative_compiler.create_automaton(re_string)
+
         if not re_string:
             return self._create_automaton_empty()
 
-        rpn_string = _re_to_rpn(re_string)
+        rpn = _re_to_rpn(re_string)
+
+        if construction == "glushkov":
+            return self._create_automaton_glushkov(rpn)
 
         stack: List[FiniteAutomaton] = []
         self.state_counter = 0
-        for x in rpn_string:
+        for x in rpn:
             if x == "*":
                 aut = stack.pop()
                 stack.append(self._create_automaton_star(aut))
@@ -298,6 +403,6 @@ class REParser():
             elif x == "λ":
                 stack.append(self._create_automaton_lambda())
             else:
-                stack.append(self._create_automaton_symbol(x))
+                stack.append(self._create_automaton_symbol(_token_symbol(x)))
         
         return stack.pop()
@@ -0,0 +1,230 @@
+"""Search of the matches of an automaton inside a text."""
+from typing import Dict, FrozenSet, Iterator, List, Set, Tuple
+
+from automata.automaton import FiniteAutomaton
+from automata.compiled import CompiledAutomaton
+
+
+class _SearchAutomaton():
+    """
+    Deterministic automaton for ``.*P`` built lazily from the one of ``P``.
+
+    Every state is the set of states of the runs of ``P`` started at any
+    previous position, so adding the initial state after each step is the
+    ``.*`` prefix. States and transitions are created only when visited.
+    """
+
+    def __init__(self, automaton: CompiledAutomaton) -> None:
+        self.automaton = automaton
+        self._ids: Dict[FrozenSet[int], int] = dict()
+        self._sets: List[FrozenSet[int]] = list()
+        self._finals: List[bool] = list()
+        self._transitions: List[Dict[str, int]] = list()
+        self.initial = self._get_state(frozenset({automaton.initial}))
+
+    def _get_state(self, subset: FrozenSet[int]) -> int:
+        state = self._ids.get(subset)
+
+        if state is None:
+            state = len(self._sets)
+            self._ids[subset] = state
+            self._sets.append(subset)
+            self._finals.append(any(self.automaton.is_final(q) for q in subset))
+            self._transitions.append(dict())
+
+        return state
+
+    def step(self, state: int, symbol: str) -> int:
+        target = self._transitions[state].get(symbol)
+
+        if target is None:
+            automaton = self.automaton
+            reached = {automaton.step(q, symbol) for q in self._sets[state]}
+            reached.discard(automaton.DEAD)
+            reached.add(automaton.initial)
+
+            target = self._get_state(frozenset(reached))
+            self._transitions[state][symbol] = target
+
+        return target
+
+    def is_final(self, state: int) -> bool:
+        return self._finals[state]
+
+
+class Scanner():
+    """
+    Finds the leftmost-longest non-overlapping matches of an automaton.
+
+    First the text is run backwards once with the (lazily built) reversed
+    ``.*P`` automaton, which marks every position where a match starts.
+    Then a single forward pass runs the deterministic automaton of ``P``
+    from every marked position at once. When two runs reach the same state
+    they share the rest of the text, so only the leftmost one goes on and
+    the other is linked to it (with the position of the union), and the
+    longest end of each match is recovered from those links. There are at
+    most as many runs as states, so the whole search is linear in the
+    length of the text (times the number of states).
+
+    Args:
+        automaton: Automaton of the pattern. It can also be a lazy product
+            (see ``automata.product``), which is never materialized.
+
+    """
+
+    forward: CompiledAutomaton
+    reverse: CompiledAutomaton
+
+    def __init__(self, automaton: FiniteAutomaton) -> None:
+        self.forward = automaton.compile()
+        self.reverse = automaton.to_reversed().compile()
+        self._reverse_search = _SearchAutomaton(self.reverse)
+        self._hopeless = self.forward.get_hopeless_states()
+
+    def _match_starts(self, text: str, pos: int) -> bytearray:
+        """Returns a flag for each position of ``text[pos:]`` where a match starts."""
+        search = self._reverse_search
+        starts = bytearray(len(text) - pos + 1)
+
+        state = search.initial
+        starts[-1] = search.is_final(state)
+        for i in range(len(text) - 1, pos - 1, -1):
+            state = search.step(state, text[i])
+            starts[i - pos] = search.is_final(state)
+
+        return starts
+
+    def finditer(self, text: str, pos: int = 0) -> Iterator[Tuple[int, int]]:
+        """
+        Find all the non-overlapping matches, from left to right.
+
+        As in ``re.finditer``, empty matches are allowed (also right after
+        a previous match).
+
+        Args:
+            text: Text to search.
+            pos: Position where the search starts.
+
+        Returns:
+            Iterator of ``(start, end)`` spans of the matches.
+
+        """
+        starts = self._match_starts(text, pos)
+        forward = self.forward
+        step = forward.step
+        is_final = forward.is_final
+        initial = forward.initial
+        hopeless = self._hopeless
+
+        # Cada inicio marcado es un nodo. En cada estado vivo solo sigue el
+        # hilo del inicio más a la izquierda: el otro se enlaza a él con el
+        # instante de la unión, porque desde ahí comparten los finales
+        links: Dict[int, Tuple[int, int]] = dict()
+        roots: Dict[int, int] = dict()
+        last: Dict[int, int] = dict()
+        ends: Dict[int, int] = dict()
+        threads: Dict[int, int] = dict()
+        live: Set[int] = set()
+
+        def add_start(position: int) -> None:
+            last[position] = position if is_final(initial) else -1
+            other = threads.get(initial)
+
+            if other is None:
+                threads[initial] = position
+                live.add(position)
+            else:
+                links[position] = (other, position)
+                roots[position] = other
+
+        def find_root(node: int) -> int:
+            while node in roots:
+                parent = roots[node]
+                if parent in roots:
+                    roots[node] = roots[parent]
+                node = parent
+            return node
+
+        def longest(node: int) -> int:
+            # Todos los hilos de la cadena del nodo deben haber muerto
+            path = list()
+            while node not in ends and node in links:
+                path.append(node)
+                node = links[node][0]
+            end = ends.setdefault(node, last[node])
+
+            for child in reversed(path):
+                # Los finales del padre solo cuentan si son tras la unión
+                if end < links[child][1]:
+                    end = last[child]
+                ends[child] = end
+
+            return end
+
+        found = starts.find(1)
+        if found == -1:
+            return
+
+        start = position = pos + found
+        add_start(position)
+
+        while True:
+            # Devolvemos los matches cuyos hilos ya no pueden alargarse
+            while position == len(text) or find_root(start) not in live:
+                end = longest(start)
+                yield start, end
+
+                found = starts.find(1, (end if end > start else end + 1) - pos)
+                if found == -1:
+                    return
+                start = pos + found
+
+                if start > position:
+                    # Ningún hilo actual llega al siguiente inicio
+                    for table in (links, roots, last, ends, threads):
+                        table.clear()
+                    live.clear()
+                    position = start
+                    add_start(position)
+
+            symbol = text[position]
+            position += 1
+            reached: Dict[int, int] = dict()
+
+            for state, node in threads.items():
+                target = step(state, symbol)
+                if target == forward.DEAD or target in hopeless:
+                    live.discard(node)
+                    continue
+
+                other = reached.get(target)
+                if other is None:
+                    reached[target] = node
+                else:
+                    older, newer = (other, node) if other < node else (node, other)
+                    reached[target] = older
+                    links[newer] = (older, position)
+                    roots[newer] = older
+                    live.discard(newer)
+
+            threads = reached
+            for state, node in threads.items():
+                if is_final(state):
+                    last[node] = position
+
+            if starts[position - pos]:
+                add_start(position)
+
+    def findall(self, text: str, pos: int = 0) -> List[str]:
+        """
+        Find the text of all the non-overlapping matches.
+
+        Args:
+            text: Text to search.
+            pos: Position where the search starts.
+
+        Returns:
+            List with the matched substrings.
+
+        """
+        return [text[start:end] for start, end in self.finditer(text, pos)]
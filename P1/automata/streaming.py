@@ -0,0 +1,156 @@
+"""Evaluation of automata over streams (files, mmaps and iterators of chunks)."""
+import codecs
+from typing import Iterable, Iterator, Union
+
+from automata.automaton import FiniteAutomaton
+from automata.compiled import CompiledAutomaton
+
+Chunk = Union[bytes, bytearray, memoryview, str]
+Source = Union[Chunk, Iterable[Chunk]]
+
+
+class StreamEvaluator():
+    """
+    Evaluator of a deterministic automaton over a stream of chunks.
+
+    Only the current state (and a few undecoded bytes, for multibyte
+    characters split between chunks) is kept, so the memory used doesn't
+    depend on the size of the input.
+
+    Args:
+        automaton: Automaton to evaluate (it's compiled if needed). Any object
+            with ``initial``, ``run`` and ``is_final`` like
+            ``CompiledAutomaton`` can be used.
+        encoding: Encoding used to decode binary chunks.
+        chunk_size: Size of the chunks read from files and buffers.
+
+    Attributes:
+        current_state: Current state of the automaton.
+
+    """
+
+    automaton: CompiledAutomaton
+    encoding: str
+    chunk_size: int
+    current_state: int
+
+    def __init__(
+        self,
+        automaton: Union[FiniteAutomaton, CompiledAutomaton],
+        encoding: str = "utf-8",
+        chunk_size: int = 1 << 16,
+    ) -> None:
+        if isinstance(automaton, FiniteAutomaton):
+            automaton = automaton.compile()
+
+        self.automaton = automaton
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self.reset()
+
+    def reset(self) -> None:
+        """Go back to the initial state, discarding pending bytes."""
+        self.current_state = self.automaton.initial
+        self._decoder = codecs.getincrementaldecoder(self.encoding)()
+
+    def _decode(self, chunk: Chunk, final: bool = False) -> str:
+        if isinstance(chunk, str):
+            return chunk
+
+        return self._decoder.decode(chunk, final)
+
+    def _iter_chunks(self, source: Source) -> Iterator[Chunk]:
+        """Splits the source (file, mmap, buffer or iterator) in chunks."""
+        if isinstance(source, (str, bytes, bytearray, memoryview)):
+            # Los memoryview se trocean sin copiar
+            if not isinstance(source, str):
+                source = memoryview(source)
+            for i in range(0, len(source), self.chunk_size):
+                yield source[i:i + self.chunk_size]
+
+        elif hasattr(source, "read"):
+            # Ficheros (binarios o de texto) y mmap
+            chunk = source.read(self.chunk_size)
+            while chunk:
+                yield chunk
+                chunk = source.read(self.chunk_size)
+
+        else:
+            yield from source
+
+    def feed(self, chunk: Chunk) -> None:
+        """
+        Process one chunk of the input.
+
+        Args:
+            chunk: Text, or bytes to be decoded with the evaluator encoding.
+
+        """
+        self.current_state = self.automaton.run(self.current_state, self._decode(chunk))
+
+    def is_accepting(self) -> bool:
+        """Check if the current state is an accepting one."""
+        return self.automaton.is_final(self.current_state)
+
+    def accepts(self, source: Source) -> bool:
+        """
+        Return if the full stream is accepted.
+
+        Args:
+            source: Binary or text file, mmap, buffer or iterator of chunks.
+
+        Raises:
+            UnicodeDecodeError: if the stream ends in the middle of a character.
+
+        """
+        self.reset()
+        for chunk in self._iter_chunks(source):
+            self.feed(chunk)
+
+        self.feed(self._decode(b"", final=True))
+        return self.is_accepting()
+
+    def match_records(self, source: Source, separator: str = "\n") -> Iterator[bool]:
+        """
+        Return if each record of the stream is accepted.
+
+        The separator is not part of the records, and an empty record after
+        the last separator is not reported (as with ``str.splitlines``).
+
+        Args:
+            source: Binary or text file, mmap, buffer or iterator of chunks.
+            separator: Character that ends every record.
+
+        Returns:
+            Iterator with the acceptance of each record, in order.
+
+        """
+        if len(separator) != 1:
+            raise ValueError("The separator must be a single character")
+
+        automaton = self.automaton
+        self.reset()
+        pending_record = False
+
+        def pieces() -> Iterator[str]:
+            for chunk in self._iter_chunks(source):
+                yield self._decode(chunk)
+            yield self._decode(b"", final=True)
+
+        for text in pieces():
+            if not text:
+                continue
+
+            records = text.split(separator)
+
+            # Todos los trozos menos el último terminan un registro
+            for record in records[:-1]:
+                self.current_state = automaton.run(self.current_state, record)
+                yield automaton.is_final(self.current_state)
+                self.current_state = automaton.initial
+
+            self.current_state = automaton.run(self.current_state, records[-1])
+            pending_record = len(records[-1]) > 0 or (pending_record and len(records) == 1)
+
+        if pending_record:
+            yield self.is_accepting()
@@ -0,0 +1,88 @@
+"""Test the cache of compiled regexes."""
+import tempfile
+import threading
+import unittest
+
+from automata.cache import CompileCache
+
+
+class TestCompileCache(unittest.TestCase):
+    """Tests for the memory and disk layers."""
+
+    def test_memory(self) -> None:
+        """Test hits, misses and the LRU eviction."""
+        cache = CompileCache(max_size=2)
+
+        compiled = cache.get("a.b*")
+        self.assertTrue(compiled.accepts("abbb"))
+        self.assertIs(cache.get("a.b*"), compiled)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        cache.get("a.b*", "glushkov")
+        cache.get("c")
+        cache.get("a.b*", "glushkov")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+        # La menos usada ("a.b*" con Thompson) ya no está en memoria
+        self.assertIsNot(cache.get("a.b*"), compiled)
+        self.assertEqual(cache.misses, 4)
+
+        with self.assertRaises(ValueError):
+            cache.get("a", "unknown")
+
+    def test_immutable(self) -> None:
+        """Test that the cached automata can't be modified."""
+        compiled = CompileCache().get("(a+b)*.a")
+
+        with self.assertRaises(TypeError):
+            compiled.table[0] = 0
+        with self.assertRaises(TypeError):
+            compiled.accepting[0] = 1
+
+    def test_shared_between_threads(self) -> None:
+        """Test batches while other threads memoize symbols found in ranges."""
+        compiled = CompileCache().get("[\\u0100-\\uffff]*.a")
+        strings = [chr(0x4E00 + i) + "a" for i in range(200)] + ["b"]
+        expected = [True] * 200 + [False]
+
+        def memoize(first: int) -> None:
+            for i in range(first, first + 20000):
+                compiled.accepts(chr(0x100 + i % 0xF000))
+
+        workers = [threading.Thread(target=memoize, args=(i * 20000,)) for i in range(2)]
+        for worker in workers:
+            worker.start()
+        results = list()
+        for _ in range(20):
+            # Reconstruimos las tablas de NumPy mientras symbol_index crece
+            compiled._np_tables = None
+            results.append(list(compiled.accepts_many(strings)))
+        for worker in workers:
+            worker.join()
+
+        self.assertTrue(all(result == expected for result in results))
+
+    def test_disk(self) -> None:
+        """Test that other caches load the compiled automata from disk."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = CompileCache(directory=directory)
+            compiled = cache.get("[a-z].[a-z0-9]*")
+
+            other = CompileCache(directory=directory)
+            loaded = other.get("[a-z].[a-z0-9]*")
+
+            self.assertEqual((other.disk_hits, other.misses), (1, 0))
+            self.assertEqual(loaded.symbol_classes, compiled.symbol_classes)
+            self.assertTrue(loaded.accepts("x1"))
+            self.assertFalse(loaded.accepts("1x"))
+
+            other.clear()
+            other.get("[a-z].[a-z0-9]*")
+            self.assertEqual(other.disk_hits, 2)
+
+            del compiled, loaded
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Test the generated Python matchers."""
+import inspect
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.codegen import compile_matcher, generate_source
+from automata.re_parser import REParser
+
+
+class TestCodegen(unittest.TestCase):
+    """Tests for the code generator."""
+
+    def _check_matcher(self, automaton: FiniteAutomaton, strings) -> None:
+        compiled = automaton.compile()
+        matcher = compile_matcher(automaton)
+
+        for string in strings:
+            with self.subTest(string=string):
+                self.assertEqual(matcher(string), compiled.accepts(string))
+
+    def test_matcher(self) -> None:
+        """Test a matcher against the compiled automaton."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        automaton = REParser().create_automaton(f"({num}.{num}*.,.{num}*)+{num}*")
+
+        self._check_matcher(
+            automaton,
+            [",", "1,7", "", "25,73", "5027", ",13", "13,", "3,7,12", "1a", "ñ,3"],
+        )
+
+    def test_ranges(self) -> None:
+        """Test a matcher with ranges of symbols."""
+        automaton = REParser().create_automaton("[a-zA-Z_].[a-zA-Z_0-9]*+[α-ω]")
+
+        self._check_matcher(automaton, ["x", "_a9", "9", "β", "ββ", "aβ", "", "日本"])
+
+    def test_bounded_class_map(self) -> None:
+        """Test that the translate table doesn't grow with the input."""
+        automaton = REParser().create_automaton("[\\u4e00-\\u9fff]*.a")
+        matcher = compile_matcher(automaton)
+        classes = inspect.signature(matcher).parameters["_classes"].default
+        size = len(classes)
+
+        # Símbolos fuera del alfabeto: no se guardan
+        self.assertFalse(matcher("".join(chr(code) for code in range(0xA000, 0x20000))))
+        self.assertEqual(len(classes), size)
+
+        # Símbolos de los rangos: se guardan solo hasta el límite
+        self.assertTrue(matcher("".join(chr(code) for code in range(0x4E00, 0xA000)) + "a"))
+        self.assertLessEqual(len(classes), size + (1 << 12))
+
+    def test_many_classes(self) -> None:
+        """Test a matcher with more than 256 classes of symbols."""
+        n = 300
+        states = [State(f"q{i}", i == n) for i in range(n + 1)]
+        for i in range(n):
+            states[i].add_transitions([Transition(chr(0x100 + i), f"q{i + 1}")])
+        automaton = FiniteAutomaton(states)
+        string = "".join(chr(0x100 + i) for i in range(n))
+
+        self.assertIn("_map(_ord", generate_source(automaton))
+        self._check_matcher(automaton, [string, string[:-1], string[1:], ""])
+
+    def test_cache(self) -> None:
+        """Test that equal automata share the function and its source."""
+        matcher = compile_matcher(REParser().create_automaton("a.b*"))
+
+        self.assertIs(compile_matcher(REParser().create_automaton("a.b*")), matcher)
+        self.assertIn("def match(", matcher.source)
+        self.assertEqual(inspect.getsource(matcher), matcher.source[matcher.source.index("def match("):])
+
+
+if __name__ == "__main__":
+    unittest.main()
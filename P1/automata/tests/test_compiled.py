@@ -0,0 +1,180 @@
+"""Test compiled automata."""
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+import automata.compiled
+from automata.automaton import FiniteAutomaton
+from automata.compiled import CompiledAutomaton
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+
+class TestCompiled(unittest.TestCase):
+    """Tests for the integer table representation."""
+
+    def _check_accept(
+        self,
+        compiled: CompiledAutomaton,
+        string: str,
+        should_accept: bool = True,
+    ) -> None:
+        with self.subTest(string=string):
+            self.assertEqual(compiled.accepts(string), should_accept)
+
+    def test_partial(self) -> None:
+        """Test a partial deterministic automaton."""
+        description = """
+        Automaton:
+
+            Empty
+            H
+            He
+            Hel
+            Hell
+            Hello final
+
+            Empty -H-> H
+            H -e-> He
+            He -l-> Hel
+            Hel -l-> Hell
+            Hell -o-> Hello
+        """
+
+        compiled = AutomataFormat.read(description).compile()
+
+        self.assertEqual(compiled.n_states, 6)
+        self.assertEqual(compiled.symbol_classes, [["H"], ["e"], ["l"], ["o"]])
+        self.assertEqual(len(compiled.table), 6 * 4)
+        self.assertEqual(list(compiled.accepting), [0, 0, 0, 0, 0, 1])
+
+        self._check_accept(compiled, "Hello", should_accept=True)
+        self._check_accept(compiled, "Hell", should_accept=False)
+        self._check_accept(compiled, "Helloo", should_accept=False)
+        self._check_accept(compiled, "Hellx", should_accept=False)
+        self._check_accept(compiled, "", should_accept=False)
+
+    def test_nondeterministic(self) -> None:
+        """Test that non deterministic automata are determinized."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        automaton: FiniteAutomaton = REParser().create_automaton(
+            f"({num}.{num}*.,.{num}*)+{num}*",
+        )
+
+        compiled = automaton.compile()
+
+        self._check_accept(compiled, ",", should_accept=False)
+        self._check_accept(compiled, "1,7", should_accept=True)
+        self._check_accept(compiled, "25,73", should_accept=True)
+        self._check_accept(compiled, "5027", should_accept=True)
+        self._check_accept(compiled, ",13", should_accept=False)
+        self._check_accept(compiled, "13,", should_accept=True)
+        self._check_accept(compiled, "3,7,12", should_accept=False)
+
+    def test_step(self) -> None:
+        """Test stepping one symbol at a time."""
+        compiled = REParser().create_automaton("a.b").compile()
+
+        state = compiled.step(compiled.initial, "a")
+        self.assertFalse(compiled.is_final(state))
+        state = compiled.step(state, "b")
+        self.assertTrue(compiled.is_final(state))
+        self.assertEqual(compiled.step(state, "c"), CompiledAutomaton.DEAD)
+        self.assertEqual(
+            compiled.step(CompiledAutomaton.DEAD, "a"),
+            CompiledAutomaton.DEAD,
+        )
+
+    def test_accepts_many(self) -> None:
+        """Test batch acceptance, with and without NumPy."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        compiled = REParser().create_automaton(
+            f"({num}.{num}*.,.{num}*)+{num}*",
+        ).compile()
+
+        strings = [",", "1,7", "", "25,73", "5027", ",13", "13,", "3,7,12", "1a", "ñ,3"]
+        expected = [compiled.accepts(s) for s in strings]
+
+        # Siempre una lista de bool, con o sin NumPy
+        for numpy in (automata.compiled.np, None):
+            with self.subTest(numpy=numpy is not None), \
+                    mock.patch.object(automata.compiled, "np", numpy):
+                result = compiled.accepts_many(iter(strings))
+                self.assertIs(type(result), list)
+                self.assertTrue(all(type(accepted) is bool for accepted in result))
+                self.assertEqual(result, expected)
+                self.assertEqual(compiled.accepts_many(strings, batch_size=3), expected)
+                self.assertEqual(compiled.accepts_many([]), [])
+
+    def test_accepts_many_lengths(self) -> None:
+        """Test batches with very different lengths and lone surrogates."""
+        compiled = REParser().create_automaton("(a+b)*.a").compile()
+        strings = ["b" * n + "a" * (n % 2) for n in (0, 40, 3, 1, 25, 2, 9, 0, 17)]
+        strings += ["\ud800", "a\udfff", "a"]
+        expected = [compiled.accepts(s) for s in strings]
+
+        self.assertEqual(list(compiled.accepts_many(strings)), expected)
+
+        # Grupos pequeños y cadenas largas evaluadas una a una
+        with mock.patch.object(CompiledAutomaton, "_BATCH_CELLS", 30), \
+                mock.patch.object(CompiledAutomaton, "_LONG_STRING", 20):
+            self.assertEqual(list(compiled.accepts_many(strings)), expected)
+
+    def test_symbol_classes(self) -> None:
+        """Test that equivalent symbols share a column."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        compiled = REParser().create_automaton(f"-*.{num}.{num}*.(λ+,.{num}*)").compile()
+
+        self.assertEqual(compiled.n_symbols, 3)
+        self.assertEqual(
+            sorted(compiled.symbol_classes),
+            [[","], ["-"], list("0123456789")],
+        )
+        self.assertEqual(compiled.symbol_index["3"], compiled.symbol_index["7"])
+
+        self._check_accept(compiled, "--1234,5", should_accept=True)
+        self._check_accept(compiled, "9,", should_accept=True)
+        self._check_accept(compiled, ",9", should_accept=False)
+
+    def test_binary(self) -> None:
+        """Test writing and reading the binary format."""
+        compiled = REParser().create_automaton("[a-zA-Z_].[a-zA-Z_0-9]*+(0+1).(0+1)*").compile()
+        loaded = CompiledAutomaton.from_bytes(compiled.to_bytes())
+
+        self.assertIsInstance(loaded.table, memoryview)
+        self.assertEqual(loaded.symbol_classes, compiled.symbol_classes)
+        self.assertEqual(list(loaded.table), list(compiled.table))
+        self.assertEqual(loaded.accepting, compiled.accepting)
+
+        for string in ["x", "_a9", "1", "101", "12", "9a", ""]:
+            self._check_accept(loaded, string, should_accept=compiled.accepts(string))
+
+        with self.assertRaises(ValueError):
+            CompiledAutomaton.from_bytes(b"AUTX" + compiled.to_bytes()[4:])
+        with self.assertRaises(ValueError):
+            CompiledAutomaton.from_bytes(compiled.to_bytes()[:-1])
+
+    def test_load(self) -> None:
+        """Test loading a file with mmap, and pickling the loaded automaton."""
+        compiled = REParser().create_automaton("a.(b+c)*.a").compile()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "automaton.autc")
+            compiled.dump(path)
+
+            loaded = CompiledAutomaton.load(path)
+            self._check_accept(loaded, "abcba", should_accept=True)
+            self._check_accept(loaded, "abc", should_accept=False)
+            self.assertEqual(list(loaded.accepts_many(["aa", "a"])), [True, False])
+
+            unpickled = pickle.loads(pickle.dumps(loaded))
+            self.assertIsInstance(unpickled.table, memoryview)
+            self._check_accept(unpickled, "acca", should_accept=True)
+
+            del loaded, unpickled
+
+
+if __name__ == "__main__":
+    unittest.main()
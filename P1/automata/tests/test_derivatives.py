@@ -0,0 +1,52 @@
+"""Test conversion of regex to deterministic automata with derivatives."""
+import unittest
+
+from automata.derivatives import DerivativeCompiler
+from automata.re_parser import REParser
+from automata.utils import deterministic_automata_isomorphism, is_deterministic
+
+
+class TestDerivatives(unittest.TestCase):
+    """Tests for the derivatives compiler."""
+
+    def _check_minimal(self, regex: str, extra_states: int = 0) -> None:
+        with self.subTest(regex=regex):
+            automaton = DerivativeCompiler().create_automaton(regex)
+            minimal = REParser().create_automaton(regex).to_minimized()
+
+            self.assertTrue(is_deterministic(automaton))
+            self.assertLessEqual(len(automaton.states), len(minimal.states) + extra_states)
+            self.assertIsNotNone(deterministic_automata_isomorphism(
+                automaton.to_minimized(),
+                minimal,
+            ))
+
+    def test_close_to_minimal(self) -> None:
+        """Test that the automata are equivalent and (almost) minimal."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        self._check_minimal("H.e.l.l.o")
+        self._check_minimal("a*.b*")
+        self._check_minimal("(a+b)*")
+        self._check_minimal("(a+b)*.a.(a+b).(a+b)")
+        self._check_minimal("(a.b+a.c)*.(λ+a)")
+        self._check_minimal(f"({num}.{num}*.,.{num}*)+{num}*", extra_states=1)
+
+    def test_empty(self) -> None:
+        """Test the empty regex (empty language)."""
+        automaton = DerivativeCompiler().create_automaton("")
+
+        self.assertEqual(len(automaton.states), 1)
+        self.assertFalse(automaton.states[0].is_final)
+
+    def test_memoized(self) -> None:
+        """Test that derivatives are reused between regexes."""
+        compiler = DerivativeCompiler()
+        compiler.create_automaton("(a+b)*.a.(a+b)")
+        derivatives = len(compiler._derivatives)
+
+        compiler.create_automaton("(a+b)*.a.(a+b)")
+        self.assertEqual(len(compiler._derivatives), derivatives)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Test the equivalence check of automata."""
+import unittest
+
+from automata.automaton import FiniteAutomaton
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat, find_distinguishing_string
+
+
+class TestEquivalence(unittest.TestCase):
+    """Tests for the Hopcroft-Karp equivalence check."""
+
+    def _check_equivalent(self, regex1: str, regex2: str) -> None:
+        with self.subTest(regex1=regex1, regex2=regex2):
+            automaton1 = REParser().create_automaton(regex1)
+            automaton2 = REParser().create_automaton(regex2)
+            self.assertIsNone(find_distinguishing_string(automaton1, automaton2))
+
+    def _check_different(self, regex1: str, regex2: str) -> None:
+        with self.subTest(regex1=regex1, regex2=regex2):
+            automaton1: FiniteAutomaton = REParser().create_automaton(regex1)
+            automaton2: FiniteAutomaton = REParser().create_automaton(regex2)
+            string = find_distinguishing_string(automaton1, automaton2)
+
+            self.assertIsNotNone(string)
+            self.assertNotEqual(
+                FiniteAutomatonEvaluator(automaton1).accepts(string),
+                FiniteAutomatonEvaluator(automaton2).accepts(string),
+            )
+
+    def test_equivalent(self) -> None:
+        """Test rewritten regexes with the same language."""
+        self._check_equivalent("(a+b)*", "(a*.b*)*")
+        self._check_equivalent("a.(b.a)*", "(a.b)*.a")
+        self._check_equivalent("(a*)*.b", "a*.b")
+        self._check_equivalent("a+b+λ", "λ+b+a")
+        self._check_equivalent("[a-c]*", "(a+b+c)*")
+        self._check_equivalent("a.(b+c)", "a.b+a.c")
+
+    def test_different(self) -> None:
+        """Test regexes with different languages."""
+        self._check_different("(a+b)*", "(a.b)*")
+        self._check_different("a.(b.a)*", "(a.b)*")
+        self._check_different("[a-z]*", "[a-y]*")
+        self._check_different("a*", "a.a*")
+        self._check_different("a", "a.b")
+
+    def test_shortest(self) -> None:
+        """Test that the first difference is found breadth first."""
+        automaton1 = REParser().create_automaton("(a+b)*")
+        automaton2 = REParser().create_automaton("(a+b)*.a.(a+b).(a+b)+(a+b+λ).(a+b+λ)")
+
+        string = find_distinguishing_string(automaton1, automaton2)
+
+        self.assertEqual(len(string), 3)
+        self.assertFalse(FiniteAutomatonEvaluator(automaton2).accepts(string))
+        self.assertIsNone(find_distinguishing_string(automaton1, automaton1))
+
+    def test_partial(self) -> None:
+        """Test automata with different alphabets and missing transitions."""
+        automaton1 = AutomataFormat.read("""
+        Automaton:
+            q0
+            q1 final
+
+            q0 -a-> q1
+        """)
+        automaton2 = AutomataFormat.read("""
+        Automaton:
+            p0
+            p1 final
+            p2
+
+            p0 -a-> p1
+            p0 -b-> p2
+            p2 -a-> p2
+        """)
+
+        self.assertIsNone(find_distinguishing_string(automaton1, automaton2))
+
+        automaton2.name2state["p2"].is_final = True
+        self.assertEqual(find_distinguishing_string(automaton1, automaton2), "b")
+
+
+if __name__ == "__main__":
+    unittest.main()
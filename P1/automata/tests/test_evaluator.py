@@ -4,7 +4,8 @@ from abc import ABC, abstractmethod
 from typing import Optional, Type
 
 from automata.automaton import FiniteAutomaton
-from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.automaton_evaluator import BitsetAutomatonEvaluator, FiniteAutomatonEvaluator
+from automata.re_parser import REParser
 from automata.utils import AutomataFormat
 
 
@@ -13,6 +14,7 @@ class TestEvaluatorBase(ABC, unittest.TestCase):
 
     automaton: FiniteAutomaton
     evaluator: FiniteAutomatonEvaluator
+    evaluator_class: Type = FiniteAutomatonEvaluator
 
     @abstractmethod
     def _create_automata(self) -> FiniteAutomaton:
@@ -21,7 +23,7 @@ class TestEvaluatorBase(ABC, unittest.TestCase):
     def setUp(self) -> None:
         """Set up the tests."""
         self.automaton = self._create_automata()
-        self.evaluator = FiniteAutomatonEvaluator(self.automaton)
+        self.evaluator = self.evaluator_class(self.automaton)
 
     def _check_accept_body(
         self,
@@ -191,5 +193,102 @@ class TestEvaluatorCicle(TestEvaluatorBase):
         self._check_accept("", should_accept=False)
 
 
+class TestBitsetEvaluatorFixed(TestEvaluatorFixed):
+    """Test for a fixed string with the bitset evaluator."""
+
+    evaluator_class = BitsetAutomatonEvaluator
+
+
+class TestBitsetEvaluatorLambdas(TestEvaluatorLambdas):
+    """Test for lambdas with the bitset evaluator."""
+
+    evaluator_class = BitsetAutomatonEvaluator
+
+
+class TestBitsetEvaluatorNumber(TestEvaluatorNumber):
+    """Test for numbers with the bitset evaluator."""
+
+    evaluator_class = BitsetAutomatonEvaluator
+
+
+class TestBitsetEvaluatorCicle(TestEvaluatorCicle):
+    """Test for lambda cycles with the bitset evaluator."""
+
+    evaluator_class = BitsetAutomatonEvaluator
+
+
+class TestLambdaClosures(unittest.TestCase):
+    """Test the lambda closures cached by the automaton."""
+
+    def test_closures(self) -> None:
+        """Test closures with a lambda cycle and a chain leaving it."""
+        description = """
+        Automaton:
+
+            s1
+            s2
+            s3
+            s4
+            s5 final
+
+            s1 --> s2
+            s2 --> s3
+            s3 --> s1
+            s3 --> s4
+            s4 -a-> s5
+            s5 --> s4
+        """
+
+        automaton = AutomataFormat.read(description)
+        closures = automaton.get_lambda_closures()
+
+        names = {
+            name: {s.name for s in closure}
+            for name, closure in closures.items()
+        }
+
+        self.assertEqual(names["s1"], {"s1", "s2", "s3", "s4"})
+        self.assertEqual(names["s2"], {"s1", "s2", "s3", "s4"})
+        self.assertEqual(names["s3"], {"s1", "s2", "s3", "s4"})
+        self.assertEqual(names["s4"], {"s4"})
+        self.assertEqual(names["s5"], {"s4", "s5"})
+
+        # Se calculan una única vez
+        self.assertIs(automaton.get_lambda_closures(), closures)
+
+
+class TestEvaluatorWithoutLambdasCicle(TestEvaluatorCicle):
+    """Test for lambda cycles after removing the lambdas."""
+
+    def _create_automata(self) -> FiniteAutomaton:
+        return super()._create_automata().remove_lambdas()
+
+
+class TestRemoveLambdas(unittest.TestCase):
+    """Test the lambda removal."""
+
+    def test_regex(self) -> None:
+        """Test an automaton built from a regex."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        automaton = REParser().create_automaton(f"({num}.{num}*.,.{num}*)+{num}*")
+        without_lambdas = automaton.remove_lambdas()
+
+        self.assertTrue(all(
+            t.symbol is not None
+            for s in without_lambdas.states for t in s.transitions
+        ))
+        self.assertEqual(without_lambdas.states[0].name, automaton.states[0].name)
+        self.assertLess(len(without_lambdas.states), len(automaton.states) // 2)
+
+        evaluator = FiniteAutomatonEvaluator(automaton)
+        evaluator_without_lambdas = FiniteAutomatonEvaluator(without_lambdas)
+        for string in ("", ",", "1,7", "25,73", "5027", ",13", "13,", "3,7,12"):
+            with self.subTest(string=string):
+                self.assertEqual(
+                    evaluator_without_lambdas.accepts(string),
+                    evaluator.accepts(string),
+                )
+
+
 if __name__ == '__main__':
     unittest.main()
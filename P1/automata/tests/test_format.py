@@ -0,0 +1,70 @@
+"""Test reading and writing automata in the text format."""
+import gc
+import io
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.utils import AutomataFormat, FormatParseError
+
+
+class TestFormat(unittest.TestCase):
+    """Tests for the streaming reader and writer."""
+
+    def test_round_trip(self) -> None:
+        """Test writing to a file and reading it back."""
+        n = 1000
+        states = [State(f"q{i}", i % 7 == 0) for i in range(n)]
+        for i, state in enumerate(states):
+            state.transitions = [
+                Transition(symbol, f"q{(3 * i + k) % n}")
+                for k, symbol in enumerate("abcd")
+            ] + [Transition(None, f"q{(i + 1) % n}")]
+
+        file = io.StringIO()
+        AutomataFormat.write_stream(FiniteAutomaton(states), file)
+        self.assertEqual(file.getvalue(), AutomataFormat.write(FiniteAutomaton(states)))
+
+        file.seek(0)
+        automaton = AutomataFormat.read_stream(file)
+
+        self.assertEqual([s.name for s in automaton.states], [s.name for s in states])
+        for state, expected in zip(automaton.states, states):
+            self.assertEqual(state.is_final, expected.is_final)
+            self.assertEqual(state.transitions, expected.transitions)
+
+    def test_repeated_transitions(self) -> None:
+        """Test that repeated transitions are removed."""
+        automaton = AutomataFormat.read_stream([
+            "Automaton:\n",
+            "  q0\n",
+            "  q1 final\n",
+            "\n",
+            "  q0 -a-> q1\n",
+            "  q0 -b-> q1\n",
+            "  q0 -a-> q1\n",
+            "  q1 --> q0\n",
+        ])
+
+        self.assertEqual(
+            automaton.states[0].transitions,
+            [Transition("a", "q1"), Transition("b", "q1")],
+        )
+        self.assertEqual(automaton.states[1].transitions, [Transition(None, "q0")])
+        self.assertTrue(gc.isenabled())
+
+    def test_errors(self) -> None:
+        """Test invalid descriptions."""
+        with self.assertRaises(FormatParseError):
+            AutomataFormat.read_stream(["Automaton:\n", "q0 -ab-> q1\n"])
+
+        with self.assertRaises(FormatParseError):
+            AutomataFormat.read_stream(["Automaton:\n", "q0\n", "q1 -a-> q0\n"])
+
+        with self.assertRaises(FormatParseError):
+            AutomataFormat.read_stream(["q0\n"])
+
+        self.assertTrue(gc.isenabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
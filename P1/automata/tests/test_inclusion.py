@@ -0,0 +1,89 @@
+"""Test the inclusion and universality checks."""
+import unittest
+
+from automata.automaton import FiniteAutomaton
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+
+class TestInclusion(unittest.TestCase):
+    """Tests for the antichain based inclusion check."""
+
+    def _check_inclusion(self, regex1: str, regex2: str, included: bool) -> None:
+        with self.subTest(regex1=regex1, regex2=regex2):
+            automaton1: FiniteAutomaton = REParser().create_automaton(regex1)
+            automaton2: FiniteAutomaton = REParser().create_automaton(regex2)
+            string = automaton1.subset_counterexample(automaton2)
+
+            self.assertEqual(automaton1.is_subset_of(automaton2), included)
+            if included:
+                self.assertIsNone(string)
+            else:
+                self.assertTrue(FiniteAutomatonEvaluator(automaton1).accepts(string))
+                self.assertFalse(FiniteAutomatonEvaluator(automaton2).accepts(string))
+
+    def test_inclusion(self) -> None:
+        """Test included and not included languages."""
+        self._check_inclusion("a.b*", "a.(a+b)*", included=True)
+        self._check_inclusion("a.(a+b)*", "a.b*", included=False)
+        self._check_inclusion("(a.b)*", "(a+b)*", included=True)
+        self._check_inclusion("[a-f]*", "[a-z]*", included=True)
+        self._check_inclusion("[a-z]*", "[a-f]*", included=False)
+        self._check_inclusion("", "a", included=True)
+        self._check_inclusion("λ", "a*", included=True)
+        self._check_inclusion("λ", "a.a*", included=False)
+        self._check_inclusion("c", "a+b", included=False)
+
+    def test_counterexample(self) -> None:
+        """Test that the counterexample is one of the shortest."""
+        automaton1 = REParser().create_automaton("(a+b)*")
+        automaton2 = REParser().create_automaton("λ+(a+b)*.a")
+
+        self.assertEqual(automaton1.subset_counterexample(automaton2), "b")
+
+
+class TestUniversality(unittest.TestCase):
+    """Tests for the antichain based universality check."""
+
+    def test_universal(self) -> None:
+        """Test universal and not universal automata."""
+        self.assertTrue(REParser().create_automaton("(a+b)*").is_universal())
+        self.assertTrue(REParser().create_automaton("(a*.b*)*").is_universal())
+        self.assertTrue(REParser().create_automaton("λ+(a+b)*.a+(a+b)*.b").is_universal())
+        self.assertFalse(REParser().create_automaton("(a+b)*.a+(a+b)*.b").is_universal())
+        self.assertEqual(
+            REParser().create_automaton("(a+b)*.a+(a+b)*.b").universality_counterexample(),
+            "",
+        )
+
+    def test_exponential(self) -> None:
+        """Test an automaton whose determinization is exponential."""
+        k = 8
+        any_symbol = "(a+b)"
+        optional = "(λ+a+b)"
+        automaton = REParser().create_automaton(
+            f"{any_symbol}*.a" + f".{any_symbol}" * k + "+" + ".".join([optional] * (k + 1)),
+        )
+        string = automaton.universality_counterexample()
+
+        self.assertEqual(len(string), k + 2)
+        self.assertFalse(FiniteAutomatonEvaluator(automaton).accepts(string))
+
+    def test_partial(self) -> None:
+        """Test an automaton with missing transitions."""
+        automaton = AutomataFormat.read("""
+        Automaton:
+            q0 final
+            q1 final
+
+            q0 -a-> q0
+            q0 -b-> q1
+            q1 -a-> q0
+        """)
+
+        self.assertEqual(automaton.universality_counterexample(), "bb")
+
+
+if __name__ == "__main__":
+    unittest.main()
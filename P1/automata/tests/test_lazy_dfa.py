@@ -0,0 +1,99 @@
+"""Test evaluation with lazy determinization."""
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.lazy_dfa import LazyDFAEvaluator
+from automata.re_parser import REParser
+
+
+class TestLazyDFA(unittest.TestCase):
+    """Tests for the lazy DFA evaluator."""
+
+    def _check_accept(
+        self,
+        evaluator: LazyDFAEvaluator,
+        string: str,
+        should_accept: bool = True,
+    ) -> None:
+        with self.subTest(string=string):
+            accepted = evaluator.accepts(string)
+            self.assertEqual(accepted, should_accept)
+
+    def test_number(self) -> None:
+        """Test number expression."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        evaluator = LazyDFAEvaluator(
+            REParser().create_automaton(f"({num}.{num}*.,.{num}*)+{num}*"),
+        )
+
+        self._check_accept(evaluator, ",", should_accept=False)
+        self._check_accept(evaluator, "1,7", should_accept=True)
+        self._check_accept(evaluator, "25,73", should_accept=True)
+        self._check_accept(evaluator, "5027", should_accept=True)
+        self._check_accept(evaluator, ",13", should_accept=False)
+        self._check_accept(evaluator, "13,", should_accept=True)
+        self._check_accept(evaluator, "3,7,12", should_accept=False)
+        self._check_accept(evaluator, "", should_accept=True)
+
+    def test_cache_reused(self) -> None:
+        """Test that only visited subsets are built, and only once."""
+        evaluator = LazyDFAEvaluator(
+            REParser().create_automaton("(a+b)*.a" + ".(a+b)" * 10),
+        )
+
+        self.assertTrue(evaluator.accepts("a" * 11))
+        cached = evaluator.cache_size
+        self.assertEqual(cached, 12)
+
+        self.assertTrue(evaluator.accepts("a" * 20))
+        self.assertEqual(evaluator.cache_size, cached)
+        self.assertEqual(evaluator.flushes, 0)
+
+    def test_fallback(self) -> None:
+        """Test that a tiny budget flushes and falls back to simulation."""
+        automaton = REParser().create_automaton("(a+b)*.a" + ".(a+b)" * 6)
+        reference = FiniteAutomatonEvaluator(automaton)
+        evaluator = LazyDFAEvaluator(
+            automaton,
+            memory_budget=4 * LazyDFAEvaluator.STATE_COST,
+            min_symbols_per_flush=5,
+        )
+
+        for string in ("ab" * 20, "abbbbba", "aaaaaaaabbbbbb", "baabbabbba"):
+            self._check_accept(evaluator, string, reference.accepts(string))
+
+        self.assertGreater(evaluator.flushes, 0)
+        self.assertTrue(evaluator.using_fallback)
+
+    def test_bounded_by_alphabet(self) -> None:
+        """Test that transitions are cached per range, not per character."""
+        evaluator = LazyDFAEvaluator(
+            REParser().create_automaton("[\\u0000-\\U0010ffff]*"),
+            memory_budget=10000,
+        )
+        text = "".join(chr(0x4E00 + i) for i in range(5000))
+
+        self.assertTrue(evaluator.accepts(text))
+        self.assertLessEqual(evaluator._used, evaluator.memory_budget)
+        self.assertEqual(evaluator.flushes, 0)
+
+    def test_transitions_budget(self) -> None:
+        """Test that storing transitions also respects the budget."""
+        automaton = REParser().create_automaton("(a+b+c+d+e+f+g+h)*")
+        reference = FiniteAutomatonEvaluator(automaton)
+        evaluator = LazyDFAEvaluator(
+            automaton,
+            memory_budget=2 * LazyDFAEvaluator.STATE_COST + 3 * LazyDFAEvaluator.TRANSITION_COST,
+            min_symbols_per_flush=0,
+        )
+
+        for string in ("abcdefgh" * 10, "hgfedcba", "abz"):
+            self._check_accept(evaluator, string, reference.accepts(string))
+            self.assertLessEqual(evaluator._used, evaluator.memory_budget)
+
+        self.assertGreater(evaluator.flushes, 0)
+        self.assertFalse(evaluator.using_fallback)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ import unittest
 from abc import ABC
 
 from automata.automaton import FiniteAutomaton
+from automata.re_parser import REParser
 from automata.utils import AutomataFormat, deterministic_automata_isomorphism, write_dot
 
 
@@ -15,14 +16,16 @@ class TestMinimized(ABC, unittest.TestCase):
         expected: FiniteAutomaton,
     ) -> None:
         """Test that the transformed automaton is as the expected one."""
-        transformed = automaton.to_minimized()
+        for engine in ("hopcroft", "moore"):
+            with self.subTest(engine=engine):
+                transformed = automaton.to_minimized(engine)
 
-        equiv_map = deterministic_automata_isomorphism(
-            expected,
-            transformed,
-        )
+                equiv_map = deterministic_automata_isomorphism(
+                    expected,
+                    transformed,
+                )
 
-        self.assertTrue(equiv_map is not None)
+                self.assertTrue(equiv_map is not None)
 
     def test_case1(self) -> None:
         """Test Case 1. Reduce al maximo el automata para que se quede solamente en dos estado uno inicial y otro final"""
@@ -284,6 +287,23 @@ class TestMinimized(ABC, unittest.TestCase):
 
         self._check_transform(automaton, expected)
 
+    def test_engines_agree(self) -> None:
+        """Test that Hopcroft and Moore build exactly the same automaton."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        regex = f"({num}.{num}*.,.{num}*)+{num}*+(a+b)*.a.(a+b).(a+b)"
+
+        hopcroft = REParser().create_automaton(regex).to_minimized("hopcroft")
+        moore = REParser().create_automaton(regex).to_minimized("moore")
+
+        self.assertEqual(AutomataFormat.write(hopcroft), AutomataFormat.write(moore))
+
+    def test_unknown_engine(self) -> None:
+        """Test that unknown engines are rejected."""
+        automaton = REParser().create_automaton("a*")
+
+        with self.assertRaises(ValueError):
+            automaton.to_minimized("brzozowski")
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
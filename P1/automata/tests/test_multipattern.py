@@ -0,0 +1,91 @@
+"""Test the deterministic automata of many patterns."""
+import re
+import unittest
+
+from automata.streaming import StreamEvaluator
+from automata.multipattern import MultiPatternDFA
+
+
+class TestMultiPatternDFA(unittest.TestCase):
+    """Tests for the automata that match many patterns at once."""
+
+    patterns = [
+        "i.f",
+        "[a-z].[a-z0-9]*",
+        "[0-9].[0-9]*",
+        "(a+b)*.a",
+        "[α-ω]*",
+    ]
+    python_patterns = [
+        r"if",
+        r"[a-z][a-z0-9]*",
+        r"[0-9]+",
+        r"[ab]*a",
+        r"[α-ω]*",
+    ]
+    strings = ["if", "iff", "a", "ba", "ab", "12", "1a", "αβ", "", ".", "aa1", "ifa"]
+
+    def test_matches(self) -> None:
+        """Test that one run reports every matching pattern."""
+        for construction in ("thompson", "glushkov", "derivatives"):
+            multipattern = MultiPatternDFA(self.patterns, construction=construction)
+
+            for string in self.strings:
+                with self.subTest(construction=construction, string=string):
+                    expected = tuple(
+                        i for i, pattern in enumerate(self.python_patterns)
+                        if re.fullmatch(pattern, string)
+                    )
+                    self.assertEqual(multipattern.matches(string), expected)
+                    self.assertEqual(
+                        multipattern.best_match(string),
+                        expected[0] if expected else None,
+                    )
+
+    def test_priorities(self) -> None:
+        """Test that the tags are sorted by priority."""
+        multipattern = MultiPatternDFA(self.patterns, priorities=[1, 0, 0, 0, 0])
+
+        self.assertEqual(multipattern.matches("if"), (1, 0))
+        self.assertEqual(multipattern.best_match("if"), 1)
+        self.assertEqual(multipattern.matches("a"), (1, 3))
+
+        with self.assertRaises(ValueError):
+            MultiPatternDFA(self.patterns, priorities=[0])
+
+    def test_minimal(self) -> None:
+        """Test that the states with different tags are not merged."""
+        multipattern = MultiPatternDFA(["a.b", "a.b", "a.c"])
+
+        # Inicial, tras "a", tras "ab" (0 y 1) y tras "ac" (2)
+        self.assertEqual(multipattern.automaton.n_states, 4)
+        self.assertEqual(multipattern.matches("ab"), (0, 1))
+        self.assertEqual(multipattern.matches("ac"), (2,))
+
+        # Sin los estados sumidero, el recorrido se para en cuanto nada encaja
+        self.assertEqual(multipattern.run(multipattern.initial, "b"), multipattern.DEAD)
+        self.assertEqual(multipattern.matches("abc"), ())
+
+    def test_no_patterns(self) -> None:
+        """Test an automaton without patterns."""
+        multipattern = MultiPatternDFA([])
+
+        self.assertEqual(multipattern.matches(""), ())
+        self.assertEqual(multipattern.matches("a"), ())
+
+    def test_stream(self) -> None:
+        """Test that the automaton can be used by other evaluators."""
+        multipattern = MultiPatternDFA(self.patterns)
+        evaluator = StreamEvaluator(multipattern)
+
+        evaluator.feed("i")
+        self.assertEqual(multipattern.tags[evaluator.current_state], (1,))
+        evaluator.feed("f")
+        self.assertTrue(evaluator.is_accepting())
+        self.assertEqual(multipattern.tags[evaluator.current_state], (0, 1))
+
+        self.assertEqual(len(multipattern.tags), multipattern.automaton.n_states)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Test parallel matching."""
+import os
+import pickle
+import tempfile
+import unittest
+
+from automata.parallel import match_file_parallel, match_parallel
+from automata.re_parser import REParser
+
+
+class TestParallel(unittest.TestCase):
+    """Tests for the process pool driver."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        self.compiled = REParser().create_automaton(
+            f"({num}.{num}*.,.{num}*)+{num}*",
+        ).compile()
+        self.strings = [
+            str(i) if i % 3 else f"{i},{i % 7}" if i % 2 else f",{i}"
+            for i in range(500)
+        ]
+        self.expected = [self.compiled.accepts(s) for s in self.strings]
+
+    def test_pickle(self) -> None:
+        """Test that compiled automata can be sent to other processes."""
+        self.compiled.accepts_many(self.strings)
+        restored = pickle.loads(pickle.dumps(self.compiled))
+
+        self.assertEqual(
+            [restored.accepts(s) for s in self.strings],
+            self.expected,
+        )
+
+    def test_match_parallel(self) -> None:
+        """Test that the results are returned in order."""
+        results = match_parallel(
+            self.compiled,
+            iter(self.strings),
+            chunk_size=17,
+            max_workers=2,
+        )
+
+        self.assertEqual(list(results), self.expected)
+
+    def test_match_file_parallel(self) -> None:
+        """Test matching the lines of a file."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "corpus.txt")
+            with open(path, "w") as file:
+                file.write("\n".join(self.strings) + "\n")
+
+            results = match_file_parallel(
+                self.compiled,
+                path,
+                chunk_size=50,
+                max_workers=2,
+            )
+
+            self.assertEqual(list(results), self.expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""Test the lazy products of automata."""
+import itertools
+import unittest
+
+from automata.automaton import FiniteAutomaton
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.product import ProductAutomaton, ProductEvaluator
+from automata.re_parser import REParser
+from automata.scanner import Scanner
+from automata.streaming import StreamEvaluator
+
+
+class TestProduct(unittest.TestCase):
+    """Tests for intersection, union, difference and complement."""
+
+    def setUp(self) -> None:
+        parser = REParser()
+        self.even_a = parser.create_automaton("(b*.a.b*.a)*.b*")
+        self.ends_b = parser.create_automaton("(a+b)*.b")
+        self.short = parser.create_automaton("λ+a+b+(a+b).(a+b)")
+
+    def _check_product(self, product: ProductAutomaton, expected) -> None:
+        for length in range(6):
+            for symbols in itertools.product("abc", repeat=length):
+                string = "".join(symbols)
+                with self.subTest(string=string):
+                    self.assertEqual(product.accepts(string), expected(string))
+
+    def _accepts(self, automaton: FiniteAutomaton, string: str) -> bool:
+        return FiniteAutomatonEvaluator(automaton).accepts(string)
+
+    def test_operations(self) -> None:
+        """Test every operation against the operands."""
+        even_a, ends_b, short = self.even_a, self.ends_b, self.short
+
+        self._check_product(
+            even_a.intersection(ends_b, short.complement()),
+            lambda s: self._accepts(even_a, s) and self._accepts(ends_b, s)
+            and not self._accepts(short, s),
+        )
+        self._check_product(
+            even_a.union(ends_b),
+            lambda s: self._accepts(even_a, s) or self._accepts(ends_b, s),
+        )
+        self._check_product(
+            even_a.difference(ends_b, short),
+            lambda s: self._accepts(even_a, s) and not self._accepts(ends_b, s)
+            and not self._accepts(short, s),
+        )
+        self._check_product(
+            even_a.union(ends_b).complement(),
+            lambda s: not self._accepts(even_a, s) and not self._accepts(ends_b, s),
+        )
+
+    def test_lazy(self) -> None:
+        """Test that only the visited states are built."""
+        product = self.even_a.intersection(self.ends_b)
+
+        self.assertEqual(product.n_states, 1)
+        self.assertTrue(product.accepts("abab"))
+        self.assertEqual(product.n_states, 4)
+        self.assertEqual(product.step(product.initial, "c"), ProductAutomaton.DEAD)
+
+    def test_pruned(self) -> None:
+        """Test that states of the operands that can't accept make the product dead."""
+        parser = REParser()
+        product = parser.create_automaton("a.b").intersection(parser.create_automaton("(a+b)*"))
+
+        # El DFA completo de "a.b" tiene un sumidero, que no llega a ser DEAD
+        self.assertTrue(product._matchers[0].get_hopeless_states())
+        self.assertEqual(product.run(product.initial, "b"), ProductAutomaton.DEAD)
+        self.assertEqual(product.run(product.initial, "aba"), ProductAutomaton.DEAD)
+        self.assertTrue(product.accepts("ab"))
+
+    def test_bounded_cache(self) -> None:
+        """Test that the transitions are cached by class, not by character."""
+        parser = REParser()
+        product = parser.create_automaton("[\\u0100-\\uffff]*").difference(
+            parser.create_automaton("[\\u4e00-\\u9fff].[\\u4e00-\\u9fff]"),
+        )
+
+        text = "".join(chr(code) for code in range(0x4E00, 0x5E00))
+        self.assertTrue(product.accepts(text))
+        self.assertFalse(product.accepts(text[:2]))
+        self.assertLessEqual(
+            sum(len(transitions) for transitions in product._transitions),
+            product.n_states * 4,
+        )
+
+    def test_evaluator(self) -> None:
+        """Test the interface of FiniteAutomatonEvaluator."""
+        evaluator = ProductEvaluator(self.even_a.difference(self.ends_b))
+
+        self.assertTrue(evaluator.accepts("aa"))
+        self.assertFalse(evaluator.accepts("aab"))
+
+        evaluator.process_string("ab")
+        self.assertFalse(evaluator.is_accepting())
+        evaluator.process_symbol("a")
+        self.assertTrue(evaluator.is_accepting())
+        self.assertTrue(evaluator.accepts(""))
+        self.assertFalse(evaluator.accepts("b"))
+
+    def test_invalid(self) -> None:
+        """Test invalid operations."""
+        with self.assertRaises(ValueError):
+            ProductAutomaton("xor", [self.even_a, self.ends_b])
+
+        with self.assertRaises(ValueError):
+            ProductAutomaton("complement", [self.even_a, self.ends_b])
+
+    def test_evaluators(self) -> None:
+        """Test products in the stream evaluator and the scanner."""
+        parser = REParser()
+        word = parser.create_automaton("[a-z].[a-z]*")
+        keyword = parser.create_automaton("i.f+f.o.r")
+        identifier = word.difference(keyword)
+
+        evaluator = StreamEvaluator(identifier)
+        self.assertEqual(
+            list(evaluator.match_records(b"foo\nfor\nif\nifs\n")),
+            [True, False, False, True],
+        )
+
+        scanner = Scanner(word.intersection(parser.create_automaton("(a+b+c)*.a")))
+        self.assertEqual(scanner.findall("xa ba abca cab"), ["a", "ba", "abca", "ca"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""Test transitions labelled with ranges of symbols."""
+import re
+import unittest
+
+from automata.automaton import FiniteAutomaton, SymbolRanges
+from automata.automaton_evaluator import BitsetAutomatonEvaluator, FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.utils import (
+    AutomataFormat,
+    deterministic_automata_isomorphism,
+    is_deterministic,
+)
+
+
+class TestSymbolRanges(unittest.TestCase):
+    """Tests for the ranges of symbols."""
+
+    def test_merge(self) -> None:
+        """Test that overlapping and adjacent ranges are merged."""
+        ranges = SymbolRanges([(ord("d"), ord("f")), (ord("a"), ord("c")), (ord("e"), ord("k"))])
+
+        self.assertEqual(ranges.ranges, ((ord("a"), ord("k")),))
+        self.assertEqual(len(ranges), 11)
+        self.assertIn("h", ranges)
+        self.assertNotIn("l", ranges)
+        self.assertNotIn("ab", ranges)
+
+    def test_parse(self) -> None:
+        """Test reading and writing symbol classes."""
+        ranges = SymbolRanges.parse(r"[a-cx\-\]é-ê]")
+
+        self.assertEqual(
+            ranges.ranges,
+            ((ord("-"), ord("-")), (ord("]"), ord("]")), (ord("a"), ord("c")),
+             (ord("x"), ord("x")), (0xE9, 0xEA)),
+        )
+        self.assertEqual(SymbolRanges.parse(str(ranges)), ranges)
+        self.assertEqual(SymbolRanges.parse("[a-]").ranges, ((ord("-"), ord("-")), (ord("a"), ord("a"))))
+        self.assertEqual(str(SymbolRanges.parse("[ \n]")), r"[\u000a\u0020]")
+
+        with self.assertRaises(ValueError):
+            SymbolRanges.parse("[z-a]")
+
+
+class TestRangeAutomata(unittest.TestCase):
+    """Tests for automata with transitions labelled with ranges."""
+
+    regex = "[a-zA-Z_].[a-zA-Z_0-9]*+[0-9].[0-9]*+[α-ω]"
+    python_regex = r"[a-zA-Z_][a-zA-Z_0-9]*|[0-9]+|[α-ω]"
+    strings = ["a", "_x9", "9", "123", "1a", "", "β", "ββ", "Z_Z", "-", "ñ", "a-b"]
+
+    def _check_language(self, automaton: FiniteAutomaton) -> None:
+        compiled = automaton.compile()
+
+        for string in self.strings:
+            with self.subTest(string=string):
+                expected = re.fullmatch(self.python_regex, string) is not None
+                self.assertEqual(FiniteAutomatonEvaluator(automaton).accepts(string), expected)
+                self.assertEqual(BitsetAutomatonEvaluator(automaton).accepts(string), expected)
+                self.assertEqual(compiled.accepts(string), expected)
+
+        self.assertEqual(
+            list(compiled.accepts_many(self.strings)),
+            [compiled.accepts(string) for string in self.strings],
+        )
+
+    def test_constructions(self) -> None:
+        """Test classes of symbols with every construction."""
+        for construction in ("thompson", "glushkov", "derivatives"):
+            with self.subTest(construction=construction):
+                automaton = REParser().create_automaton(self.regex, construction)
+                self._check_language(automaton)
+                self._check_language(automaton.to_deterministic())
+
+    def test_minimized(self) -> None:
+        """Test that the minimal automaton merges the ranges of each target."""
+        automaton = REParser().create_automaton(self.regex)
+        minimized = automaton.to_minimized()
+
+        self.assertTrue(is_deterministic(minimized))
+        self.assertEqual(len(minimized.states), 5)
+        self.assertTrue(all(len(s.transitions) <= 3 for s in minimized.states))
+        self.assertIsNotNone(
+            deterministic_automata_isomorphism(minimized, automaton.to_minimized("moore")),
+        )
+        self._check_language(minimized)
+
+    def test_format(self) -> None:
+        """Test reading and writing transitions with ranges."""
+        description = """
+        Automaton:
+            Initial
+            Word final
+            Other final
+
+            Initial -[a-zà-ÿ]-> Word
+            Initial -[\\-\\]]-> Other
+            Initial -[-> Other
+            Word -[a-zà-ÿ]-> Word
+        """
+
+        automaton = AutomataFormat.read(description)
+        evaluator = FiniteAutomatonEvaluator(automaton)
+
+        self.assertTrue(evaluator.accepts("café"))
+        self.assertTrue(evaluator.accepts("]"))
+        self.assertTrue(evaluator.accepts("["))
+        self.assertFalse(evaluator.accepts("Café"))
+
+        minimized = automaton.to_minimized()
+        self.assertIsNotNone(
+            deterministic_automata_isomorphism(
+                minimized,
+                AutomataFormat.read(AutomataFormat.write(minimized)),
+            ),
+        )
+
+    def test_overlapping_ranges(self) -> None:
+        """Test that overlapping ranges are not deterministic."""
+        description = """
+        Automaton:
+            q0
+            q1 final
+            q2 final
+
+            q0 -[a-m]-> q1
+            q0 -[k-z]-> q2
+        """
+
+        automaton = AutomataFormat.read(description)
+
+        self.assertFalse(is_deterministic(automaton))
+        self.assertTrue(is_deterministic(automaton.to_deterministic()))
+        self.assertEqual(len(automaton.to_minimized().states), 3)
+
+    def test_unicode(self) -> None:
+        """Test a class with the whole Unicode range."""
+        compiled = REParser().create_automaton(
+            "[\\u0000-\\U0010ffff]*.[0-9]",
+        ).compile()
+
+        self.assertEqual(compiled.n_states, 2)
+        self.assertTrue(compiled.accepts("日本語😀1"))
+        self.assertFalse(compiled.accepts("1日本語😀"))
+        self.assertEqual(list(compiled.accepts_many(["😀7", "7😀"])), [True, False])
+
+    def test_block_table(self) -> None:
+        """Test the lookup of ranges that cut blocks, without memoizing symbols."""
+        compiled = REParser().create_automaton(
+            "([\\u00f0-\\u0105]+[\\u0200-\\u03ff]+[\\u1000-\\U0001f000]).x",
+        ).compile()
+        index_size = len(compiled.symbol_index)
+
+        for code in (0xEF, 0xF0, 0xFF, 0x100, 0x105, 0x106, 0x1FF, 0x200, 0x3FF,
+                     0x400, 0xFFF, 0x1000, 0x1F000, 0x1F001, 0x10FFFF):
+            with self.subTest(code=hex(code)):
+                expected = (
+                    0xF0 <= code <= 0x105 or 0x200 <= code <= 0x3FF
+                    or 0x1000 <= code <= 0x1F000
+                )
+                self.assertEqual(compiled.accepts(chr(code) + "x"), expected)
+
+        compiled.accepts("".join(chr(code) for code in range(0x1000, 0x9000)))
+        self.assertEqual(len(compiled.symbol_index), index_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
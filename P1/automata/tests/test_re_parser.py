@@ -8,8 +8,10 @@ from automata.re_parser import REParser
 class TestREParser(unittest.TestCase):
     """Tests for regex parser."""
 
+    construction = "thompson"
+
     def _create_evaluator(self, regex: str) -> FiniteAutomatonEvaluator:
-        automaton = REParser().create_automaton(regex)
+        automaton = REParser().create_automaton(regex, self.construction)
         return FiniteAutomatonEvaluator(automaton)
 
     def _check_accept(
@@ -80,5 +82,38 @@ class TestREParser(unittest.TestCase):
         self._check_accept(evaluator, "3,7,12", should_accept=False)
 
 
+class TestREParserGlushkov(TestREParser):
+    """Tests for regex parser with the position automaton construction."""
+
+    construction = "glushkov"
+
+    def test_lambda_free(self) -> None:
+        """Test that there is one state per symbol and no lambdas."""
+        automaton = REParser().create_automaton("(a+b)*.a.(λ+b).c*", "glushkov")
+
+        self.assertEqual(len(automaton.states), 6)
+        self.assertTrue(all(
+            t.symbol is not None
+            for s in automaton.states for t in s.transitions
+        ))
+
+        evaluator = FiniteAutomatonEvaluator(automaton)
+        self._check_accept(evaluator, "a", should_accept=True)
+        self._check_accept(evaluator, "babcc", should_accept=True)
+        self._check_accept(evaluator, "abbc", should_accept=False)
+        self._check_accept(evaluator, "", should_accept=False)
+
+    def test_unknown_construction(self) -> None:
+        """Test that unknown constructions are rejected."""
+        with self.assertRaises(ValueError):
+            REParser().create_automaton("a", "brzozowski")
+
+
+class TestREParserDerivatives(TestREParser):
+    """Tests for regex parser building the automata with derivatives."""
+
+    construction = "derivatives"
+
+
 if __name__ == "__main__":
     unittest.main()
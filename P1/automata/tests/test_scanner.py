@@ -0,0 +1,95 @@
+"""Test search of matches inside texts."""
+import random
+import unittest
+from typing import List, Tuple
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.scanner import Scanner
+
+
+class TestScanner(unittest.TestCase):
+    """Tests for the leftmost-longest scanner."""
+
+    def _brute_force(self, regex: str, text: str) -> List[Tuple[int, int]]:
+        """Leftmost-longest matches checking every substring."""
+        evaluator = FiniteAutomatonEvaluator(REParser().create_automaton(regex))
+        spans = []
+        pos = 0
+
+        while pos <= len(text):
+            found = None
+            for start in range(pos, len(text) + 1):
+                ends = [
+                    end for end in range(start, len(text) + 1)
+                    if evaluator.accepts(text[start:end])
+                ]
+                if ends:
+                    found = (start, max(ends))
+                    break
+
+            if found is None:
+                break
+
+            spans.append(found)
+            pos = found[1] if found[1] > found[0] else found[1] + 1
+
+        return spans
+
+    def _check_scan(self, regex: str, text: str) -> None:
+        with self.subTest(regex=regex, text=text):
+            scanner = Scanner(REParser().create_automaton(regex))
+            self.assertEqual(
+                list(scanner.finditer(text)),
+                self._brute_force(regex, text),
+            )
+
+    def test_fixed(self) -> None:
+        """Test a literal pattern."""
+        scanner = Scanner(REParser().create_automaton("a.b"))
+
+        self.assertEqual(list(scanner.finditer("xxabyabab")), [(2, 4), (5, 7), (7, 9)])
+        self.assertEqual(scanner.findall("xxabyabab"), ["ab", "ab", "ab"])
+        self.assertEqual(list(scanner.finditer("xxabyabab", pos=3)), [(5, 7), (7, 9)])
+        self.assertEqual(list(scanner.finditer("")), [])
+
+    def test_leftmost(self) -> None:
+        """Test that the leftmost match wins over an earlier ending one."""
+        scanner = Scanner(REParser().create_automaton("a.b.c.d+c"))
+
+        self.assertEqual(scanner.findall("xabcdcc"), ["abcd", "c", "c"])
+
+    def test_against_brute_force(self) -> None:
+        """Test several patterns against checking every substring."""
+        text = "aabbab,12,,3abba1,2b"
+        for regex in ("a*", "a.b*", "(a+b)*.a", "b.a+a.b.b", "(1+2+3).(1+2+3)*.,", "λ+b"):
+            self._check_scan(regex, text)
+
+    def test_random_texts(self) -> None:
+        """Test overlapping candidates against checking every substring."""
+        rng = random.Random(0)
+        for regex in ("(a.a*.b)+a", "a.b*.a+b", "(a+b)*.b.b", "a*.b+λ"):
+            for _ in range(20):
+                text = "".join(rng.choice("ab") for _ in range(rng.randint(0, 12)))
+                self._check_scan(regex, text)
+
+    def test_linear(self) -> None:
+        """Test that the forward pass is linear even if every match is short."""
+        scanner = Scanner(REParser().create_automaton("(a.a*.b)+a"))
+        forward = scanner.forward
+        calls = 0
+
+        def step(state: int, symbol: str) -> int:
+            nonlocal calls
+            calls += 1
+            return type(forward).step(forward, state, symbol)
+
+        forward.step = step  # type: ignore[assignment]
+        text = "a" * 5000
+
+        self.assertEqual(scanner.findall(text), ["a"] * len(text))
+        self.assertLessEqual(calls, forward.n_states * len(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
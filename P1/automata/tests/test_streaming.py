@@ -0,0 +1,72 @@
+"""Test evaluation of streams."""
+import io
+import mmap
+import os
+import tempfile
+import unittest
+
+from automata.re_parser import REParser
+from automata.streaming import StreamEvaluator
+
+
+class TestStreaming(unittest.TestCase):
+    """Tests for the streaming evaluator."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        automaton = REParser().create_automaton("(a+ñ)*.b")
+        self.evaluator = StreamEvaluator(automaton, chunk_size=1)
+
+    def test_accepts(self) -> None:
+        """Test different kinds of sources."""
+        text = "aññab"
+        data = text.encode("utf-8")
+
+        self.assertTrue(self.evaluator.accepts(data))
+        self.assertTrue(self.evaluator.accepts(bytearray(data)))
+        self.assertTrue(self.evaluator.accepts(text))
+        self.assertTrue(self.evaluator.accepts(io.BytesIO(data)))
+        self.assertTrue(self.evaluator.accepts(io.StringIO(text)))
+        self.assertTrue(self.evaluator.accepts(iter([b"a\xc3", b"\xb1", "ab"])))
+        self.assertFalse(self.evaluator.accepts(data + b"a"))
+        self.assertFalse(self.evaluator.accepts(b""))
+
+        with self.assertRaises(UnicodeDecodeError):
+            self.evaluator.accepts(data[:2])
+
+    def test_feed(self) -> None:
+        """Test feeding the chunks by hand."""
+        self.evaluator.feed(b"a\xc3")
+        self.assertFalse(self.evaluator.is_accepting())
+        self.evaluator.feed(b"\xb1b")
+        self.assertTrue(self.evaluator.is_accepting())
+
+        self.evaluator.reset()
+        self.assertFalse(self.evaluator.is_accepting())
+
+    def test_records(self) -> None:
+        """Test the acceptance of each line of a memory mapped file."""
+        text = "ab\nb\n\nañb\nba\nb"
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "log.txt")
+            with open(path, "wb") as file:
+                file.write(text.encode("utf-8"))
+
+            with open(path, "rb") as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    results = list(self.evaluator.match_records(data))
+
+        self.assertEqual(results, [True, True, False, True, False, True])
+        self.assertEqual(
+            list(self.evaluator.match_records(text + "\n")),
+            [True, True, False, True, False, True],
+        )
+        self.assertEqual(list(self.evaluator.match_records("")), [])
+
+        with self.assertRaises(ValueError):
+            list(self.evaluator.match_records(text, separator="\r\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
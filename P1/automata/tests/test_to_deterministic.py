@@ -1,8 +1,11 @@
 """Test evaluation of automatas."""
+import random
+import time
 import unittest
 from abc import ABC
 
 from automata.automaton import FiniteAutomaton
+from automata.re_parser import REParser
 from automata.utils import AutomataFormat, deterministic_automata_isomorphism, write_dot
 
 
@@ -318,5 +321,65 @@ class TestTransform(ABC, unittest.TestCase):
 
 
 
+    def test_exponential_subsets(self) -> None:
+        """Test the classic blow-up (a+b)*a(a+b)^k, with 2^(k+1) subsets plus the initial one."""
+        k = 8
+        automaton = REParser().create_automaton("(a+b)*.a" + ".(a+b)" * k)
+
+        transformed = automaton.to_deterministic()
+
+        self.assertEqual(len(transformed.states), 2 ** (k + 1) + 1)
+
+    def test_bisimulation(self) -> None:
+        """Test the bisimulation reduction of a union of keywords."""
+        words = ["while", "when", "where", "if", "in", "int", "for", "foreach"]
+        automaton = REParser().create_automaton("+".join(".".join(w) for w in words))
+        expected = automaton.to_minimized()
+
+        for direction in ("forward", "backward", "both"):
+            with self.subTest(direction=direction):
+                reduced = automaton.reduce_bisimulation(direction)
+
+                self.assertLess(len(reduced.states), len(automaton.states))
+                self.assertEqual(reduced.states[0].name, automaton.states[0].name)
+                self.assertIsNotNone(deterministic_automata_isomorphism(
+                    expected,
+                    reduced.to_minimized(),
+                ))
+
+        transformed = automaton.to_deterministic(reduce=True)
+        self.assertIsNotNone(deterministic_automata_isomorphism(
+            expected,
+            transformed.to_minimized(),
+        ))
+
+        with self.assertRaises(ValueError):
+            automaton.reduce_bisimulation("sideways")
+
+    def test_bisimulation_speed(self) -> None:
+        """Test that the reduction makes the determinization of keywords cheaper."""
+        rng = random.Random(0)
+        words = [
+            "".join(rng.choice("abcdefghij") for _ in range(rng.randint(3, 8)))
+            for _ in range(150)
+        ]
+        automaton = REParser().create_automaton("+".join(".".join(w) for w in words))
+
+        start = time.perf_counter()
+        plain = automaton.to_deterministic()
+        plain_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reduced = automaton.to_deterministic(reduce=True)
+        reduced_time = time.perf_counter() - start
+
+        self.assertLess(reduced_time, plain_time)
+        self.assertLessEqual(len(reduced.states), len(plain.states))
+        self.assertIsNotNone(deterministic_automata_isomorphism(
+            plain.to_minimized(),
+            reduced.to_minimized(),
+        ))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
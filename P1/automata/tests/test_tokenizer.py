@@ -0,0 +1,127 @@
+"""Test the maximal munch tokenizers."""
+import unittest
+
+from automata.tokenizer import Token, TokenizeError, Tokenizer
+
+
+class TestTokenizer(unittest.TestCase):
+    """Tests for the tokenizers."""
+
+    rules = [
+        ("f", "i.f"),
+        ("i", "[a-z].[a-z0-9]*"),
+        ("n", "[0-9].[0-9]*"),
+        ("+", "[+]"),
+        ("*", "[*]"),
+        ("(", "[(]"),
+        (")", "[)]"),
+        (" ", "[ \\u0009\\u000a].[ \\u0009\\u000a]*"),
+    ]
+
+    def setUp(self) -> None:
+        self.tokenizer = Tokenizer(self.rules, ignore={" "})
+
+    def test_tokenize(self) -> None:
+        """Test the longest match and the priority of the rules."""
+        self.assertEqual(
+            list(self.tokenizer.tokenize("if iff x1+23")),
+            [
+                Token("f", "if", 0),
+                Token("i", "iff", 3),
+                Token("i", "x1", 7),
+                Token("+", "+", 9),
+                Token("n", "23", 10),
+            ],
+        )
+        self.assertEqual(list(self.tokenizer.tokenize("")), [])
+
+    def test_chunks(self) -> None:
+        """Test that tokens may be split between chunks."""
+        text = "(ab1 + 42)*\tif  xyz\n"
+        expected = list(self.tokenizer.tokenize(text))
+
+        for size in (1, 2, 3, 7):
+            with self.subTest(size=size):
+                chunks = (text[i:i + size] for i in range(0, len(text), size))
+                self.assertEqual(list(self.tokenizer.tokenize(chunks)), expected)
+
+    def test_error(self) -> None:
+        """Test the position of text that no rule matches."""
+        tokens = self.tokenizer.tokenize(["a+", "b - c"])
+
+        # Los tokens anteriores al error se devuelven antes de fallar
+        self.assertEqual(next(tokens), Token("i", "a", 0))
+        self.assertEqual(next(tokens), Token("+", "+", 1))
+        self.assertEqual(next(tokens), Token("i", "b", 2))
+
+        with self.assertRaises(TokenizeError) as context:
+            next(tokens)
+        self.assertEqual(context.exception.position, 4)
+
+    def test_empty_matches(self) -> None:
+        """Test that rules that accept the empty string don't make empty tokens."""
+        tokenizer = Tokenizer([("a", "a*"), ("b", "b")])
+
+        self.assertEqual(
+            [(t.name, t.text) for t in tokenizer.tokenize("aaba")],
+            [("a", "aa"), ("b", "b"), ("a", "a")],
+        )
+        with self.assertRaises(TokenizeError):
+            list(tokenizer.tokenize("c"))
+
+    def test_symbols(self) -> None:
+        """Test the terminal symbols given to a parser."""
+        self.assertEqual(
+            "".join(self.tokenizer.symbols("(x + 1) * y")),
+            "(i+n)*i$",
+        )
+        self.assertEqual(list(self.tokenizer.symbols("if", end=None)), ["f"])
+
+        tokenizer = Tokenizer([("id", "[a-z]")])
+        with self.assertRaises(ValueError):
+            tokenizer.symbols("x")
+        with self.assertRaises(ValueError):
+            self.tokenizer.symbols("x", end="end")
+
+    def test_linear(self) -> None:
+        """Test that the lookahead of a token is not read again."""
+        tokenizer = Tokenizer([("a", "a"), ("b", "a*.b")])
+        compiled = tokenizer.automaton.automaton
+        calls = 0
+
+        def step(state: int, symbol: str) -> int:
+            nonlocal calls
+            calls += 1
+            return type(compiled).step(compiled, state, symbol)
+
+        compiled.step = step  # type: ignore[method-assign]
+        text = "a" * 5000
+
+        tokens = list(tokenizer.tokenize(text))
+        self.assertEqual(len(tokens), len(text))
+        self.assertEqual(tokens[-1], Token("a", "a", len(text) - 1))
+        self.assertLessEqual(calls, compiled.n_states * len(text))
+
+        self.assertEqual(
+            list(tokenizer.tokenize(["a" * 10, "aab", "a"])),
+            [Token("b", "a" * 12 + "b", 0), Token("a", "a", 13)],
+        )
+
+    def test_max_lookahead(self) -> None:
+        """Test the bounded lookahead."""
+        tokenizer = Tokenizer([("a", "a"), ("b", "a*.b")], max_lookahead=3)
+        self.assertEqual(
+            list(tokenizer.tokenize("aab" + "a" * 5)),
+            [Token("b", "aab", 0)] + [Token("a", "a", i) for i in range(3, 8)],
+        )
+        # Tras el límite se devuelve el token más largo encontrado
+        self.assertEqual(
+            list(tokenizer.tokenize("aaab")),
+            [Token("a", "a", 0), Token("b", "aab", 1)],
+        )
+        with self.assertRaises(ValueError):
+            Tokenizer([("a", "a")], max_lookahead=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
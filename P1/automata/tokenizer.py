@@ -0,0 +1,230 @@
+"""Maximal munch tokenizers built from a deterministic automaton."""
+from typing import Collection, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from automata.multipattern import MultiPatternDFA
+
+Source = Union[str, Iterable[str]]
+
+
+class TokenizeError(Exception):
+    """Exception for text that no rule matches."""
+
+    def __init__(self, position: int) -> None:
+        super().__init__(f"No token matches at position {position}")
+        self.position = position
+
+
+class Token(NamedTuple):
+    """Token found in a text."""
+
+    name: str
+    text: str
+    start: int
+
+
+class Tokenizer():
+    """
+    Tokenizer with longest match (maximal munch) semantics.
+
+    All the rules are compiled into a single minimal deterministic automaton
+    (see ``MultiPatternDFA``) whose states are tagged with the rules they
+    accept. Each token runs the automaton from its start until it dies, and
+    the longest accepted prefix is the token. If several rules accept it,
+    the first one wins (so keywords go before identifiers).
+
+    Args:
+        rules: Pairs ``(name, regex)``, in order of priority. The regexes
+            are in Kleene notation.
+        ignore: Names of the tokens that are not returned (like blanks).
+        construction: Construction used by ``REParser.create_automaton``.
+        max_lookahead: Maximum number of symbols read from the start of a
+            token (``None`` for no limit), see ``tokenize``.
+
+    """
+
+    rules: List[Tuple[str, str]]
+    ignore: Collection[str]
+    max_lookahead: Optional[int]
+    automaton: MultiPatternDFA
+
+    def __init__(
+        self,
+        rules: Sequence[Tuple[str, str]],
+        ignore: Collection[str] = (),
+        construction: str = "thompson",
+        max_lookahead: Optional[int] = None,
+    ) -> None:
+        if max_lookahead is not None and max_lookahead < 1:
+            raise ValueError("The lookahead must be positive")
+
+        self.rules = list(rules)
+        self.ignore = frozenset(ignore)
+        self.max_lookahead = max_lookahead
+        self.automaton = MultiPatternDFA(
+            [regex for _, regex in self.rules],
+            construction=construction,
+        )
+
+        # Regla preferida en cada estado (None si no acepta ninguna)
+        self._names: List[Optional[str]] = [
+            self.rules[tags[0]][0] if tags else None
+            for tags in self.automaton.tags
+        ]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"rules={self.rules!r}, "
+            f"ignore={sorted(self.ignore)!r})"
+        )
+
+    def tokenize(self, source: Source) -> Iterator[Token]:
+        """
+        Split a text into tokens, lazily.
+
+        The longest match needs to look ahead until the automaton dies (the
+        automaton has no states that can't reach a rule, so it dies as soon
+        as no longer token is possible). The pairs (state, position) seen
+        after the last accepted prefix can't reach a rule either, so they
+        are remembered, and later runs stop as soon as they reach one of
+        them. Each pair is visited once, so the time is linear in the
+        length of the text (times the number of states).
+
+        The text can also be given as an iterable of chunks (for example, a
+        file opened in text mode). Only the text from the start of the
+        current token to the end of the lookahead is kept (and the pairs of
+        those positions), and chunks are read when the lookahead reaches the
+        end of the buffer, so tokens may be split between chunks. With
+        ``max_lookahead`` the lookahead (and so the memory) is bounded: when
+        it's reached, the longest token found so far is returned.
+
+        Args:
+            source: Text, or iterable of chunks of text.
+
+        Returns:
+            Iterator of the tokens, without the ignored ones.
+
+        Raises:
+            TokenizeError: if no rule matches a non empty prefix of the rest
+                of the text.
+
+        """
+        chunks = iter((source,)) if isinstance(source, str) else iter(source)
+        compiled = self.automaton.automaton
+        step = compiled.step
+        initial = compiled.initial
+        names = self._names
+        ignore = self.ignore
+        max_lookahead = self.max_lookahead
+
+        # Estados que ya se sabe que no llegan a ninguna regla, por posición
+        failed: Dict[int, Set[int]] = dict()
+
+        buffer = ""
+        start = 0       # Inicio del token actual en buffer
+        offset = 0      # Posición de buffer[0] en el texto
+        exhausted = False
+
+        while True:
+            state = initial
+            i = start
+            length = 0
+            name = None
+            # Pares (estado, posición) tras el último prefijo aceptado
+            trail: List[Tuple[int, int]] = list()
+            complete = True
+
+            while True:
+                if i == len(buffer):
+                    if exhausted:
+                        break
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+
+                    # Descartamos los tokens ya devueltos
+                    offset += start
+                    i -= start
+                    buffer = buffer[start:] + chunk
+                    start = 0
+                    continue
+
+                if max_lookahead is not None and i - start == max_lookahead:
+                    complete = False
+                    break
+
+                state = step(state, buffer[i])
+                if state < 0:
+                    break
+
+                i += 1
+                position = offset + i
+                if state in failed.get(position, ()):
+                    break
+
+                if names[state] is not None:
+                    length = i - start
+                    name = names[state]
+                    trail.clear()
+                else:
+                    trail.append((state, position))
+
+            # Si la búsqueda se ha cortado no se sabe si esos pares fallan
+            if complete:
+                for state, position in trail:
+                    failed.setdefault(position, set()).add(state)
+
+            if start == len(buffer):
+                return
+
+            if name is None:
+                raise TokenizeError(offset + start)
+
+            if name not in ignore:
+                yield Token(name, buffer[start:start + length], offset + start)
+
+            # Las posiciones del token ya no se vuelven a visitar
+            for i in range(start + 1, start + length + 1):
+                failed.pop(offset + i, None)
+            start += length
+
+    def symbols(self, source: Source, end: Optional[str] = "$") -> Iterator[str]:
+        """
+        Return the names of the tokens of a text, lazily.
+
+        They can be given directly as the terminal symbols of a parser (like
+        ``LL1Table.analyze``), so the text is tokenized while it's parsed.
+        The parsers read their input as single characters, so the names of
+        the rules that are not ignored (and ``end``) must have length 1.
+
+        Args:
+            source: Text, or iterable of chunks of text.
+            end: Symbol added after the last token (``None`` for nothing).
+
+        Returns:
+            Iterator of the names of the tokens.
+
+        Raises:
+            ValueError: if a name that can be returned is not a single
+                character.
+
+        """
+        names = [name for name, _ in self.rules if name not in self.ignore]
+        if end is not None:
+            names.append(end)
+
+        for name in names:
+            if len(name) != 1:
+                raise ValueError(
+                    f"The symbol {name!r} is not a single character",
+                )
+
+        return self._symbols(source, end)
+
+    def _symbols(self, source: Source, end: Optional[str]) -> Iterator[str]:
+        for token in self.tokenize(source):
+            yield token.name
+
+        if end is not None:
+            yield end
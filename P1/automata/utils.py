@@ -1,4 +1,5 @@
 """General utilities to work with automatas."""
+import io
 import re
 from collections import defaultdict, deque
 from typing_extensions import Final
@@ -8,10 +9,13 @@ import automata.automaton as aut
 from typing import (
     DefaultDict,
     Dict,
+    Iterable,
     Mapping,
     Optional,
     Set,
     List,
+    TextIO,
+    Tuple,
 )
 
 class FormatParseError(Exception):
@@ -25,22 +29,50 @@ class AutomataFormat():
     re_empty: Final = re.compile(r"\s*")
     re_automaton: Final = re.compile(r"\s*Automaton:\s*")
     re_state: Final = re.compile(r"\s*(\w+)(?:\s*(final))?\s*")
-    re_transition: Final = re.compile(r"\s*(\w+)\s*-(\S)?->\s*(\w+)\s*")
+    # El símbolo es un carácter o una clase de símbolos entre corchetes ([a-z])
+    re_transition: Final = re.compile(
+        r"\s*(\w+)\s*-(\[(?:\\.|[^\\\]])+\]|\S)?->\s*(\w+)\s*",
+    )
 
     @classmethod
     def read(cls, description: str) -> aut.FiniteAutomaton:
         """Read the automaton description in our custom format."""
-        splitted_lines = description.splitlines()
+        return cls.read_stream(io.StringIO(description))
+
+    @classmethod
+    def read_stream(cls, file: Iterable[str]) -> aut.FiniteAutomaton:
+        """
+        Read the automaton description in our custom format from an open
+        text file (or any iterable of lines), one line at a time.
+
+        The transitions of every state are appended to a list and the
+        repeated ones are removed once, at the end, so the time is linear
+        in the size of the description.
+        """
         prelude_read = False
 
         states: Dict[str, aut.State] = {}
-        transitions: Set[aut.Transition] = set()
+        # Pares (símbolo, destino) de cada estado
+        transitions: Dict[str, List[Tuple[Optional[aut.Symbol], str]]] = {}
 
-        for line in splitted_lines:
-            if cls.re_comment.fullmatch(line) or cls.re_empty.fullmatch(line):
+        for line in file:
+            # Solo las transiciones tienen "->": las probamos primero y con una sola expresión
+            if prelude_read and "->" in line:
+                match = cls.re_transition.fullmatch(line)
+                if match:
+                    state1_name, symbol, state2_name = match.groups()
+                    if symbol is not None and len(symbol) > 1:
+                        symbol = aut.SymbolRanges.parse(symbol)
+                    state_transitions = transitions.get(state1_name)
+                    if state_transitions is None:
+                        state_transitions = transitions[state1_name] = []
+                    state_transitions.append((symbol, state2_name))
+                    continue
+
+            elif cls.re_comment.fullmatch(line) or cls.re_empty.fullmatch(line):
                 continue
 
-            if prelude_read:
+            elif prelude_read:
                 match = cls.re_state.fullmatch(line)
                 if match:
                     state_name, final_text = match.groups()
@@ -50,40 +82,53 @@ class AutomataFormat():
                     )
                     continue
 
-                match = cls.re_transition.fullmatch(line)
-                if match:
-                    state1_name, symbol, state2_name = match.groups()
-                    states[state1_name].add_transitions([aut.Transition(symbol, state2_name)])
-                    continue
-
             elif cls.re_automaton.fullmatch(line):
                 prelude_read = True
                 continue
 
-            raise FormatParseError(f"Invalid line: {line}")
+            raise FormatParseError(f"Invalid line: {line.rstrip()}")
+
+        for state_name, state_transitions in transitions.items():
+            state = states.get(state_name)
+            if state is None:
+                raise FormatParseError(f"Undefined state: {state_name}")
+
+            # Eliminamos las transiciones repetidas de una vez
+            state.transitions = [
+                aut.Transition(symbol, target)
+                for symbol, target in dict.fromkeys(state_transitions)
+            ]
 
         return aut.FiniteAutomaton(states=list(states.values()))
 
     @classmethod
     def write(cls, automaton: aut.FiniteAutomaton) -> str:
         """Write the automaton description in our custom format."""
-        return (
-            "Automaton:\n"
-            + "".join(
-                f"\t{s.name}{' final' if s.is_final else ''}\n"
-                for s in automaton.states
-            )
-            + "\n"
-            + "".join(
+        output = io.StringIO()
+        cls.write_stream(automaton, output)
+        return output.getvalue()
+
+    @classmethod
+    def write_stream(cls, automaton: aut.FiniteAutomaton, file: TextIO) -> None:
+        """
+        Write the automaton description in our custom format to an open
+        text file, one state (with its transitions) at a time, so the full
+        description is never built in memory.
+        """
+        file.write("Automaton:\n")
+        for s in automaton.states:
+            file.write(f"\t{s.name}{' final' if s.is_final else ''}\n")
+
+        file.write("\n")
+        for s in automaton.states:
+            file.write("".join(
                 f"\t{s.name} "
                 f"-{t.symbol if t.symbol is not None else ''}->"
                 f" {t.state}\n"
-                for s in automaton.states for t in s.transitions
-            )
-        )
+                for t in s.transitions
+            ))
 
 
-    
 def write_dot(automaton: aut.FiniteAutomaton) -> str:
     """
     Write a dot representation of the automaton.
@@ -100,8 +145,8 @@ def write_dot(automaton: aut.FiniteAutomaton) -> str:
         False: "circle",
     }
 
-    def symbol_repr(symbol: Optional[str]) -> str:
-        return "λ" if symbol is None else symbol
+    def symbol_repr(symbol: Optional[aut.Symbol]) -> str:
+        return "λ" if symbol is None else str(symbol)
 
     return (
         "digraph {\n"
@@ -143,11 +188,13 @@ def is_deterministic(automaton: aut.FiniteAutomaton) -> bool:
             if t.symbol is None:
                 return False
 
-            origin = (s, t.symbol)
-            if origin in checked_origins:
-                return False
+            # Con rangos, comprobamos que no se solapan en ningún símbolo
+            for symbol in automaton._atoms_of(t.symbol):
+                origin = (s, symbol)
+                if origin in checked_origins:
+                    return False
 
-            checked_origins.add(origin)
+                checked_origins.add(origin)
 
     return True
 
@@ -209,4 +256,92 @@ def deterministic_automata_isomorphism(
 
                 pending.appendleft((final1, final2))
 
-    return equiv_map
\ No newline at end of file
+    return equiv_map
+
+
+def find_distinguishing_string(
+    automaton1: aut.FiniteAutomaton,
+    automaton2: aut.FiniteAutomaton,
+) -> Optional[str]:
+    """
+    Check if two automata accept the same language (Hopcroft-Karp).
+
+    Both automata are determinized lazily, at the same time, as sets of
+    states (bitmasks). A union-find joins the deterministic states assumed
+    equivalent, so a pair is only explored if its states aren't already in
+    the same class, and the search stops at the first pair with different
+    finality. Neither automaton is minimized.
+
+    Args:
+        automaton1: First automaton (it can have lambdas).
+        automaton2: Second automaton (it can have lambdas).
+
+    Returns:
+        ``None`` if both languages are equal. Otherwise, a string accepted
+        by only one of the automata (the search is breadth first, so it's
+        usually a short one).
+
+    """
+    from automata.automaton_evaluator import BitsetAutomatonEvaluator
+
+    alphabet = aut._joint_alphabet([automaton1, automaton2])
+    evaluators = (
+        BitsetAutomatonEvaluator(automaton1),
+        BitsetAutomatonEvaluator(automaton2),
+    )
+    moves: Dict[Tuple[int, int, str], int] = dict()
+
+    def move(side: int, states: int, symbol: str) -> int:
+        reached = moves.get((side, states, symbol))
+        if reached is None:
+            evaluator = evaluators[side]
+            evaluator.current_states = states
+            evaluator.process_symbol(symbol)
+            reached = moves[(side, states, symbol)] = evaluator.current_states
+        return reached
+
+    # Union-find sobre los estados deterministas (lado, conjunto)
+    parent: Dict[Tuple[int, int], Tuple[int, int]] = dict()
+
+    def find(node: Tuple[int, int]) -> Tuple[int, int]:
+        root = node
+        while parent.get(root, root) != root:
+            root = parent[root]
+        # Compresión de caminos
+        while node != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    # Cada par guarda el par anterior y el símbolo para reconstruir la cadena
+    initial = (evaluators[0].current_states, evaluators[1].current_states)
+    pairs: List[Tuple[int, int]] = [initial]
+    previous: List[Tuple[int, str]] = [(-1, "")]
+    parent[(0, initial[0])] = (1, initial[1])
+
+    i = 0
+    while i < len(pairs):
+        states1, states2 = pairs[i]
+        final1 = (states1 & evaluators[0].final_mask) != 0
+        final2 = (states2 & evaluators[1].final_mask) != 0
+
+        if final1 != final2:
+            symbols: List[str] = list()
+            while i > 0:
+                i, symbol = previous[i]
+                symbols.append(symbol)
+            return "".join(reversed(symbols))
+
+        for symbol in alphabet:
+            next_states1 = move(0, states1, symbol)
+            next_states2 = move(1, states2, symbol)
+            root1 = find((0, next_states1))
+            root2 = find((1, next_states2))
+
+            if root1 != root2:
+                parent[root1] = root2
+                pairs.append((next_states1, next_states2))
+                previous.append((i, symbol))
+
+        i += 1
+
+    return None
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import copy
-from typing import AbstractSet, Collection, Optional, Dict, List, Optional
+from typing import AbstractSet, Collection, Optional, Dict, Iterable, List, Optional
 
 
 class RepeatedCellError(Exception):
@@ -394,12 +394,14 @@ class LL1Table:
         else:
             self.cells[non_terminal][terminal] = cell_body
 
-    def analyze(self, input_string: str, start: str) -> ParseTree:
+    def analyze(self, input_string: Iterable[str], start: str) -> ParseTree:
         """
         Method to analyze a string using the LL(1) table.
 
         Args:
-            input_string: string to analyze.
+            input_string: string to analyze. Any iterable of terminal symbols
+                (like the names of the tokens of a tokenizer) can be used, and
+                it's consumed lazily, one symbol at a time.
             start: initial symbol.
 
         Returns:
@@ -417,10 +419,13 @@ class LL1Table:
         stack.append("$")
         stack.append(start)
         node_stack.append(root)
-        index = 0
+
+        # Solo se lee el siguiente símbolo (None si la entrada se ha acabado)
+        symbols = iter(input_string)
+        lookahead = next(symbols, None)
 
         while len(stack) != 0:
-            if index == len(input_string):
+            if lookahead is None:
                 raise SyntaxError()
 
             elem = stack.pop()
@@ -429,7 +434,7 @@ class LL1Table:
 
             if elem in self.non_terminals:
                 row = self.cells[elem]
-                n_sym = row.get(input_string[index])
+                n_sym = row.get(lookahead)
                 if n_sym != None:
                     # Si la regla es λ, no hay que añadir nada al stack
                     if n_sym != "":
@@ -450,12 +455,12 @@ class LL1Table:
                     raise SyntaxError()
 
             elif elem in self.terminals:
-                if elem == input_string[index]:
-                    index += 1
+                if elem == lookahead:
+                    lookahead = next(symbols, None)
                 else:
                     raise SyntaxError()
 
-        if index == len(input_string):
+        if lookahead is None:
             return root
 
         raise SyntaxError()
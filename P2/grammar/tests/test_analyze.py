@@ -135,6 +135,49 @@ class TestAnalyze(unittest.TestCase):
         
         self._check_parse_tree(table, "i*i$", "E", tree)
 
+    def test_lazy_input(self) -> None:
+        """Test for syntax analysis of an iterator of terminals."""
+        terminals = {"(", ")", "i", "+", "*", "$"}
+        non_terminals = {"E", "T", "X", "Y"}
+        cells = [('E', '(', 'TX'),
+                 ('E', 'i', 'TX'),
+                 ('T', '(', '(E)'),
+                 ('T', 'i', 'iY'),
+                 ('X', '+', '+E'),
+                 ('X', ')', ''),
+                 ('X', '$', ''),
+                 ('Y', '*', '*T'),
+                 ('Y', '+', ''),
+                 ('Y', ')', ''),
+                 ('Y', '$', '')]
+        table = LL1Table(non_terminals, terminals)
+        for (nt, t, body) in cells:
+            table.add_cell(nt, t, body)
+
+        read = []
+
+        def symbols(string):
+            for symbol in string:
+                read.append(symbol)
+                yield symbol
+
+        self.assertEqual(
+            table.analyze(symbols("i*i$"), "E"),
+            table.analyze("i*i$", "E"),
+        )
+        self.assertTrue(table.analyze(iter(["(", "i", "+", "i", ")", "$"]), "E") is not None)
+
+        # La entrada se lee de forma perezosa: el error se detecta sin leer el resto
+        read.clear()
+        with self.assertRaises(SyntaxError):
+            table.analyze(symbols("i)i+i+i$"), "E")
+        self.assertEqual(read, ["i", ")"])
+
+        with self.assertRaises(SyntaxError):
+            table.analyze(symbols("i*i"), "E")
+        with self.assertRaises(SyntaxError):
+            table.analyze(symbols("i*i$i"), "E")
+
 if __name__ == '__main__':
     unittest.main()
 